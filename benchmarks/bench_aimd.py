@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru limitele adaptive pe host (core/concurrency.py).
+
+Un server local cu doua profiluri:
+
+    cdn      latenta fixa, indiferent cate request-uri sunt simultane
+    origin   --capacity workeri: request-urile peste capacitate asteapta
+             (latenta creste), iar peste 2x capacitate primesc 429
+
+Fiecare pagina are link-uri spre alte pagini si doua imagini; crawler-ul
+(motor threads) si downloader-ul (StagedPipeline) lucreaza simultan pe
+acelasi host. Se compara limita fixa per_host_limit cu AIMDController
+(pornit de la aceeasi valoare): durata, raspunsuri 429, erori si traseul
+limitei pana la convergenta.
+
+Utilizare:
+    python benchmarks/bench_aimd.py --profile cdn origin --pages 300
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.concurrency import AIMDController  # noqa: E402
+from core.crawler import DomainCrawler  # noqa: E402
+from core.downloader import ResourceDownloader  # noqa: E402
+from core.pipeline import StagedPipeline  # noqa: E402
+from core.transport import PooledSession  # noqa: E402
+from utils.pathmap import PathMapper  # noqa: E402
+
+
+class _Origin:
+    def __init__(self, profile, latency, capacity):
+        self.profile = profile
+        self.latency = latency
+        self.capacity = threading.BoundedSemaphore(capacity)
+        self.max_waiting = 2 * capacity
+        self.lock = threading.Lock()
+        self.active = 0
+        self.rejected = 0
+        self.served = 0
+
+    def serve(self):
+        """True daca request-ul e servit, False pentru 429"""
+        if self.profile == "cdn":
+            time.sleep(self.latency)
+            return True
+        with self.lock:
+            if self.active >= self.max_waiting:
+                self.rejected += 1
+                return False
+            self.active += 1
+        try:
+            with self.capacity:
+                time.sleep(self.latency)
+        finally:
+            with self.lock:
+                self.active -= 1
+        return True
+
+
+def _make_handler(origin, n_pages):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if not origin.serve():
+                return self._send(429, b"", "text/plain")
+            with origin.lock:
+                origin.served += 1
+            path = self.path.split("?")[0]
+            if path.endswith(".png"):
+                return self._send(200, b"\x89PNG" + b"\0" * 2048, "image/png")
+            i = int(path.strip("/").lstrip("p") or 0)
+            links = "".join(f'<a href="/p{(i * 7 + k) % n_pages}">x</a>' for k in range(1, 6))
+            imgs = f'<img src="/img/{i}a.png"><img src="/img/{i}b.png">'
+            self._send(200, f"<html><body>{links}{imgs}</body></html>".encode(), "text/html")
+
+        def _send(self, status, body, ctype):
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _trace(history):
+    """Traseul limitei, comprimat: 4 -> 5 -> ... (ultimele 24 de schimbari)"""
+    limits = [limit for _t, limit, _reason in history]
+    shown = limits if len(limits) <= 24 else ["..."] + limits[-24:]
+    return " ".join(str(x) for x in shown)
+
+
+def run(profile, adaptive, args):
+    origin = _Origin(profile, args.latency_ms / 1000.0, args.capacity)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(origin, args.pages))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_port}"
+
+    controller = AIMDController(initial=args.per_host, max_limit=args.max) if adaptive else None
+    session = PooledSession(64, controller.max_limit if controller else args.per_host, retries=0)
+    with tempfile.TemporaryDirectory() as out:
+        downloader = ResourceDownloader(
+            out, PathMapper(out), {"images": True}, session=session, controller=controller,
+        )
+        pipeline = StagedPipeline(lambda url, html: None, downloader.download_one, download_workers=32)
+        pipeline.start()
+        crawler = DomainCrawler(
+            f"http://{host}/", max_depth=100, max_pages=args.pages, engine="threads",
+            concurrency=32, per_host_limit=args.per_host, session=session,
+            host_rate=10000.0, respect_robots=False, seed=False,
+            page_sink=pipeline.page_sink, resource_sink=pipeline.resource_sink,
+            controller=controller,
+        )
+        t0 = time.perf_counter()
+        crawler.crawl()
+        pipeline.finish()
+        elapsed = time.perf_counter() - t0
+    server.shutdown()
+    session.close()
+
+    done = crawler.pages_processed + downloader.downloaded_count
+    name = "adaptiv" if adaptive else f"fix {args.per_host}"
+    print(
+        f"  {name:<8} {elapsed:6.2f}s  {done / elapsed:7.1f} raspunsuri/s | servite {origin.served}, "
+        f"429: {origin.rejected}, erori pagini {len(crawler.errors)} / resurse {downloader.failed_count}"
+    )
+    if controller is not None:
+        st = controller.stats()[host]
+        print(
+            f"           limita finala {st['limit']}, maxim {st['peak']}, {st['increases']} cresteri, "
+            f"{st['decreases']} scaderi, latenta {st['latency_ms']:.0f} ms (baza {st['base_latency_ms']:.0f} ms)"
+        )
+        print(f"           traseu: {_trace(controller.history(host))}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--profile", nargs="+", default=["cdn", "origin"])
+    ap.add_argument("--pages", type=int, default=300)
+    ap.add_argument("--latency-ms", type=float, default=30.0)
+    ap.add_argument("--capacity", type=int, default=3, help="workeri ai profilului origin")
+    ap.add_argument("--per-host", type=int, default=4)
+    ap.add_argument("--max", type=int, default=32)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    for profile in args.profile:
+        print(f"profil {profile}: {args.pages} pagini + {2 * args.pages} imagini, latenta {args.latency_ms:.0f} ms"
+              + (f", capacitate {args.capacity}" if profile == "origin" else ""))
+        run(profile, False, args)
+        run(profile, True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru ordinea frontierei: BFS vs PriorityFrontier cu buget fix.
+
+Porneste un server local cu un site sintetic de tip magazin + blog +
+documentatie (navigatie pe fiecare pagina, produse legate intre ele, sute
+de articole, paginare, tag-uri, autori, arhive, variante ?variant= si
+link-uri ?replytocom=). PageRank-ul este calculat pe tot graful site-ului;
+"pagini de continut" sunt cele care nu sunt liste sau variante.
+
+Pentru fiecare ordine, crawl-ul se opreste la --budget pagini si se
+raporteaza:
+    * cat din masa PageRank a paginilor de continut a fost descarcata;
+    * cate dintre primele --top pagini de continut (dupa PageRank) au fost
+      descarcate;
+    * ce parte din buget a mers pe liste / variante.
+
+Utilizare:
+    python benchmarks/bench_crawl_order.py --budget 100 200 400
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawler import DomainCrawler  # noqa: E402
+
+N_PRODUCTS = 40
+N_DOCS = (8, 6)        # sectiuni x subiecte
+N_POSTS = 500
+N_TAGS = 40
+N_AUTHORS = 5
+YEARS = range(2020, 2025)
+PER_PAGE = 10
+
+NAV = ["/", "/about", "/contact", "/products", "/blog", "/docs"]
+_LISTING = re.compile(r"/tag/|/author/|/page/|/archive/|[?&](variant|replytocom)=")
+
+
+def _post(i):
+    return f"/blog/{YEARS[i % len(YEARS)]}/post-{i}"
+
+
+def _pages(prefix, items):
+    """Lista paginata: (link-uri pe pagina n, link spre pagina n+1)"""
+    pages = []
+    for n in range(0, len(items), PER_PAGE):
+        page = n // PER_PAGE + 1
+        url = prefix if page == 1 else f"{prefix}/page/{page}"
+        nxt = f"{prefix}/page/{page + 1}" if n + PER_PAGE < len(items) else None
+        pages.append((url, items[n:n + PER_PAGE], nxt))
+    return pages
+
+
+def _build_site():
+    """path -> link-uri (path-uri locale)"""
+    footer = NAV + [f"/blog/archive/{y}" for y in YEARS]
+    site = {}
+    posts = [_post(i) for i in range(N_POSTS)]
+
+    site["/"] = footer + posts[:5] + [f"/tag/t{t}" for t in range(N_TAGS)] + \
+        [f"/products/p{i}" for i in range(6)]
+    site["/about"] = footer + ["/contact"]
+    site["/contact"] = footer
+    site["/products"] = footer + [f"/products/p{i}" for i in range(N_PRODUCTS)]
+    for i in range(N_PRODUCTS):
+        related = [f"/products/p{(i * 7 + k) % N_PRODUCTS}" for k in range(1, 5)]
+        variants = [f"/products/p{i}?variant={v}" for v in range(3)]
+        site[f"/products/p{i}"] = footer + ["/products"] + related + variants
+        for variant in variants:
+            site[variant] = footer + [f"/products/p{i}"]
+
+    sections, topics = N_DOCS
+    sidebar = ["/docs"] + [f"/docs/s{s}" for s in range(sections)]
+    site["/docs"] = footer + sidebar
+    for s in range(sections):
+        site[f"/docs/s{s}"] = footer + sidebar + [f"/docs/s{s}/t{t}" for t in range(topics)]
+        for t in range(topics):
+            site[f"/docs/s{s}/t{t}"] = footer + sidebar + [f"/docs/s{s}/t{(t + 1) % topics}"]
+
+    listings = [("/blog", posts[::-1])]
+    listings += [(f"/tag/t{t}", [p for i, p in enumerate(posts) if t in (i % N_TAGS, (i * 3) % N_TAGS)])
+                 for t in range(N_TAGS)]
+    listings += [(f"/author/a{a}", posts[a::N_AUTHORS]) for a in range(N_AUTHORS)]
+    listings += [(f"/blog/archive/{y}", [p for p in posts if f"/{y}/" in p]) for y in YEARS]
+    for prefix, items in listings:
+        for url, links, nxt in _pages(prefix, items):
+            site[url] = footer + links + ([nxt] if nxt else [])
+
+    for i, post in enumerate(posts):
+        links = footer + [f"/tag/t{i % N_TAGS}", f"/tag/t{(i * 3) % N_TAGS}", f"/author/a{i % N_AUTHORS}"]
+        links += [_post((i + 1) % N_POSTS), _post((i - 1) % N_POSTS)]
+        links += [f"{post}?replytocom={c}" for c in range(3)]
+        site[post] = links
+        for c in range(3):
+            site[f"{post}?replytocom={c}"] = footer + [post]
+    return site
+
+
+def _reachable(site):
+    seen, queue = {"/"}, deque(["/"])
+    while queue:
+        for link in site[queue.popleft()]:
+            if link not in seen:
+                seen.add(link)
+                queue.append(link)
+    return seen
+
+
+def _pagerank(site, nodes, damping=0.85, iterations=60):
+    rank = {n: 1.0 / len(nodes) for n in nodes}
+    out = {n: sorted(set(site[n])) for n in nodes}
+    for _ in range(iterations):
+        nxt = {n: (1 - damping) / len(nodes) for n in nodes}
+        for n, links in out.items():
+            share = damping * rank[n] / len(links)
+            for link in links:
+                nxt[link] += share
+        rank = nxt
+    return rank
+
+
+def _make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            links = site.get(self.path)
+            if links is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = ("<html><body>" + "".join(f'<a href="{link}">l</a>' for link in links)
+                    + "</body></html>").encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(origin, order, budget, engine, content_rank, top):
+    crawler = DomainCrawler(
+        origin + "/", max_depth=100, max_pages=budget, engine=engine, concurrency=8,
+        host_rate=1000.0, respect_robots=False, seed=False, order=order,
+    )
+    t0 = time.perf_counter()
+    crawler.crawl()
+    elapsed = time.perf_counter() - t0
+    fetched = set()
+    for url in crawler.page_content:
+        path = url[len(origin):] or "/"
+        fetched.add(path)
+    crawler.close()
+
+    total = sum(content_rank.values())
+    mass = sum(r for p, r in content_rank.items() if p in fetched) / total
+    best = sorted(content_rank, key=content_rank.get, reverse=True)[:top]
+    listing = sum(1 for p in fetched if _LISTING.search(p))
+    print(
+        f"  {order:<8} {len(fetched):>4} pagini in {elapsed:5.2f}s | PageRank continut "
+        f"{100 * mass:5.1f}% | top {top}: {sum(p in fetched for p in best):>3} | "
+        f"liste/variante {100.0 * listing / max(1, len(fetched)):4.1f}% din buget"
+    )
+    return mass
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--budget", type=int, nargs="+", default=[100, 200, 400])
+    ap.add_argument("--top", type=int, default=50)
+    ap.add_argument("--engine", default="async")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    site = _build_site()
+    nodes = _reachable(site)
+    rank = _pagerank(site, nodes)
+    content_rank = {p: r for p, r in rank.items() if not _LISTING.search(p)}
+    print(f"site: {len(nodes)} pagini, {len(content_rank)} de continut; motor {args.engine}")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(site))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for budget in args.budget:
+            print(f"buget {budget} pagini")
+            bfs = run(origin, "bfs", budget, args.engine, content_rank, args.top)
+            prio = run(origin, "priority", budget, args.engine, content_rank, args.top)
+            print(f"  -> masa PageRank de continut: {prio / bfs:.2f}x fata de BFS")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
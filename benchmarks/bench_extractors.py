@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru backend-urile de extragere din core/extractor.py.
+
+Compara arborele BeautifulSoup cu tokenizer-ele fara arbore (html.parser si
+lxml) pe documente HTML mari si verifica faptul ca toate produc acelasi
+rezultat.
+
+Utilizare:
+    python benchmarks/bench_extractors.py pagina1.html https://site/pagina2 ...
+    python benchmarks/bench_extractors.py --synthetic-mb 3
+
+Fara argumente se genereaza un document sintetic de ~2 MB.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.extractor import EXTRACTOR_BACKENDS, get_extractor  # noqa: E402
+
+
+def _synthetic_html(size_mb: float) -> str:
+    """Document cu structura tipica: meniuri, carduri, imagini, stiluri inline."""
+    head = (
+        "<!doctype html><html><head><title>bench</title>"
+        '<link rel="stylesheet" href="/static/site.css">'
+        '<link rel="icon" href="/favicon.ico">'
+        "<style>.hero{background:url('/img/hero.jpg')}</style>"
+        '<script src="/static/app.js"></script></head><body>'
+    )
+    parts = [head]
+    size = len(head)
+    i = 0
+    while size < size_mb * 1024 * 1024:
+        block = (
+            f'<div class="card card-{i % 7}" data-id="{i}">'
+            f'<a href="/articles/{i}/" title="Articol {i}">Articol {i}</a>'
+            f'<img src="/img/thumb-{i}.jpg" srcset="/img/thumb-{i}@2x.jpg 2x, '
+            f'/img/thumb-{i}@3x.jpg 3x" alt="thumb {i}" loading="lazy">'
+            f'<span style="background-image:url(/img/icon-{i % 50}.png)">{i}</span>'
+            f"<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit {i}. "
+            f"Sed do eiusmod tempor incididunt ut labore et dolore magna.</p>"
+            f'<a href="https://external.example/{i}?ref=x#top">extern</a></div>\n'
+        )
+        parts.append(block)
+        size += len(block)
+        i += 1
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def _load(source: str) -> str:
+    if source.startswith(("http://", "https://")):
+        import requests
+
+        return requests.get(source, timeout=30).text
+    with open(source, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def _time(func, html: str, base_url: str, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(html, base_url)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), result
+
+
+def run(documents, repeat: int):
+    backends = [b for b in EXTRACTOR_BACKENDS if b != "auto"]
+    for name, html in documents:
+        size_mb = len(html.encode("utf-8")) / (1024 * 1024)
+        print(f"\n{name}  ({size_mb:.2f} MB)")
+        print(f"  {'backend':<12} {'median':>9} {'MB/s':>8} {'vs bs4':>8}  links/resurse")
+        reference = None
+        baseline = None
+        for backend in backends:
+            try:
+                func = get_extractor(backend)
+                elapsed, refs = _time(func, html, "https://bench.local/", repeat)
+            except (ImportError, RuntimeError) as e:
+                print(f"  {backend:<12} indisponibil ({e})")
+                continue
+            if reference is None:
+                reference, baseline = refs, elapsed
+            same = "" if refs == reference else "  REZULTAT DIFERIT!"
+            print(
+                f"  {backend:<12} {elapsed * 1000:>7.1f}ms {size_mb / elapsed:>8.1f} "
+                f"{baseline / elapsed:>7.2f}x  {len(refs.links)}/{len(refs.resources)}{same}"
+            )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*", help="fisiere HTML sau URL-uri")
+    ap.add_argument("--synthetic-mb", type=float, default=None, help="marimea documentului sintetic")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    documents = [(src, _load(src)) for src in args.sources]
+    if args.synthetic_mb or not documents:
+        mb = args.synthetic_mb or 2.0
+        documents.append((f"sintetic {mb} MB", _synthetic_html(mb)))
+    run(documents, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
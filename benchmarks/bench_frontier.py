@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru structurile de deduplicare din core/frontier.py.
+
+Masoara memoria (tracemalloc) si viteza de inserare pentru N URL-uri
+realiste, comparand set() de string-uri cu FingerprintSet si BloomFilter.
+Cu --crawl-pages simuleaza un crawl (pop, vizitat, ~10 link-uri pe pagina,
+majoritatea duplicate) si compara starea in memorie cu SQLiteCrawlStore.
+
+Utilizare:
+    python benchmarks/bench_frontier.py --urls 1000000
+    python benchmarks/bench_frontier.py --urls 0 --crawl-pages 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.frontier import BloomFilter, FingerprintSet, Frontier, SQLiteCrawlStore  # noqa: E402
+
+
+def _urls(n: int):
+    for i in range(n):
+        yield f"https://www.example-shop.com/category/{i % 997}/product-{i}.html?ref=list&page={i % 50}"
+
+
+def _measure(name: str, factory, n: int):
+    # prima trecere: viteza (tracemalloc incetineste mult alocarile)
+    t0 = time.perf_counter()
+    container = factory()
+    for url in _urls(n):
+        container.add(url)
+    elapsed = time.perf_counter() - t0
+    del container
+
+    # a doua trecere: memoria ramasa dupa inserare
+    tracemalloc.start()
+    container = factory()
+    for url in _urls(n):
+        container.add(url)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_million = current * 1_000_000 / n / (1024 * 1024)
+    print(
+        f"  {name:<16} {current / (1024 * 1024):>8.1f} MB   "
+        f"{per_million:>7.1f} MB / 1M URL   {n / elapsed / 1000:>7.0f}k add/s"
+    )
+    return container
+
+
+def _simulate_crawl(frontier, visited, pages, n_pages: int, links_per_page: int = 10):
+    """Crawl sintetic: fiecare pagina are link-uri spre pagini noi si vechi."""
+    html = "<html>" + "x" * 2000 + "</html>"
+    frontier.push(next(_urls(1)), 0)
+    processed = next_new = 0
+    t0 = time.perf_counter()
+    while frontier and processed < n_pages:
+        url, depth = frontier.pop()
+        if url in visited:
+            continue
+        visited.add(url)
+        pages[url] = html
+        processed += 1
+        for k in range(links_per_page):
+            if k < 2:  # doua link-uri noi, restul spre pagini deja cunoscute
+                next_new += 1
+                i = next_new
+            else:
+                i = (processed * 7 + k * 131) % next_new
+            frontier.push(
+                f"https://www.example-shop.com/category/{i % 997}/product-{i}.html?ref=list&page={i % 50}",
+                depth + 1,
+            )
+    return processed / (time.perf_counter() - t0)
+
+
+def _compare_storage(n_pages: int):
+    print(f"\nCrawl simulat, {n_pages} pagini (~10 push-uri / pagina)")
+    rate_mem = _simulate_crawl(Frontier(), FingerprintSet(), {}, n_pages)
+    print(f"  {'memory':<16} {rate_mem:>9.0f} pagini/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteCrawlStore(os.path.join(tmp, "crawl.sqlite"))
+        rate_disk = _simulate_crawl(store.frontier, store.visited, store.pages, n_pages)
+        store.flush()
+        size = sum(
+            os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)
+        )
+        buffers = store.frontier.memory_bytes() + store.visited.memory_bytes()
+        store.close()
+    print(
+        f"  {'sqlite':<16} {rate_disk:>9.0f} pagini/s   {rate_mem / rate_disk:.1f}x mai lent, "
+        f"{size / (1024 * 1024):.0f} MB pe disc, {buffers / 1024:.0f} KB in buffere"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--urls", type=int, default=1_000_000)
+    ap.add_argument("--crawl-pages", type=int, default=0, help="compara stocarea memory / sqlite")
+    args = ap.parse_args()
+
+    if args.crawl_pages:
+        _compare_storage(args.crawl_pages)
+    n = args.urls
+    if not n:
+        return
+    print(f"Deduplicare pentru {n} URL-uri unice")
+    _measure("set(str)", set, n)
+    _measure("FingerprintSet", FingerprintSet, n)
+    bloom = _measure("BloomFilter", lambda: BloomFilter(n, 0.001), n)
+
+    # rata reala de fals pozitive a filtrului Bloom
+    probes = min(n, 200_000)
+    false_pos = sum(1 for i in range(probes) if f"https://absent.example/{i}" in bloom)
+    print(f"  BloomFilter fals pozitive: {100.0 * false_pos / probes:.3f}%")
+
+
+if __name__ == "__main__":
+    main()
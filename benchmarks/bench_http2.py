@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru transportul HTTP/2 (core/http2.py, PooledSession(http2=True)).
+
+Doua servere locale cu acelasi site: unul HTTP/1.1 (http.server) si unul
+HTTP/2 in clar (h2c, construit pe biblioteca h2). Fiecare pagina are
+--images imagini pe --hosts hosturi de CDN (nume *.bench.test rezolvate la
+127.0.0.1; fiecare nume e un host separat pentru pool). Pe loopback
+conectarea nu costa nimic, asa ca fiecare connect() asteapta --rtt-ms
+(handshake-ul TCP + TLS spre un host aflat la distanta), iar serverul
+raspunde fiecarui request dupa --latency-ms.
+
+Crawler-ul (motor threads) si downloader-ul (StagedPipeline) lucreaza ca
+intr-un job real, cu aceeasi concurenta. Se compara:
+
+    http1    pool urllib3, cel mult --per-host conexiuni simultane pe host
+    http2    Http2Adapter, toate request-urile unui host pe o conexiune
+
+Se raporteaza durata, conexiunile deschise si request-urile pe HTTP/2.
+Castigul apare cand HTTP/1.1 este limitat de conexiunile pe host (putine
+hosturi, multe resurse) sau de handshake-uri scumpe; cu destule hosturi cat
+sa ocupe toate descarcarile, cele doua sunt la egalitate.
+
+Utilizare:
+    python benchmarks/bench_http2.py --pages 20 --images 60 --hosts 2 --rtt-ms 60 --latency-ms 50
+"""
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from core.crawler import DomainCrawler  # noqa: E402
+from core.downloader import ResourceDownloader  # noqa: E402
+from core.pipeline import StagedPipeline  # noqa: E402
+from core.transport import PooledSession  # noqa: E402
+from utils.pathmap import PathMapper  # noqa: E402
+
+_DOMAIN = ".bench.test"
+
+
+def render(path, port, args):
+    """(content-type, corp) pentru un path al site-ului."""
+    if path.endswith(".png"):
+        return "image/png", b"\x89PNG" + b"\0" * args.image_bytes
+    i = int(path.strip("/").lstrip("p") or 0)
+    links = "".join(f'<a href="/p{i + k}">x</a>' for k in (1, 2) if i + k < args.pages)
+    imgs = "".join(
+        f'<img src="http://cdn{n % args.hosts}{_DOMAIN}:{port}/p{i}/{n}.png">'
+        for n in range(args.images)
+    )
+    return "text/html", f"<html><body>{links}{imgs}</body></html>".encode()
+
+
+class _SimulatedNetwork:
+    """*.bench.test -> 127.0.0.1; fiecare connect() spre servere asteapta RTT-ul."""
+
+    def __init__(self, rtt_ms, ports):
+        self.rtt = rtt_ms / 1000.0
+        self.ports = set(ports)
+        self.connects = 0
+        self.lock = threading.Lock()
+        self._getaddrinfo = socket.getaddrinfo
+        self._socket = socket.socket
+
+    def __enter__(self):
+        net = self
+
+        def getaddrinfo(host, port, *args, **kwargs):
+            if isinstance(host, str) and host.endswith(_DOMAIN):
+                host = "127.0.0.1"
+            return net._getaddrinfo(host, port, *args, **kwargs)
+
+        class Socket(self._socket):
+            def connect(self, address):
+                if address[1] in net.ports:
+                    time.sleep(net.rtt)
+                    with net.lock:
+                        net.connects += 1
+                return super().connect(address)
+
+        socket.getaddrinfo = getaddrinfo
+        socket.socket = Socket
+        return self
+
+    def __exit__(self, *exc):
+        socket.getaddrinfo = self._getaddrinfo
+        socket.socket = self._socket
+
+
+def _make_handler(args):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(args.latency_ms / 1000.0)
+            ctype, body = render(self.path, self.server.server_port, args)
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+class _H2Connection:
+    """O conexiune h2c: fiecare stream primeste raspunsul dintr-un thread propriu."""
+
+    def __init__(self, sock, port, args):
+        self.sock = sock
+        self.port = port
+        self.args = args
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.cond = threading.Condition()  # fereastra de flow control s-a marit
+
+    def serve(self):
+        with self.cond:
+            self.conn.initiate_connection()
+            self._flush()
+        while True:
+            data = self.sock.recv(65536)
+            if not data:
+                break
+            with self.cond:
+                events = self.conn.receive_data(data)
+                self._flush()
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        path = dict(event.headers)[":path"]
+                        threading.Thread(target=self._respond, args=(event.stream_id, path), daemon=True).start()
+                    elif isinstance(event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged,
+                                            h2.events.StreamReset)):
+                        self.cond.notify_all()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+
+    def _respond(self, stream_id, path):
+        time.sleep(self.args.latency_ms / 1000.0)
+        ctype, body = render(path, self.port, self.args)
+        try:
+            with self.cond:
+                self.conn.send_headers(stream_id, [
+                    (":status", "200"), ("content-type", ctype), ("content-length", str(len(body))),
+                ])
+                while True:
+                    window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                    if window <= 0 and body:
+                        self.cond.wait()
+                        continue
+                    chunk, body = body[:window], body[window:]
+                    self.conn.send_data(stream_id, chunk, end_stream=not body)
+                    self._flush()
+                    if not body:
+                        return
+        except (h2.exceptions.StreamClosedError, OSError):
+            pass  # clientul a inchis stream-ul sau conexiunea
+
+    def _flush(self):
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+
+class _H2Server:
+    """Server HTTP/2 in clar (prior knowledge), un thread pe conexiune."""
+
+    def __init__(self, args):
+        self.args = args
+        self.sock = socket.socket()
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(128)
+        self.server_port = self.sock.getsockname()[1]
+
+    def serve_forever(self):
+        while True:
+            try:
+                client, _addr = self.sock.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = _H2Connection(client, self.server_port, self.args)
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    @staticmethod
+    def _serve(connection):
+        try:
+            connection.serve()
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            connection.sock.close()
+
+    def shutdown(self):
+        self.sock.close()
+
+
+def run(mode, port, net, args):
+    http2 = mode == "http2"
+    session = PooledSession(args.concurrency, args.per_host, retries=0, http2=http2, http2_cleartext=http2)
+    origin = f"http://site{_DOMAIN}:{port}"
+    net.connects = 0
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as out:
+        downloader = ResourceDownloader(out, PathMapper(out), {"images": True}, session=session)
+        pipeline = StagedPipeline(lambda url, html: None, downloader.download_one,
+                                  download_workers=args.concurrency)
+        pipeline.start()
+        crawler = DomainCrawler(
+            origin + "/p0", max_depth=1000, max_pages=args.pages, engine="threads", concurrency=4,
+            session=session, per_host_limit=args.per_host, host_rate=10000.0, respect_robots=False,
+            seed=False, prewarm=False, page_sink=pipeline.page_sink, resource_sink=pipeline.resource_sink,
+        )
+        crawler.crawl()
+        pipeline.finish()
+    elapsed = time.perf_counter() - t0
+    stats = session.pool_stats()
+    session.close()
+    print(
+        f"  {mode:<6} {elapsed:6.2f}s | {downloader.downloaded_count} resurse, "
+        f"{downloader.failed_count} esuate | {net.connects} conexiuni deschise | "
+        f"{sum(st['http2_requests'] for st in stats.values())} request-uri pe HTTP/2"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--images", type=int, default=60, help="imagini pe pagina")
+    ap.add_argument("--hosts", type=int, default=2, help="hosturi de CDN")
+    ap.add_argument("--image-bytes", type=int, default=4096)
+    ap.add_argument("--rtt-ms", type=float, default=60.0)
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--concurrency", type=int, default=16, help="thread-uri de descarcare")
+    ap.add_argument("--per-host", type=int, default=config.DEFAULT_PER_HOST_LIMIT, help="conexiuni HTTP/1.1 pe host")
+    ap.add_argument("--mode", nargs="+", default=["http1", "http2"])
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    http1 = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args))
+    http1.daemon_threads = True
+    http2 = _H2Server(args)
+    for server in (http1, http2):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"{args.pages} pagini x {args.images} imagini pe {args.hosts} hosturi, "
+          f"conectare {args.rtt_ms:.0f} ms, raspuns {args.latency_ms:.0f} ms, "
+          f"{args.concurrency} descarcari simultane")
+    try:
+        with _SimulatedNetwork(args.rtt_ms, (http1.server_port, http2.server_port)) as net:
+            for mode in args.mode:
+                run(mode, http2.server_port if mode == "http2" else http1.server_port, net, args)
+    finally:
+        http1.shutdown()
+        http2.shutdown()
+
+
+if __name__ == "__main__":
+    main()
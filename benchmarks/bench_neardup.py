@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru detectarea paginilor aproape identice (core/neardup.py).
+
+Un magazin sintetic pe un server local: categorii cu produse, fiecare pagina
+cu acelasi sablon (navigatie, footer) si text propriu. Pe langa paginile
+reale exista variante cu acelasi continut:
+
+    /cat/cX?sort=...       aceleasi produse in alta ordine
+    /cat/cX/print          vederea de tiparire a categoriei
+    /s/<sid>/product/pN    link-uri cu session ID in path (fiecare pagina
+                           de produs da link-uri cu un session ID nou)
+
+Cu un buget fix de pagini, se compara crawl-ul fara si cu detectarea:
+cate produse distincte au fost scanate, cate pagini au ajuns la scriere
+(page_sink) si timpul de amprentare pe pagina.
+
+Utilizare:
+    python benchmarks/bench_neardup.py --products 200 --budget 150 300 --order bfs
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawler import DomainCrawler  # noqa: E402
+from core.neardup import page_words, simhash  # noqa: E402
+
+N_CATEGORIES = 10
+_PRODUCT = re.compile(r"/product/p(\d+)$")
+
+
+class _Shop:
+    def __init__(self, n_products, seed):
+        rng = random.Random(seed)
+        vocab = [f"w{i}" for i in range(4000)]
+        self.nav = " ".join(rng.choice(vocab) for _ in range(60))
+        self.footer = " ".join(rng.choice(vocab) for _ in range(40))
+        self.n = n_products
+        self.texts = [" ".join(rng.choice(vocab) for _ in range(80)) for _ in range(n_products)]
+        self.sid = 0
+        self.lock = threading.Lock()
+
+    def _page(self, body, links, nav=True):
+        anchors = "".join(f'<a href="{href}">{text}</a> ' for href, text in links)
+        chrome = (f"<nav>{self.nav}</nav>", f"<footer>{self.footer}</footer>") if nav else ("", "")
+        return (f"<html><head><title>shop</title><script>var t = {time.time()};</script></head>"
+                f"<body>{chrome[0]}<main>{body}</main><div>{anchors}</div>{chrome[1]}</body></html>")
+
+    def _new_sid(self):
+        with self.lock:
+            self.sid += 1
+            return f"{self.sid:08x}"
+
+    def render(self, path, query):
+        cats = [(f"/cat/c{c}", f"categoria {c}") for c in range(N_CATEGORIES)]
+        if path == "/":
+            return self._page("bine ati venit", cats)
+        m = re.match(r"^/cat/c(\d+)(/print)?$", path)
+        if m:
+            c = int(m.group(1))
+            items = list(range(c, self.n, N_CATEGORIES))
+            if "sort=desc" in query:
+                items.reverse()
+            elif "sort=name" in query:
+                items.sort(key=lambda i: self.texts[i])
+            body = " ".join(f"produs {i} {self.texts[i][:40]}" for i in items)
+            links = [(f"/product/p{i}", f"produs {i}") for i in items]
+            links += [(f"/cat/c{c}?sort={s}", s) for s in ("desc", "name")] + [(f"/cat/c{c}/print", "print")]
+            return self._page(body, links + cats, nav=not m.group(2))
+        m = re.match(r"^(?:/s/[0-9a-f]+)?/product/p(\d+)$", path)
+        if m:
+            i = int(m.group(1))
+            if i >= self.n:
+                return None
+            sid = self._new_sid()
+            related = [(f"/s/{sid}/product/p{(i * 7 + k) % self.n}", "similar") for k in range(1, 4)]
+            return self._page(f"produs {i} {self.texts[i]}", related + cats)
+        return None
+
+
+def _make_handler(shop):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _sep, query = self.path.partition("?")
+            html = shop.render(path, query)
+            body = (html or "").encode()
+            self.send_response(200 if html else 404)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(origin, near_dup, args):
+    written = []
+    crawler = DomainCrawler(
+        origin + "/", max_depth=100, max_pages=args.budget, engine=args.engine, concurrency=8,
+        host_rate=10000.0, respect_robots=False, seed=False, near_dup=near_dup, order=args.order,
+        page_sink=lambda url, html: written.append(url),
+    )
+    t0 = time.perf_counter()
+    crawler.crawl()
+    elapsed = time.perf_counter() - t0
+    products = {int(m.group(1)) for url in list(written) + list(crawler.aliases)
+                if (m := _PRODUCT.search(url))}
+    name = "SimHash" if near_dup else "fara"
+    print(
+        f"  {name:<8} {elapsed:5.2f}s | {crawler.pages_processed} scanate, {len(written)} scrise, "
+        f"{crawler.near_duplicates} aliasuri | produse distincte {len(products)}/{args.products}"
+    )
+    crawler.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--products", type=int, default=200)
+    ap.add_argument("--budget", type=int, nargs="+", default=[150, 300])
+    ap.add_argument("--engine", default="threads")
+    ap.add_argument("--order", default="bfs", help="ordinea frontierei: bfs sau priority")
+    ap.add_argument("--seed", type=int, default=5)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    shop = _Shop(args.products, args.seed)
+    html = shop.render("/product/p1", "")
+    t0 = time.perf_counter()
+    for _ in range(200):
+        simhash(page_words(html))
+    print(f"{args.products} produse, {N_CATEGORIES} categorii, ordine {args.order}; amprenta: "
+          f"{1000 * (time.perf_counter() - t0) / 200:.2f} ms / pagina de {len(html)} octeti")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(shop))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://127.0.0.1:{server.server_port}"
+    try:
+        budgets = args.budget
+        for budget in budgets:
+            args.budget = budget
+            print(f"buget {budget} pagini")
+            run(origin, False, args)
+            run(origin, True, args)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru modurile de pipeline ale unui job de clonare.
+
+Porneste un server HTTP local cu latenta artificiala (site sintetic cu
+pagini si imagini) si ruleaza acelasi job in modurile "batch", "streaming"
+si "staged", cu componentele reale (DomainCrawler, ContentProcessor,
+ResourceDownloader, StagedPipeline). Afiseaza timpul total si metricile
+fiecarui stagiu.
+
+Utilizare:
+    python benchmarks/bench_pipeline.py --pages 200 --latency-ms 40
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from core.crawler import DomainCrawler  # noqa: E402
+from core.downloader import ResourceDownloader  # noqa: E402
+from core.pipeline import StagedPipeline  # noqa: E402
+from core.processor import ContentProcessor  # noqa: E402
+from core.transport import PooledSession  # noqa: E402
+from utils.pathmap import PathMapper  # noqa: E402
+
+_PNG = bytes.fromhex("89504e470d0a1a0a") + b"\0" * 2048
+
+
+def _make_handler(n_pages: int, latency: float, images_per_page: int):
+    filler = "<p>" + "lorem ipsum dolor sit amet " * 400 + "</p>"
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            path = self.path.split("?", 1)[0]
+            if path.endswith(".png"):
+                body, ctype = _PNG, "image/png"
+            else:
+                i = int(path.strip("/").replace("p", "") or 0) if path != "/" else 0
+                links = "".join(f'<a href="/p{(i * 7 + k) % n_pages}">l</a>' for k in range(5))
+                imgs = "".join(
+                    f'<img src="/img/{i}-{k}.png">' for k in range(images_per_page)
+                )
+                body = f"<html><body>{links}{imgs}{filler}</body></html>".encode()
+                ctype = "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _run(mode: str, base_url: str, out_dir: str):
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+    transport = PooledSession(config.DEFAULT_CONCURRENCY, config.DEFAULT_PER_HOST_LIMIT)
+    pathmap = PathMapper(out_dir)
+    processor = ContentProcessor(out_dir, base_url=base_url, pathmap=pathmap)
+    downloader = ResourceDownloader(out_dir, pathmap=pathmap, resource_types={}, session=transport)
+
+    def write_page(page_url, html):
+        local_path = pathmap.path_for_page(page_url)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        with open(local_path, "w", encoding="utf-8") as f:
+            f.write(processor.process_html(html, page_url))
+
+    pipeline = None
+    page_sink = write_page if mode == "streaming" else None
+    resource_sink = None
+    if mode == "staged":
+        pipeline = StagedPipeline(write_page, downloader.download_one)
+        pipeline.start()
+        page_sink, resource_sink = pipeline.page_sink, pipeline.resource_sink
+
+    t0 = time.perf_counter()
+    crawler = DomainCrawler(
+        base_url, max_depth=50, max_pages=100_000, engine="threads",
+        session=transport, page_sink=page_sink, resource_sink=resource_sink,
+    )
+    pages, resources = crawler.crawl()
+    t_crawl = time.perf_counter() - t0
+    if pipeline is not None:
+        pipeline.finish()
+    else:
+        for page_url, html in pages.items():
+            write_page(page_url, html)
+        downloader.download_all(resources, {})
+    elapsed = time.perf_counter() - t0
+    transport.close()
+
+    print(
+        f"  {mode:<10} {elapsed:>6.2f}s total  (crawl {t_crawl:.2f}s)  "
+        f"{crawler.pages_processed} pagini, {downloader.downloaded_count} resurse"
+    )
+    if pipeline is not None:
+        for name, st in pipeline.stats().items():
+            print(
+                f"      {name:<9} workeri {st['workers']:>2}  coada medie {st['avg_queue_depth']:>5.1f} "
+                f"max {st['max_queue_depth']:>3}  producator blocat {st['producer_blocked_s']:.2f}s  "
+                f"ocupare {100 * st['utilization']:.0f}%"
+            )
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--images", type=int, default=5, help="imagini unice pe pagina")
+    ap.add_argument("--latency-ms", type=float, default=40.0)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _make_handler(args.pages, args.latency_ms / 1000.0, args.images)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/"
+
+    print(
+        f"{args.pages} pagini x {args.images} imagini, latenta {args.latency_ms:.0f} ms, "
+        f"concurenta {config.DEFAULT_CONCURRENCY}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("batch", "streaming", "staged"):
+            _run(mode, base_url, os.path.join(tmp, mode))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru cache-ul DNS si conexiunile pregatite in avans
+(core/dnscache.py, PooledSession.prewarm).
+
+Pe loopback rezolvarea si conectarea nu costa nimic, asa ca reteaua este
+simulata in proces: numele *.bench.test se rezolva la 127.0.0.1 dupa
+--dns-ms milisecunde, iar fiecare connect() asteapta --rtt-ms (handshake-ul
+TCP + TLS spre un host aflat la distanta). Un singur server local raspunde
+pentru toate numele; fiecare nume este un host separat pentru pool.
+
+Fiecare pagina a site-ului are imagini pe --hosts-per-page hosturi de CDN
+noi (plus cateva deja vazute). Crawler-ul (motor threads) si downloader-ul
+(StagedPipeline) lucreaza ca intr-un job real. Se compara:
+
+    fara       rezolvare la fiecare conexiune noua, conectare la primul request
+    dns        DNSCache comun
+    prewarm    DNSCache + hosturile noi rezolvate si conectate in fundal
+
+Se raporteaza durata, rezolvarile facute si latenta medie a primului
+request spre fiecare host nou.
+
+Utilizare:
+    python benchmarks/bench_prewarm.py --pages 40 --hosts-per-page 3 --dns-ms 40 --rtt-ms 30
+"""
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawler import DomainCrawler  # noqa: E402
+from core.dnscache import DNSCache  # noqa: E402
+from core.downloader import ResourceDownloader  # noqa: E402
+from core.pipeline import StagedPipeline  # noqa: E402
+from core.transport import PooledSession  # noqa: E402
+from utils.pathmap import PathMapper  # noqa: E402
+
+_DOMAIN = ".bench.test"
+
+
+class _SimulatedNetwork:
+    """Intarzieri de DNS si de conectare pentru numele *.bench.test."""
+
+    def __init__(self, dns_ms, rtt_ms, port):
+        self.dns = dns_ms / 1000.0
+        self.rtt = rtt_ms / 1000.0
+        self.port = port
+        self.lookups = 0
+        self.lock = threading.Lock()
+        self._getaddrinfo = socket.getaddrinfo
+        self._socket = socket.socket
+
+    def __enter__(self):
+        net = self
+
+        def getaddrinfo(host, port, *args, **kwargs):
+            if isinstance(host, str) and host.endswith(_DOMAIN):
+                time.sleep(net.dns)
+                with net.lock:
+                    net.lookups += 1
+                host = "127.0.0.1"
+            return net._getaddrinfo(host, port, *args, **kwargs)
+
+        class Socket(self._socket):
+            def connect(self, address):
+                if address[1] == net.port:
+                    time.sleep(net.rtt)
+                return super().connect(address)
+
+        socket.getaddrinfo = getaddrinfo
+        socket.socket = Socket
+        return self
+
+    def __exit__(self, *exc):
+        socket.getaddrinfo = self._getaddrinfo
+        socket.socket = self._socket
+
+
+def _make_handler(args):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path.endswith(".png"):
+                return self._send(b"\x89PNG" + b"\0" * 2048, "image/png")
+            i = int(path.strip("/").lstrip("p") or 0)
+            port = self.server.server_port
+            links = "".join(f'<a href="/p{i + k}">x</a>' for k in (1, 2) if i + k < args.pages)
+            hosts = [i * args.hosts_per_page + k for k in range(args.hosts_per_page)]
+            hosts += [h for h in (0, 1) if h not in hosts]  # hosturi deja vazute
+            imgs = "".join(
+                f'<img src="http://cdn{h}{_DOMAIN}:{port}/p{i}/{n}.png">'
+                for h in hosts for n in range(args.images)
+            )
+            self._send(f"<html><body>{links}{imgs}</body></html>".encode(), "text/html")
+
+        def _send(self, body, ctype):
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(mode, origin, net, args):
+    resolver = DNSCache() if mode in ("dns", "prewarm") else None
+    session = PooledSession(32, 4, retries=0, resolver=resolver)
+    first = {}      # host -> latenta primului request
+    lock = threading.Lock()
+    net.lookups = 0
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as out:
+        downloader = ResourceDownloader(out, PathMapper(out), {"images": True}, session=session)
+
+        def download(url, src_page=None):
+            start = time.perf_counter()
+            ok = downloader.download_one(url, src_page)
+            host = urlsplit(url).hostname
+            with lock:
+                first.setdefault(host, time.perf_counter() - start)
+            return ok
+
+        pipeline = StagedPipeline(lambda url, html: None, download)
+        pipeline.start()
+        crawler = DomainCrawler(
+            origin + "/p0", max_depth=1000, max_pages=args.pages, engine="threads", concurrency=4,
+            session=session, host_rate=10000.0, respect_robots=False, seed=False,
+            page_sink=pipeline.page_sink, resource_sink=pipeline.resource_sink,
+            prewarm=mode == "prewarm",
+        )
+        crawler.crawl()
+        pipeline.finish()
+    elapsed = time.perf_counter() - t0
+    session.close()
+    new_hosts = [latency for host, latency in first.items() if host not in ("cdn0" + _DOMAIN, "cdn1" + _DOMAIN)]
+    print(
+        f"  {mode:<8} {elapsed:6.2f}s | {net.lookups:>4} rezolvari DNS | {len(first)} hosturi, "
+        f"primul request: {1000 * sum(new_hosts) / max(1, len(new_hosts)):6.1f} ms in medie | "
+        f"{session.prewarmed} conexiuni pregatite"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=40)
+    ap.add_argument("--hosts-per-page", type=int, default=3, help="hosturi de CDN noi pe pagina")
+    ap.add_argument("--images", type=int, default=4, help="imagini pe host si pagina")
+    ap.add_argument("--dns-ms", type=float, default=40.0)
+    ap.add_argument("--rtt-ms", type=float, default=30.0)
+    ap.add_argument("--mode", nargs="+", default=["fara", "dns", "prewarm"])
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://site{_DOMAIN}:{server.server_port}"
+    print(f"{args.pages} pagini, {args.hosts_per_page} hosturi noi/pagina, {args.images} imagini/host, "
+          f"DNS {args.dns_ms:.0f} ms, conectare {args.rtt_ms:.0f} ms")
+    try:
+        with _SimulatedNetwork(args.dns_ms, args.rtt_ms, server.server_port) as net:
+            for mode in args.mode:
+                run(mode, origin, net, args)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
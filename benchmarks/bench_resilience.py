@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru retry-uri si circuit breaker (core/resilience.py).
+
+Doua servere locale:
+
+    origin   paginile si o parte din imagini; --flaky din request-uri
+             primesc 503, iar o parte 429 cu Retry-After: 1
+    cdn      hostul altor --dead-images imagini pe pagina, cazut: accepta
+             conexiunea si nu mai raspunde (fiecare request asteapta
+             intregul --timeout)
+
+Crawler-ul (motor threads) si downloader-ul (StagedPipeline) lucreaza ca
+intr-un job real. Se compara:
+
+    urllib3     comportamentul vechi: retry-uri in PooledSession
+                (DEFAULT_RETRIES, fara 429, fara breaker)
+    fara        niciun retry: orice eroare pierde URL-ul
+    resilience  RetryPolicy + CircuitBreaker
+
+Se raporteaza durata, timpul total petrecut in request-uri spre hostul
+cazut si cate pagini / imagini s-au pierdut pe origin.
+
+Utilizare:
+    python benchmarks/bench_resilience.py --pages 100 --timeout 2
+"""
+
+import argparse
+import logging
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from core.crawler import DomainCrawler  # noqa: E402
+from core.downloader import ResourceDownloader  # noqa: E402
+from core.pipeline import StagedPipeline  # noqa: E402
+from core.resilience import CircuitBreaker, RetryPolicy  # noqa: E402
+from core.transport import PooledSession  # noqa: E402
+from utils.pathmap import PathMapper  # noqa: E402
+
+
+class _DeadHost:
+    """Accepta conexiuni si nu raspunde niciodata; masoara cat se asteapta."""
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(1024)
+        self.port = self.sock.getsockname()[1]
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.waited = 0.0
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _addr = self.sock.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections += 1
+            threading.Thread(target=self._hold, args=(conn,), daemon=True).start()
+
+    def _hold(self, conn):
+        t0 = time.monotonic()
+        try:
+            while conn.recv(4096):
+                pass  # clientul inchide conexiunea la timeout
+        except OSError:
+            pass
+        with self.lock:
+            self.waited += time.monotonic() - t0
+        conn.close()
+
+    def close(self):
+        self.sock.close()
+
+
+def _make_handler(state, n_pages, dead_origin, n_dead):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with state["lock"]:
+                state["requests"] += 1
+                roll = state["rng"].random()
+            if roll < state["flaky"] * 0.25:
+                return self._send(429, b"", "text/plain", {"Retry-After": "1"})
+            if roll < state["flaky"]:
+                return self._send(503, b"", "text/plain")
+            path = self.path.split("?")[0]
+            if path.endswith(".png"):
+                return self._send(200, b"\x89PNG" + b"\0" * 1024, "image/png")
+            i = int(path.strip("/").lstrip("p") or 0)
+            links = "".join(f'<a href="/p{(i * 7 + k) % n_pages}">x</a>' for k in range(1, 6))
+            imgs = f'<img src="/img/{i}.png">' + "".join(
+                f'<img src="{dead_origin}/img/{i}-{k}.png">' for k in range(n_dead)
+            )
+            self._send(200, f"<html><body>{links}{imgs}</body></html>".encode(), "text/html")
+
+        def _send(self, status, body, ctype, extra=None):
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (extra or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(mode, args):
+    dead = _DeadHost()
+    dead_origin = f"http://127.0.0.1:{dead.port}"
+    state = {"lock": threading.Lock(), "rng": random.Random(args.seed), "requests": 0, "flaky": args.flaky}
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _make_handler(state, args.pages, dead_origin, args.dead_images)
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://127.0.0.1:{server.server_port}"
+
+    retry = breaker = None
+    retries = config.DEFAULT_RETRIES if mode == "urllib3" else 0
+    if mode == "resilience":
+        retry = RetryPolicy(backoff=args.backoff)
+        breaker = CircuitBreaker()
+    session = PooledSession(32, 8, retries=retries)
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as out:
+        downloader = ResourceDownloader(
+            out, PathMapper(out), {"images": True}, session=session, timeout=args.timeout,
+            retry=retry, breaker=breaker,
+        )
+        lost_images = []
+
+        def download(url, src_page=None):
+            ok = downloader.download_one(url, src_page)
+            if not ok and url.startswith(origin):
+                lost_images.append(url)
+            return ok
+
+        pipeline = StagedPipeline(lambda url, html: None, download)
+        pipeline.start()
+        crawler = DomainCrawler(
+            origin + "/", max_depth=100, max_pages=args.pages, engine="threads", concurrency=8,
+            session=session, host_rate=10000.0, respect_robots=False, seed=False,
+            page_sink=pipeline.page_sink, resource_sink=pipeline.resource_sink,
+            retry=retry, breaker=breaker,
+        )
+        crawler.crawl()
+        pipeline.finish()
+    elapsed = time.perf_counter() - t0
+    server.shutdown()
+    session.close()
+    time.sleep(0.2)  # conexiunile inchise la timeout ajung la _hold
+    dead.close()
+
+    origin_images = sum(1 for url in crawler.resources if url.startswith(origin))
+    lost_pages = sum(1 for url, _e in crawler.errors if url.startswith(origin))
+    print(
+        f"  {mode:<11} {elapsed:6.1f}s | host cazut: {dead.connections:>4} conexiuni, "
+        f"{dead.waited:6.1f}s asteptate | origin: {crawler.pages_processed} pagini, "
+        f"{lost_pages} pierdute, imagini pierdute {len(lost_images)}/{origin_images} | "
+        f"reincercari {crawler.retries + downloader.retry_count}"
+    )
+    if breaker is not None:
+        for host, st in breaker.stats().items():
+            print(f"              circuit {host}: deschis de {st['trips']} ori, "
+                  f"{st['rejected']} request-uri evitate")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=100)
+    ap.add_argument("--dead-images", type=int, default=2, help="imagini pe pagina de pe hostul cazut")
+    ap.add_argument("--flaky", type=float, default=0.15, help="fractiunea de 503/429 pe origin")
+    ap.add_argument("--timeout", type=float, default=2.0, help="timeout-ul downloader-ului")
+    ap.add_argument("--backoff", type=float, default=config.RETRY_BACKOFF)
+    ap.add_argument("--mode", nargs="+", default=["urllib3", "fara", "resilience"])
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    print(f"{args.pages} pagini, {args.dead_images} imagini/pagina pe un host cazut "
+          f"(timeout {args.timeout:.0f}s), {100 * args.flaky:.0f}% 503/429 pe origin")
+    for mode in args.mode:
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
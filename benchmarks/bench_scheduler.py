@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru planificatorul politicos din core/crawler.py.
+
+Porneste H servere locale (hosturi distincte prin port), cu latenta
+artificiala si link-uri intre ele, apoi face crawl peste toate. Masoara
+debitul total si, pe fiecare host, numarul maxim de request-uri simultane
+si de request-uri intr-o fereastra de o secunda, comparate cu limitele
+configurate (per_host_limit, host_rate / Crawl-delay).
+
+Utilizare:
+    python benchmarks/bench_scheduler.py --hosts 1 4 8 --pages 60 --rate 10
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawler import DomainCrawler  # noqa: E402
+
+
+class _HostLog:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.times = []
+
+
+def _make_server(index, ports, n_pages, latency, log, crawl_delay):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/robots.txt":
+                body = b"User-agent: *\n"
+                if crawl_delay:
+                    body += f"Crawl-delay: {crawl_delay}\n".encode()
+                return self._send(body, "text/plain")
+            with log.lock:
+                log.active += 1
+                log.max_active = max(log.max_active, log.active)
+                log.times.append(time.monotonic())
+            time.sleep(latency)
+            i = int(self.path.strip("/").lstrip("p") or 0)
+            links = []
+            for k in range(1, 4):
+                links.append(f'<a href="/p{(i * 3 + k) % n_pages}">l</a>')
+                port = ports[(index + k) % len(ports)]
+                links.append(f'<a href="http://127.0.0.1:{port}/p{(i + k) % n_pages}">x</a>')
+            self._send(f"<html><body>{''.join(links)}</body></html>".encode(), "text/html")
+            with log.lock:
+                log.active -= 1
+
+        def _send(self, body, ctype):
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _max_per_window(times, window=1.0):
+    best, j = 0, 0
+    for i, t in enumerate(times):
+        while t - times[j] > window:
+            j += 1
+        best = max(best, i - j + 1)
+    return best
+
+
+def run(n_hosts, n_pages, latency, rate, per_host, crawl_delay, engine):
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), BaseHTTPRequestHandler) for _ in range(n_hosts)]
+    ports = [srv.server_port for srv in servers]
+    logs = defaultdict(_HostLog)
+    for idx, srv in enumerate(servers):
+        srv.RequestHandlerClass = _make_server(idx, ports, n_pages, latency, logs[ports[idx]], crawl_delay)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+    crawler = DomainCrawler(
+        f"http://127.0.0.1:{ports[0]}/", max_depth=100, max_pages=n_hosts * n_pages + 1,
+        same_domain_only=False, engine=engine, concurrency=32,
+        per_host_limit=per_host, host_rate=rate, seed=False,
+    )
+    t0 = time.perf_counter()
+    crawler.crawl()
+    elapsed = time.perf_counter() - t0
+    for srv in servers:
+        srv.shutdown()
+
+    allowed = min(rate, 1.0 / crawl_delay) if crawl_delay else rate
+    worst_rate = max(_max_per_window(logs[p].times) for p in ports)
+    worst_active = max(logs[p].max_active for p in ports)
+    print(
+        f"  {n_hosts:>2} hosturi: {crawler.pages_processed:>4} pagini in {elapsed:6.2f}s "
+        f"= {crawler.pages_processed / elapsed:6.1f} pagini/s | pe host: max {worst_active} simultane "
+        f"(limita {per_host}), max {worst_rate} req/1s (limita {allowed:.1f}/s + rafala {per_host})"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--hosts", type=int, nargs="+", default=[1, 4, 8])
+    ap.add_argument("--pages", type=int, default=60, help="pagini pe host")
+    ap.add_argument("--latency-ms", type=float, default=30.0)
+    ap.add_argument("--rate", type=float, default=10.0, help="request-uri/s pe host")
+    ap.add_argument("--per-host", type=int, default=4)
+    ap.add_argument("--crawl-delay", type=float, default=0.0)
+    ap.add_argument("--engine", default="threads")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"motor {args.engine}, latenta {args.latency_ms:.0f} ms, {args.pages} pagini/host")
+    for n in args.hosts:
+        run(n, args.pages, args.latency_ms / 1000.0, args.rate, args.per_host,
+            args.crawl_delay, args.engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru detectarea capcanelor (core/traps.py).
+
+Un site sintetic pe un server local: categorii cu produse si un blog cu
+paginare finita (continutul real), plus capcanele obisnuite, legate din
+fiecare pagina:
+
+    /calendar/YYYY/MM        luna precedenta / urmatoare, anul urmator,
+                             fara sfarsit
+    /archive?page=N          "pagina urmatoare" exista mereu
+    /docs/more               link relativ "more/more": /docs/more/more/...
+    /search?color=&size=...  filtre combinate, fiecare pagina adauga o
+                             valoare noua
+
+Cu un buget fix de pagini si adancime mare, se compara crawl-ul fara si cu
+detectarea: cate pagini reale (produse, articole) au fost scanate si cate
+din buget s-au dus pe capcane.
+
+Utilizare:
+    python benchmarks/bench_traps.py --products 300 --budget 500 1000
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawler import DomainCrawler  # noqa: E402
+
+N_CATEGORIES = 10
+BLOG_PAGES = 30
+POSTS_PER_PAGE = 5
+COLORS = ("red", "green", "blue", "black", "white", "grey", "pink", "navy")
+SIZES = ("xs", "s", "m", "l", "xl", "xxl")
+_REAL = re.compile(r"/(product/p\d+|post/\d+)$")
+_TRAP = re.compile(r"/(calendar|archive|docs|search)\b")
+
+
+def _page(body, links):
+    anchors = "".join(f'<a href="{href}">x</a> ' for href in links)
+    return f"<html><body><main>{body}</main><nav>{anchors}</nav></body></html>"
+
+
+def _traps():
+    return ["/calendar/2025/01", "/archive?page=1", "/docs/more", "/search?color=red"]
+
+
+def render(path, query, n_products):
+    cats = [f"/cat/c{c}" for c in range(N_CATEGORIES)] + ["/blog?page=1"]
+    if path == "/":
+        return _page("home", cats + _traps())
+    m = re.fullmatch(r"/cat/c(\d+)", path)
+    if m:
+        c = int(m.group(1))
+        return _page(f"categoria {c}", [f"/product/p{i}" for i in range(c, n_products, N_CATEGORIES)] + cats)
+    m = re.fullmatch(r"/product/p(\d+)", path)
+    if m:
+        i = int(m.group(1))
+        related = [f"/product/p{(i * 7 + k) % n_products}" for k in range(1, 4)]
+        return _page(f"produs {i}", related + cats + _traps())
+    if path == "/blog":
+        page = int(parse_qs(query).get("page", ["1"])[0])
+        if not 1 <= page <= BLOG_PAGES:
+            return None
+        posts = [f"/post/{(page - 1) * POSTS_PER_PAGE + k}" for k in range(POSTS_PER_PAGE)]
+        nav = [f"/blog?page={p}" for p in (page - 1, page + 1) if 1 <= p <= BLOG_PAGES]
+        return _page(f"blog {page}", posts + nav + cats)
+    m = re.fullmatch(r"/post/(\d+)", path)
+    if m:
+        return _page(f"articol {m.group(1)}", cats + _traps())
+    m = re.fullmatch(r"/calendar/(\d+)/(\d+)", path)
+    if m:
+        year, month = int(m.group(1)), int(m.group(2))
+        prev = (year, month - 1) if month > 1 else (year - 1, 12)
+        nxt = (year, month + 1) if month < 12 else (year + 1, 1)
+        links = [f"/calendar/{y}/{mo:02d}" for y, mo in (prev, nxt, (year + 1, month))]
+        return _page(f"calendar {year}-{month}", links)
+    if path == "/archive":
+        page = int(parse_qs(query).get("page", ["1"])[0])
+        return _page(f"arhiva {page}", [f"/archive?page={page + 1}"])
+    if path.startswith("/docs/more"):
+        return _page("documentatie", ["more/more"])
+    if path == "/search":
+        params = parse_qs(query)
+        links = []
+        for key, values in (("color", COLORS), ("size", SIZES)):
+            chosen = params.get(key, [])
+            for value in values:
+                if value not in chosen:
+                    extra = "&".join(f"{k}={v}" for k, vs in params.items() for v in vs)
+                    links.append(f"/search?{extra}&{key}={value}")
+        return _page("cautare", links)
+    return None
+
+
+def _make_handler(n_products):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _sep, query = self.path.partition("?")
+            html = render(path, query, n_products)
+            body = (html or "").encode()
+            self.send_response(200 if html else 404)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(origin, traps, args):
+    fetched = []
+    crawler = DomainCrawler(
+        origin + "/", max_depth=1000, max_pages=args.budget, engine=args.engine, concurrency=8,
+        host_rate=10000.0, respect_robots=False, seed=False, near_dup=False, traps=traps,
+        order=args.order, page_sink=lambda url, html: fetched.append(url),
+    )
+    t0 = time.perf_counter()
+    crawler.crawl()
+    elapsed = time.perf_counter() - t0
+    real = sum(1 for url in fetched if _REAL.search(url))
+    trapped = sum(1 for url in fetched if _TRAP.search(url))
+    total_real = args.products + BLOG_PAGES * POSTS_PER_PAGE
+    stats = crawler.get_statistics()
+    name = "sabloane" if traps else "fara"
+    print(
+        f"  {name:<9} {elapsed:5.2f}s | {len(fetched)} pagini, reale {real}/{total_real}, "
+        f"capcane {trapped} | "
+        f"{stats['trap_templates']} sabloane oprite, {stats['trap_blocked']} link-uri respinse"
+    )
+    if traps and args.verbose:
+        for template, st in sorted(crawler.traps.stats().items()):
+            print(f"              {template}: {st['urls']} URL-uri ({st['reason']})")
+    if args.verbose:
+        kinds = {}
+        for url in fetched:
+            m = _TRAP.search(url)
+            if m:
+                kinds[m.group(1)] = kinds.get(m.group(1), 0) + 1
+        print(f"              pagini pe capcana: {kinds}")
+    crawler.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--products", type=int, default=300)
+    ap.add_argument("--budget", type=int, nargs="+", default=[500, 1000])
+    ap.add_argument("--engine", default="threads")
+    ap.add_argument("--order", default="bfs", help="ordinea frontierei: bfs sau priority")
+    ap.add_argument("--verbose", action="store_true", help="afiseaza sabloanele oprite")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.products))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://127.0.0.1:{server.server_port}"
+    print(f"{args.products} produse, {BLOG_PAGES * POSTS_PER_PAGE} articole, ordine {args.order}")
+    try:
+        budgets = args.budget
+        for budget in budgets:
+            args.budget = budget
+            print(f"buget {budget} pagini")
+            run(origin, False, args)
+            run(origin, True, args)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru filtrul de excludere din DomainCrawler.should_crawl_url.
+
+Compara varianta veche (un re.match construit pentru fiecare pattern cu
+'*' si fiecare URL, plus any(endswith) peste EXCLUDED_EXTENSIONS) cu
+ExcludeMatcher (alternanta compilata o data, trie pentru pattern-urile
+literale, extensia cautata intr-un set). Verifica si ca rezultatele sunt
+identice.
+
+Utilizare:
+    python benchmarks/bench_urlfilter.py --patterns 100 --urls 1000000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import EXCLUDED_EXTENSIONS  # noqa: E402
+from utils.urlmatch import ExcludeMatcher  # noqa: E402
+
+_WORDS = [
+    "admin", "login", "logout", "cart", "checkout", "account", "tag", "category",
+    "page", "print", "feed", "api", "search", "wp-admin", "wp-json", "calendar",
+    "archive", "share", "comment", "reply", "preview", "download", "session", "track",
+]
+_SUFFIXES = ["", "/", ".html", ".php", ".pdf", ".PNG", ".zip", ".aspx"]
+
+
+def _legacy_excluded(url_path, patterns):
+    """Codul de dinainte din should_crawl_url (fara verificarile de domeniu)."""
+    for pattern in patterns:
+        if '*' in pattern:
+            regex_pattern = pattern.replace('*', '.*')
+            if re.match(regex_pattern, url_path):
+                return True
+        elif pattern in url_path:
+            return True
+    if any(url_path.lower().endswith(ext) for ext in EXCLUDED_EXTENSIONS):
+        return True
+    return False
+
+
+def _make_patterns(n, rng):
+    patterns = []
+    for i in range(n):
+        word = f"{rng.choice(_WORDS)}-{i}"
+        kind = i % 4
+        if kind == 0:
+            patterns.append(f"/{word}")            # literal
+        elif kind == 1:
+            patterns.append(f"?{word}=")           # literal in query-like path
+        elif kind == 2:
+            patterns.append(f"/{word}/*")          # prefix cu wildcard
+        else:
+            patterns.append(f"*/{word}/*.php")     # wildcard la mijloc
+    return patterns
+
+
+def _make_paths(n, n_patterns, rng):
+    paths = []
+    for _ in range(n):
+        depth = rng.randint(1, 5)
+        segs = [f"{rng.choice(_WORDS)}-{rng.randint(0, n_patterns * 3)}" for _ in range(depth)]
+        paths.append("/" + "/".join(segs) + rng.choice(_SUFFIXES))
+    return paths
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--patterns", type=int, default=100)
+    ap.add_argument("--urls", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    patterns = _make_patterns(args.patterns, rng)
+    paths = _make_paths(args.urls, args.patterns, rng)
+    print(f"{len(patterns)} pattern-uri x {len(paths):,} URL-uri")
+
+    t0 = time.perf_counter()
+    matcher = ExcludeMatcher(patterns, EXCLUDED_EXTENSIONS)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = [matcher.excluded(p) for p in paths]
+    t_new = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    old = [_legacy_excluded(p, patterns) for p in paths]
+    t_old = time.perf_counter() - t0
+
+    mismatches = sum(a != b for a, b in zip(old, new))
+    excluded = sum(new)
+    print(f"  vechi           {t_old:7.2f}s  {1e6 * t_old / len(paths):6.2f} us/URL")
+    print(f"  ExcludeMatcher  {t_new:7.2f}s  {1e6 * t_new / len(paths):6.2f} us/URL"
+          f"  (constructie {1000 * t_build:.1f} ms)  -> {t_old / t_new:.1f}x")
+    print(f"  excluse {excluded:,} ({100.0 * excluded / len(paths):.1f}%), diferente {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
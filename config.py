@@ -12,6 +12,155 @@ DEFAULT_MAX_PAGES = 100      # cate pagini maxim sa scaneze
 DEFAULT_TIMEOUT = 10         # timeout pentru fiecare request HTTP in secunde
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Motorul de crawling folosit din interfata: "sync" (o pagina pe rand, ca
+# pana acum), "threads" (pool de thread-uri, fara dependinte async) sau
+# "async" (asyncio + aiohttp, mai multe request-uri in zbor simultan).
+# Optiunile de mai jos care schimba comportamentul crawl-ului (robots.txt,
+# retry-uri, seed-uri, near-dup, capcane, checkpoint-uri, ordinea frontierei
+# etc.) sunt dezactivate implicit si trebuie activate explicit
+CRAWL_ENGINE = "sync"
+DEFAULT_CONCURRENCY = 16     # request-uri simultane in total
+DEFAULT_PER_HOST_LIMIT = 4   # request-uri simultane catre acelasi host
+DEFAULT_RETRIES = 2          # retry-uri pentru erori de conexiune si 502/503/504
+# Retry-urile crawler-ului si downloader-ului (erori de retea, timeout-uri,
+# 408/429/5xx): backoff exponential cu jitter, cel putin cat cere Retry-After.
+# RESILIENCE_ENABLED activeaza retry-urile si circuit breaker-ul de mai jos
+RESILIENCE_ENABLED = False
+RETRY_BACKOFF = 0.5          # baza backoff-ului, in secunde
+RETRY_MAX_DELAY = 30.0       # asteptarea maxima intre incercari
+# Circuit breaker pe host: dupa BREAKER_THRESHOLD esecuri consecutive (erori
+# de retea, 5xx) hostul nu mai primeste request-uri BREAKER_COOLDOWN secunde,
+# apoi o singura proba; fiecare proba esuata dubleaza pauza
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+BREAKER_MAX_COOLDOWN = 300.0
+# Rata maxima pe host (request-uri pe secunda); None = fara limita de rata.
+# Implicit ritmul il dau DEFAULT_PER_HOST_LIMIT (conexiuni simultane pe host)
+# si latenta serverului, iar Crawl-delay / Request-rate din robots.txt il
+# reduc oricum. O valoare fixa se aplica peste concurenta: cu 10 req/s, mai
+# multe conexiuni pe host nu mai grabesc un crawl pe un singur domeniu
+DEFAULT_HOST_RATE = None
+# Limita de request-uri simultane pe host adaptata din mers (AIMD), comuna
+# crawler-ului si downloader-ului: porneste de la DEFAULT_PER_HOST_LIMIT,
+# creste cu 1 pe fereastra cat latenta e stabila si scade la 429/503,
+# Retry-After sau latenta in crestere
+ADAPTIVE_CONCURRENCY = False
+AIMD_MIN_PER_HOST = 1
+AIMD_MAX_PER_HOST = 32
+AIMD_DECREASE = 0.5          # factorul scaderii multiplicative
+AIMD_LATENCY_TOLERANCE = 2.0  # latenta netezita / latenta de baza peste care limita scade
+# Cache DNS in proces, comun jobului: adresele raman valabile cat TTL-ul
+# inregistrarii (cu dnspython instalat) sau DNS_DEFAULT_TTL secunde
+DNS_CACHE_ENABLED = False
+DNS_DEFAULT_TTL = 60
+DNS_MAX_TTL = 3600
+DNS_NEGATIVE_TTL = 30        # cat se tine minte un host care nu poate fi rezolvat
+# Hosturile noi gasite in pagini (CDN-uri, fonturi, imagini) sunt rezolvate si
+# conectate (TCP + TLS) in fundal, inainte de primul request spre ele
+PREWARM_CONNECTIONS = False
+PREWARM_WORKERS = 4
+PREWARM_TIMEOUT = 5.0
+# HTTP/2 prin httpx + h2 (optionale) pentru crawler, downloader si seeder:
+# request-urile spre un host impart o singura conexiune; serverele fara
+# HTTP/2 raman pe HTTP/1.1 (negociat prin ALPN). Motorul async trimite atunci
+# request-urile prin sesiunea comuna, in thread-uri (aiohttp nu are HTTP/2)
+HTTP2_ENABLED = False
+HTTP2_CLEARTEXT = False      # HTTP/2 si pentru http:// (h2c), fara negociere
+RESPECT_ROBOTS = False       # respecta robots.txt (Disallow, Crawl-delay, Request-rate)
+ROBOTS_TIMEOUT = 10          # timeout pentru descarcarea robots.txt
+SEED_FRONTIER = False        # sitemap-uri si cai ghicite in frontiera inainte de crawl
+MAX_PAGE_SIZE = 10 * 1024 * 1024  # paginile mai mari sunt abandonate in timpul descarcarii
+# Link-uri de pagina care raspund cu altceva decat HTML (ex. PDF fara extensie
+# in URL): corpul nu mai este descarcat de crawler; "skip" le ignora,
+# "download" le preda downloader-ului de resurse
+NON_HTML_PAGES = "skip"
+# Pagini aproape identice (SimHash pe textul vizibil): o pagina la cel mult
+# NEAR_DUP_DISTANCE biti (din 64) de una deja descarcata nu mai este scrisa,
+# ramane un alias spre original, iar link-urile ei sunt urmate abia la final
+NEAR_DUP_DETECTION = False
+NEAR_DUP_DISTANCE = 3
+NEAR_DUP_MIN_WORDS = 20      # paginile cu mai putine cuvinte distincte nu sunt comparate
+# Capcane pentru crawler (calendare, paginare fara sfarsit, combinatii de
+# query): URL-urile sunt grupate pe sabloane (numerele si ID-urile din path
+# inlocuite, cheile de query fara valori); un sablon cu prea multe URL-uri
+# unice, care creste prea repede sau care se genereaza singur din pagina in
+# pagina este oprit
+TRAP_DETECTION = False
+TRAP_TEMPLATE_LIMIT = 1000       # URL-uri unice pe sablon
+TRAP_MAX_GROWTH = 5.0            # URL-uri noi ale sablonului pe pagina scanata a lui
+TRAP_MIN_PAGES = 20              # pagini ale sablonului inainte de a judeca cresterea
+TRAP_MAX_GENERATIONS = 50        # pagini ale sablonului descoperite una din alta, in lant
+TRAP_MAX_SEGMENT_REPEAT = 2      # aparitii ale aceluiasi segment in path (/a/b/a/b/a)
+TRAP_MAX_QUERY_PARAMS = 12
+TRAP_MAX_URL_LENGTH = 1024
+TRAP_DATE_YEARS_AHEAD = 2        # datele din URL mai departe in viitor: calendar fara sfarsit
+SITEMAP_MAX_FILES = 50       # cate fisiere sitemap (inclusiv din index-uri) sunt citite
+PROBE_WORKERS = 8            # request-uri HEAD simultane pentru caile ghicite
+
+# Backend-ul pentru extragerea link-urilor in crawler: "bs4", "html.parser",
+# "lxml" sau "auto" (lxml daca e instalat, altfel tokenizer-ul din stdlib)
+EXTRACTOR_BACKEND = "bs4"
+
+# Politica pentru slash-ul final la canonicalizarea URL-urilor de pagini:
+# "strip" (/a/ -> /a), "add" (/a -> /a/) sau "keep" (neschimbat). Forma
+# canonica este doar cheia de deduplicare; paginile se descarca de la adresa
+# originala. "strip"/"add" colapseaza /a si /a/, dar pe multe servere sunt
+# pagini diferite (sau una redirectioneaza spre cealalta)
+CANON_TRAILING_SLASH = "keep"
+
+# Deduplicarea frontierei: "exact" (amprente de 64 biti, ~10 octeti/URL)
+# sau "bloom" (filtru Bloom, ~2 octeti/URL, rar poate sari un URL nou)
+FRONTIER_DEDUP = "exact"
+
+# Ordinea frontierei: "bfs" (in ordinea descoperirii) sau "priority" (intai
+# URL-ul cu scorul cel mai bun: adancime mica, multe link-uri spre el, path).
+# Conteaza cand max_pages opreste crawl-ul inainte de epuizarea site-ului.
+FRONTIER_ORDER = "bfs"
+# (pattern, pondere) adunate la scor; sintaxa pattern-urilor de excludere,
+# potrivite pe path + query (negativ = mai tarziu)
+FRONTIER_PATH_WEIGHTS = [
+    ("*/page/*", -2.0), ("*page=*", -2.0),
+    ("*/tag/*", -1.5), ("*/tags/*", -1.5), ("*/author/*", -1.5),
+    ("*/archive*", -1.0), ("*/search*", -2.0), ("*/feed*", -3.0),
+    ("*/print*", -2.0), ("*replytocom=*", -3.0),
+]
+
+# Stocarea starii crawl-ului: "memory" sau "sqlite" (frontiera, URL-urile
+# vizitate si paginile pe disc, memorie limitata pentru crawl-uri foarte mari)
+CRAWL_STORAGE = "memory"
+
+# Cum ajung paginile pe disc: "streaming" (fiecare pagina este rescrisa si
+# salvata imediat ce e descarcata, in memorie raman doar metadate), "staged"
+# (crawl, rescriere si download in paralel, legate prin cozi limitate) sau
+# "batch" (toate paginile sunt pastrate pana la finalul crawl-ului)
+PIPELINE_MODE = "batch"
+PROCESS_WORKERS = 2       # thread-uri pentru rescrierea paginilor (staged)
+DOWNLOAD_WORKERS = 8      # thread-uri pentru descarcarea resurselor (staged)
+STAGE_QUEUE_SIZE = 64     # capacitatea cozilor dintre stagii (backpressure)
+
+# Checkpoint-uri pentru reluarea joburilor intrerupte: starea se salveaza in
+# folderul de iesire; la anulare folderul se pastreaza, iar un job nou pentru
+# acelasi URL si acelasi folder continua de unde a ramas
+CHECKPOINT_ENABLED = False
+CHECKPOINT_INTERVAL = 10.0            # secunde intre doua confirmari pe disc
+CHECKPOINT_FILE = ".fwc_checkpoint.sqlite"
+
+# Re-snapshot incremental: jobul rescrie ultimul folder de iesire al aceluiasi
+# URL in loc sa creeze unul nou; validatorii fiecarui URL (ETag,
+# Last-Modified, hash) raman in folder, iar paginile si resursele
+# nemodificate (304) nu mai sunt descarcate si nici rescrise
+RESNAPSHOT = False
+VALIDATORS_FILE = ".fwc_validators.sqlite"
+
+# Cache HTTP pe disc, comun tuturor joburilor: corpuri stocate dupa hash-ul
+# continutului, prospetime dupa Cache-Control / Expires, evictie LRU. Cheia
+# este doar URL-ul, deci raspunsurile cu Vary (in afara de Accept-Encoding)
+# nu sunt pastrate. Dezactivat implicit: cache-ul ramane in HTTP_CACHE_DIR
+# (in afara folderului de iesire) si de la un job la altul
+HTTP_CACHE_ENABLED = False
+HTTP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".fastwebcloner", "http-cache")
+HTTP_CACHE_MAX_MB = 512
+
 # Dimensiuni fereastra principala
 WINDOW_WIDTH = 950          # latime initiala
 WINDOW_HEIGHT = 820         # inaltime initiala  
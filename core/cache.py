@@ -0,0 +1,339 @@
+# core/cache.py
+# -*- coding: utf-8 -*-
+"""
+Cache HTTP pe disc, comun tuturor joburilor (config.HTTP_CACHE_DIR).
+
+Corpurile raspunsurilor sunt stocate dupa hash-ul continutului
+(objects/ab/abcdef...), deci o resursa servita de acelasi CDN pentru mai
+multe site-uri ocupa loc o singura data. Un index SQLite leaga URL-ul
+canonic de hash, de header-ele utile si de momentul expirarii.
+
+Prospetimea urmeaza regulile unui cache privat (RFC 9111, simplificat):
+
+* no-store / Vary     -> raspunsul nu este pastrat; Vary: Accept-Encoding
+                        nu conteaza (corpul e pastrat decodat), dar orice
+                        alt header (Cookie, User-Agent, *) poate schimba
+                        raspunsul de la un job la altul;
+* no-cache            -> pastrat, dar revalidat la fiecare folosire;
+* max-age, altfel Expires - Date, altfel euristic 10% din
+  Date - Last-Modified (cel mult o zi); Age se scade din durata.
+
+Pentru un raspuns venit dupa redirect se pastreaza si URL-ul final, ca
+legaturile relative ale paginii servite din cache sa fie rezolvate fata de
+el, ca la un raspuns din retea.
+
+O intrare proaspata este servita fara retea; una expirata, dar cu ETag sau
+Last-Modified, produce un request conditional, iar un 304 o reimprospateaza.
+Cand dimensiunea totala trece de max_bytes sunt sterse intrarile folosite
+cel mai demult (LRU), iar obiectele ramase fara URL-uri sunt sterse de pe disc.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_MB
+from utils.urlcanon import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# header-e pastrate impreuna cu corpul (Content-Encoding nu: corpul e decodat)
+_KEPT_HEADERS = ("content-type", "etag", "last-modified", "date", "cache-control", "expires")
+_HEURISTIC_MAX = 24 * 3600.0
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.I)
+# header-e din Vary care nu schimba ce se pastreaza
+_IGNORED_VARY = frozenset({"", "accept-encoding"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    final_url TEXT,
+    headers TEXT NOT NULL,
+    expires REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash);
+CREATE TABLE IF NOT EXISTS objects (hash TEXT PRIMARY KEY, size INTEGER NOT NULL);
+"""
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _varies(headers) -> bool:
+    """Raspunsul depinde de header-e ale request-ului pe care cache-ul nu le tine."""
+    # aiohttp (CIMultiDict) nu uneste header-ele repetate, requests da
+    values = headers.getall("vary", ()) if hasattr(headers, "getall") else [headers.get("vary") or ""]
+    names = {name.strip().lower() for value in values for name in value.split(",")}
+    return not names <= _IGNORED_VARY
+
+
+def freshness_lifetime(headers) -> Optional[float]:
+    """Secunde de prospetime ale unui raspuns; None daca nu poate fi pastrat."""
+    cache_control = (headers.get("cache-control") or "").lower()
+    if "no-store" in cache_control or _varies(headers):
+        return None
+    if "no-cache" in cache_control:
+        lifetime = 0.0
+    else:
+        match = _MAX_AGE.search(cache_control)
+        date = _http_date(headers.get("date")) or time.time()
+        if match:
+            lifetime = float(match.group(1))
+        elif headers.get("expires") is not None:
+            expires = _http_date(headers.get("expires"))
+            lifetime = max(0.0, expires - date) if expires else 0.0  # Expires invalid = expirat
+        else:
+            modified = _http_date(headers.get("last-modified"))
+            lifetime = min(0.1 * (date - modified), _HEURISTIC_MAX) if modified and modified < date else 0.0
+    try:
+        lifetime -= float(headers.get("age") or 0)
+    except ValueError:
+        pass
+    lifetime = max(0.0, lifetime)
+    # fara prospetime si fara validatori intrarea nu ar putea fi folosita niciodata
+    if not lifetime and not (headers.get("etag") or headers.get("last-modified")):
+        return None
+    return lifetime
+
+
+def decode_body(body: bytes, headers) -> str:
+    """Textul unui corp din cache, decodat ca requests.Response.text."""
+    encoding = get_encoding_from_headers(headers) or "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class CachedResponse:
+    """Un raspuns 200 din cache: URL final, header-e, corp si daca e inca proaspat."""
+
+    __slots__ = ("url", "final_url", "headers", "body", "fresh")
+
+    def __init__(self, url: str, headers: CaseInsensitiveDict, body: bytes, fresh: bool,
+                 final_url: Optional[str] = None):
+        self.url = url
+        self.final_url = final_url or url  # dupa redirect-uri
+        self.headers = headers
+        self.body = body
+        self.fresh = fresh
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache-ul de raspunsuri, sigur din mai multe thread-uri.
+
+    Args:
+        folder: directorul cache-ului (index.sqlite + objects/)
+        max_bytes: dimensiunea maxima a corpurilor stocate
+        commit_every: cate scrieri in index se strang inainte de commit
+    """
+
+    def __init__(
+        self,
+        folder: str = HTTP_CACHE_DIR,
+        max_bytes: int = HTTP_CACHE_MAX_MB * 1024 * 1024,
+        commit_every: int = 200,
+    ):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        os.makedirs(os.path.join(folder, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(folder, "index.sqlite"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(entries)")}
+        if "final_url" not in columns:  # index creat de o versiune anterioara
+            self.conn.execute("ALTER TABLE entries ADD COLUMN final_url TEXT")
+        self.conn.commit()
+        self._uncommitted = 0
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+        self.hits = 0          # servite fara retea
+        self.revalidations = 0  # 304 la un request conditional din cache
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------ #
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Intrarea pentru URL (proaspata sau doar revalidabila) sau None."""
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT hash, headers, expires, final_url FROM entries WHERE url = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, key))
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        digest, headers, expires, final_url = row
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                body = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+                self._execute("DELETE FROM entries WHERE url = ?", (key,))
+            return None
+        fresh = expires > now
+        if fresh:
+            with self._lock:
+                self.hits += 1
+        return CachedResponse(url, CaseInsensitiveDict(json.loads(headers)), body, fresh, final_url)
+
+    def store(self, url: str, headers, body: bytes, final_url: Optional[str] = None) -> bool:
+        """
+        Pastreaza un raspuns 200 la GET daca regulile de cache o permit;
+        final_url este URL-ul la care s-a ajuns dupa redirect-uri.
+        """
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None:
+            return False
+        kept = {name: headers[name] for name in _KEPT_HEADERS if headers.get(name) is not None}
+        digest = hashlib.blake2b(body, digest_size=20).hexdigest()
+        path = self._object_path(digest)
+        now = time.time()
+        with self._lock:
+            known = self.conn.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone()
+        if known is None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(body)
+                os.replace(tmp, path)  # alt thread poate scrie acelasi obiect simultan
+            except OSError as e:
+                logger.warning("Cache: nu am putut scrie %s: %s", path, e)
+                return False
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone() is None:
+                self._execute("INSERT INTO objects (hash, size) VALUES (?, ?)", (digest, len(body)))
+                self.total_bytes += len(body)
+            old = self.conn.execute(
+                "SELECT hash FROM entries WHERE url = ?", (canonicalize_url(url),)
+            ).fetchone()
+            self._execute(
+                "INSERT OR REPLACE INTO entries (url, hash, final_url, headers, expires, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (canonicalize_url(url), digest, final_url if final_url != url else None,
+                 json.dumps(kept), now + lifetime, now),
+            )
+            if old is not None and old[0] != digest:
+                self._drop_orphan(old[0])
+            self.stored += 1
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def revalidated(self, url: str, headers) -> None:
+        """Un 304 pentru o intrare expirata: noua durata de prospetime."""
+        key = canonicalize_url(url)
+        with self._lock:
+            self.revalidations += 1
+            row = self.conn.execute("SELECT headers FROM entries WHERE url = ?", (key,)).fetchone()
+            if row is None:
+                return
+            kept = CaseInsensitiveDict(json.loads(row[0]))
+            for name in _KEPT_HEADERS:
+                if name != "content-type" and headers.get(name) is not None:
+                    kept[name] = headers[name]
+            lifetime = freshness_lifetime(kept) or 0.0
+            self._execute(
+                "UPDATE entries SET headers = ?, expires = ? WHERE url = ?",
+                (json.dumps(dict(kept.lower_items())), time.time() + lifetime, key),
+            )
+
+    # ------------------------------------------------------------------ #
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.folder, "objects", digest[:2], digest)
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        """Scriere in index (apelant tine _lock); commit la fiecare commit_every."""
+        self.conn.execute(sql, params)
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def _drop_orphan(self, digest: str) -> None:
+        """Sterge obiectul daca niciun URL nu il mai foloseste (apelant tine _lock)."""
+        if self.conn.execute("SELECT 1 FROM entries WHERE hash = ? LIMIT 1", (digest,)).fetchone():
+            return
+        row = self.conn.execute("SELECT size FROM objects WHERE hash = ?", (digest,)).fetchone()
+        self._execute("DELETE FROM objects WHERE hash = ?", (digest,))
+        if row is not None:
+            self.total_bytes -= row[0]
+        try:
+            os.remove(self._object_path(digest))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """LRU pana la 90% din max_bytes, ca evictia sa nu ruleze la fiecare store."""
+        target = 0.9 * self.max_bytes
+        while self.total_bytes > target:
+            rows = self.conn.execute(
+                "SELECT url, hash FROM entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for url, digest in rows:
+                self._execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._drop_orphan(digest)
+                self.evicted += 1
+                if self.total_bytes <= target:
+                    break
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "stored": self.stored,
+                "evicted": self.evicted,
+                "total_bytes": self.total_bytes,
+            }
+
+    def close(self) -> None:
+        if self.conn is None:
+            return
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,234 @@
+# core/checkpoint.py
+# -*- coding: utf-8 -*-
+"""
+Checkpoint si reluare pentru joburile de clonare intrerupte.
+
+Starea jobului este jurnalizata incremental intr-o baza SQLite din folderul
+de iesire (config.CHECKPOINT_FILE):
+
+    urls       fiecare URL pus in frontiera, cu adancimea si starea lui
+               (queued / done / failed / written)
+    pages      HTML-ul paginilor descarcate (SQLitePageStore)
+    resources  resursele gasite si daca au fost deja descarcate
+    meta       URL-ul jobului si contoarele crawler-ului
+
+Schimbarile de stare sunt tinute in buffere si confirmate cel mult la
+`interval` secunde, deci o oprire brusca pierde doar ultimele secunde de
+lucru. La reluare, URL-urile ramase 'queued' (inclusiv cele aflate in zbor
+la oprire) si cele esuate revin in frontiera; paginile descarcate sau deja
+scrise si resursele descarcate sunt sarite.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+from config import CHECKPOINT_FILE, CHECKPOINT_INTERVAL
+from core.frontier import SQLitePageStore
+from utils.urlcanon import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Starile unui URL de pagina
+QUEUED = "queued"
+DONE = "done"        # descarcat (HTML stocat sau raspuns non-HTML)
+FAILED = "failed"
+WRITTEN = "written"  # procesat si scris in folderul de iesire
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY, depth INTEGER NOT NULL, status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (url TEXT PRIMARY KEY, done INTEGER NOT NULL);
+"""
+
+
+def checkpoint_path(folder: str) -> str:
+    return os.path.join(folder, CHECKPOINT_FILE)
+
+
+def find_resumable_job(output_folder: str, job_url: str) -> Optional[str]:
+    """
+    Cauta printre folder, folder_1, folder_2, ... (numele generate de
+    get_unique_folder_name) un job neterminat pentru acelasi URL.
+    """
+    candidate, counter = output_folder, 0
+    while os.path.isdir(candidate):
+        path = checkpoint_path(candidate)
+        if os.path.exists(path):
+            try:
+                conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                try:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'job_url'").fetchone()
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Checkpoint ilizibil %s: %s", path, e)
+                row = None
+            if row is not None and row[0] == job_url:
+                return candidate
+        counter += 1
+        candidate = f"{output_folder}_{counter}"
+    return None
+
+
+class CrawlCheckpoint:
+    """
+    Jurnalul de stare al unui job, in `<folder>/CHECKPOINT_FILE`.
+
+    Args:
+        folder: folderul de iesire al jobului
+        job_url: URL-ul cerut de utilizator (identifica jobul la reluare)
+        interval: secunde intre doua confirmari pe disc
+    """
+
+    def __init__(self, folder: str, job_url: str, interval: float = CHECKPOINT_INTERVAL):
+        self.path = checkpoint_path(folder)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.pages = SQLitePageStore(self.conn)
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'job_url'").fetchone()
+        self.resumed = row is not None
+        if not self.resumed:
+            with self.conn:
+                self.conn.execute("INSERT INTO meta (key, value) VALUES ('job_url', ?)", (job_url,))
+
+        self._url_buf = []   # (url, depth, status)
+        self._res_buf = []   # (url, done)
+        self._last_flush = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    # Evenimente (apelate de crawler / procesare / downloader)
+    # ------------------------------------------------------------------ #
+    def url_queued(self, url: str, depth: int) -> None:
+        self._add_url(url, depth, QUEUED)
+
+    def url_done(self, url: str, depth: int) -> None:
+        self._add_url(url, depth, DONE)
+
+    def url_failed(self, url: str) -> None:
+        self._add_url(url, 0, FAILED)
+
+    def page_written(self, url: str) -> None:
+        self._add_url(url, 0, WRITTEN)
+
+    def resources_found(self, urls: Iterable[str]) -> None:
+        urls = [(url, 0) for url in urls]
+        with self._lock:
+            self._res_buf.extend(urls)
+
+    def resource_done(self, url: str) -> None:
+        with self._lock:
+            self._res_buf.append((url, 1))
+
+    def _add_url(self, url: str, depth: int, status: str) -> None:
+        # sub _lock: flush inlocuieste bufferele, iar o adaugare facuta intre
+        # citirea lui self._url_buf si append s-ar pierde in lista veche
+        with self._lock:
+            self._url_buf.append((url, depth, status))
+
+    def tick(self, crawler=None) -> None:
+        """Confirma starea pe disc daca a trecut intervalul de checkpoint."""
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush(crawler)
+
+    def flush(self, crawler=None) -> None:
+        """Scrie bufferele (si contoarele crawler-ului) intr-o tranzactie."""
+        with self._lock:
+            url_buf, self._url_buf = self._url_buf, []
+            if self.conn is None:
+                return
+            res_buf, self._res_buf = self._res_buf, []
+            with self.conn:
+                # starea se actualizeaza, adancimea ramane cea de la inserare
+                self.conn.executemany(
+                    "INSERT INTO urls (url, depth, status) VALUES (?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET status = excluded.status",
+                    url_buf,
+                )
+                self.conn.executemany(
+                    "INSERT INTO resources (url, done) VALUES (?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET done = MAX(done, excluded.done)",
+                    res_buf,
+                )
+                if crawler is not None:
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        [("pages_found", str(crawler.pages_found)),
+                         ("pages_processed", str(crawler.pages_processed)),
+                         ("urls_collapsed", str(crawler.urls_collapsed))],
+                    )
+            self._last_flush = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    # Reluare
+    # ------------------------------------------------------------------ #
+    def restore(self, crawler) -> None:
+        """Reface frontiera, URL-urile vizitate, resursele si contoarele."""
+        requeued = skipped = 0
+        for url, depth, status in self.conn.execute(
+            "SELECT url, depth, status FROM urls ORDER BY rowid"
+        ):
+            if status in (QUEUED, FAILED):
+                crawler.url_queue.push(url, depth)
+                requeued += 1
+            else:
+                crawler.visited_urls.add(canonicalize_url(url))
+                crawler.url_queue.mark_seen(url)
+                skipped += 1
+                if status == WRITTEN and crawler.page_sink is not None:
+                    crawler.page_index[url] = depth
+        crawler.resources.update(url for (url,) in self.conn.execute("SELECT url FROM resources"))
+
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        crawler.pages_found = int(meta.get("pages_found", requeued + skipped))
+        crawler.urls_collapsed = int(meta.get("urls_collapsed", 0))
+        crawler.pages_processed = int(meta.get("pages_processed", len(self.pages)))
+        logger.info(
+            "Reluare din checkpoint: %d URL-uri terminate, %d de reluat, %d resurse",
+            skipped, requeued, len(crawler.resources),
+        )
+
+    def is_written(self, url: str) -> bool:
+        with self._lock:
+            row = self.conn.execute("SELECT status FROM urls WHERE url = ?", (url,)).fetchone()
+        return row is not None and row[0] == WRITTEN
+
+    def is_downloaded(self, url: str) -> bool:
+        with self._lock:  # apelat si din workerii de download
+            row = self.conn.execute("SELECT done FROM resources WHERE url = ?", (url,)).fetchone()
+        return bool(row and row[0])
+
+    # ------------------------------------------------------------------ #
+    def close(self) -> None:
+        """Scrie ce a ramas in buffere; checkpoint-ul ramane pentru reluare."""
+        if self.conn is None:
+            return
+        try:
+            self.flush()
+            self.pages.flush()
+        finally:
+            self.conn.close()
+            self.conn = None
+
+    def discard(self) -> None:
+        """Jobul s-a terminat: sterge checkpoint-ul din folderul de iesire."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
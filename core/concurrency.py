@@ -0,0 +1,271 @@
+# core/concurrency.py
+# -*- coding: utf-8 -*-
+"""
+Limite adaptive de request-uri simultane pe host (AIMD), comune crawler-ului
+si downloader-ului de resurse.
+
+Fiecare host porneste de la DEFAULT_PER_HOST_LIMIT, iar limita se ajusteaza
+dupa raspunsuri, ca fereastra de congestie TCP:
+
+* crestere aditiva: +1 pe "fereastra" (1/limita la fiecare raspuns reusit),
+  doar cat timp hostul chiar foloseste limita si latenta e stabila;
+* scadere multiplicativa (x AIMD_DECREASE) la 429/503, Retry-After, erori
+  de retea sau cand latenta netezita trece de AIMD_LATENCY_TOLERANCE ori
+  latenta de baza (minimul ultimelor raspunsuri). Raspunsurile la cereri
+  pornite inainte de o scadere nu mai scad limita inca o data;
+* Retry-After opreste hostul pana la expirare.
+
+Schimbarile limitei (intregi) sunt pastrate in history(host), iar stats()
+si log_stats() arata unde a convers fiecare host.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from config import (
+    AIMD_DECREASE,
+    AIMD_LATENCY_TOLERANCE,
+    AIMD_MAX_PER_HOST,
+    AIMD_MIN_PER_HOST,
+    DEFAULT_PER_HOST_LIMIT,
+)
+
+logger = logging.getLogger(__name__)
+
+_OVERLOAD_STATUSES = (429, 503)
+_LATENCY_WINDOW = 100    # raspunsuri din care se ia latenta de baza
+_LATENCY_ALPHA = 0.2     # netezirea latentei curente (EWMA)
+_MIN_SAMPLES = 5         # fara atatea raspunsuri latenta nu scade limita
+_LATENCY_FLOOR = 0.02    # sub 20 ms de baza, zgomotul ar scadea limita degeaba
+_MAX_RETRY_AFTER = 120.0
+_HISTORY_SIZE = 1000
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Secundele dintr-un Retry-After (numar sau data HTTP); None daca lipseste."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class _HostLimit:
+    __slots__ = ("limit", "in_flight", "samples", "smoothed", "paused_until",
+                 "decreased_at", "increases", "decreases", "peak", "history")
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.samples: deque = deque(maxlen=_LATENCY_WINDOW)
+        self.smoothed: Optional[float] = None
+        self.paused_until = 0.0
+        self.decreased_at = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.peak = int(limit)
+        self.history: deque = deque(maxlen=_HISTORY_SIZE)
+
+
+class AIMDController:
+    """
+    Limitele pe host, sigure din mai multe thread-uri.
+
+    Sloturile se iau cu try_acquire() (planificatorul crawler-ului) sau
+    acquire() (thread-urile downloader-ului) si se elibereaza cu release();
+    observe() primeste fiecare raspuns (sau eroare) si ajusteaza limita.
+
+    Args:
+        initial: limita de pornire pentru un host nou
+        min_limit / max_limit: intervalul in care se misca limita
+        decrease: factorul scaderii multiplicative
+        latency_tolerance: latenta netezita / latenta de baza peste care
+            limita scade
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_PER_HOST_LIMIT,
+        min_limit: int = AIMD_MIN_PER_HOST,
+        max_limit: int = AIMD_MAX_PER_HOST,
+        decrease: float = AIMD_DECREASE,
+        latency_tolerance: float = AIMD_LATENCY_TOLERANCE,
+    ):
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.initial = min(max(int(initial), self.min_limit), self.max_limit)
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self._hosts: Dict[str, _HostLimit] = {}
+        self._cond = threading.Condition()
+        self._start = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    # Sloturi
+    # ------------------------------------------------------------------ #
+    def limit(self, host: str) -> int:
+        with self._cond:
+            return int(self._host(host).limit)
+
+    def available(self, host: str) -> bool:
+        """Hostul poate primi acum inca un request."""
+        with self._cond:
+            return self._available(self._host(host), time.monotonic())
+
+    def pause_remaining(self, host: str) -> float:
+        """Secunde pana la expirarea unui Retry-After (0 daca nu e oprit)."""
+        with self._cond:
+            state = self._hosts.get(host)
+            return max(0.0, state.paused_until - time.monotonic()) if state else 0.0
+
+    def try_acquire(self, host: str) -> bool:
+        with self._cond:
+            state = self._host(host)
+            if not self._available(state, time.monotonic()):
+                return False
+            state.in_flight += 1
+            return True
+
+    def acquire(self, host: str, timeout: Optional[float] = None) -> bool:
+        """Asteapta un slot liber; False daca `timeout` expira inainte."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            state = self._host(host)
+            while True:
+                now = time.monotonic()
+                if self._available(state, now):
+                    state.in_flight += 1
+                    return True
+                wait = max(state.paused_until - now, 0.0) or None
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    wait = min(wait or deadline - now, deadline - now)
+                self._cond.wait(wait)
+
+    def release(self, host: str) -> None:
+        with self._cond:
+            state = self._hosts.get(host)
+            if state is not None and state.in_flight > 0:
+                state.in_flight -= 1
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------------ #
+    # Reactia la raspunsuri
+    # ------------------------------------------------------------------ #
+    def observe(
+        self,
+        host: str,
+        started: float,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        error: bool = False,
+    ) -> None:
+        """
+        Un raspuns (sau o eroare de retea) pentru un request pornit la
+        `started` (time.monotonic()); latenta este timpul pana la header-e.
+        """
+        now = time.monotonic()
+        with self._cond:
+            state = self._host(host)
+            pause = parse_retry_after(retry_after) if retry_after else None
+            if pause:
+                state.paused_until = max(state.paused_until, now + min(pause, _MAX_RETRY_AFTER))
+
+            if error or status in _OVERLOAD_STATUSES or pause:
+                reason = "eroare" if error else f"HTTP {status}" if status in _OVERLOAD_STATUSES else "Retry-After"
+                self._decrease(state, host, started, now, reason)
+                return
+
+            latency = now - started
+            state.samples.append(latency)
+            state.smoothed = latency if state.smoothed is None else (
+                _LATENCY_ALPHA * latency + (1 - _LATENCY_ALPHA) * state.smoothed
+            )
+            if len(state.samples) >= _MIN_SAMPLES:
+                base = min(state.samples)
+                if state.smoothed > self.latency_tolerance * max(base, _LATENCY_FLOOR):
+                    self._decrease(state, host, started, now, "latenta")
+                    return
+            # crestere doar daca limita a fost folosita (altfel nu stim nimic despre ea)
+            if state.in_flight + 1 >= int(state.limit) and state.limit < self.max_limit:
+                before = int(state.limit)
+                state.limit = min(self.max_limit, state.limit + 1.0 / state.limit)
+                if int(state.limit) != before:
+                    state.increases += 1
+                    state.peak = max(state.peak, int(state.limit))
+                    self._changed(state, host, now, "crestere")
+                    self._cond.notify_all()
+
+    def _decrease(self, state: _HostLimit, host: str, started: float, now: float, reason: str) -> None:
+        # o singura scadere pe "fereastra": cererile pornite inainte de ultima
+        # scadere au fost trimise cu limita veche
+        if started < state.decreased_at:
+            return
+        new_limit = max(float(self.min_limit), state.limit * self.decrease)
+        state.decreased_at = now
+        # latenta netezita porneste din nou de la baza, altfel scaderea s-ar repeta
+        state.smoothed = min(state.samples) if state.samples else None
+        if new_limit < state.limit:
+            changed = int(new_limit) != int(state.limit)
+            state.limit = new_limit
+            state.decreases += 1
+            if changed:
+                self._changed(state, host, now, reason)
+
+    def _changed(self, state: _HostLimit, host: str, now: float, reason: str) -> None:
+        state.history.append((now - self._start, int(state.limit), reason))
+        logger.debug("Limita %s: %d (%s)", host, int(state.limit), reason)
+
+    # ------------------------------------------------------------------ #
+    def _host(self, host: str) -> _HostLimit:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostLimit(float(self.initial))
+            state.history.append((time.monotonic() - self._start, self.initial, "start"))
+        return state
+
+    @staticmethod
+    def _available(state: _HostLimit, now: float) -> bool:
+        return now >= state.paused_until and state.in_flight < int(state.limit)
+
+    def history(self, host: str) -> List[Tuple[float, int, str]]:
+        """(secunde de la pornire, limita, motiv) pentru fiecare schimbare."""
+        with self._cond:
+            state = self._hosts.get(host)
+            return list(state.history) if state else []
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._cond:
+            return {
+                host: {
+                    "limit": int(state.limit),
+                    "peak": state.peak,
+                    "in_flight": state.in_flight,
+                    "increases": state.increases,
+                    "decreases": state.decreases,
+                    "base_latency_ms": 1000.0 * min(state.samples) if state.samples else 0.0,
+                    "latency_ms": 1000.0 * (state.smoothed or 0.0),
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def log_stats(self) -> None:
+        """Scrie limitele la care a ajuns fiecare host."""
+        for host, st in sorted(self.stats().items()):
+            logger.info(
+                "Concurenta %s: limita %d (maxim %d), %d cresteri, %d scaderi, "
+                "latenta %.0f ms (baza %.0f ms)",
+                host, st["limit"], st["peak"], st["increases"], st["decreases"],
+                st["latency_ms"], st["base_latency_ms"],
+            )
@@ -2,19 +2,547 @@
 Motor de crawling pentru scanarea domeniilor web
 """
 
-import re
 import time
+import asyncio
+import heapq
 import logging
-from collections import deque
-from urllib.parse import urlparse, urljoin
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
 import requests
-from bs4 import BeautifulSoup
 
-from config import DEFAULT_USER_AGENT, DEFAULT_TIMEOUT, EXCLUDED_EXTENSIONS
+try:
+    import aiohttp
+except ImportError:  # motorul async foloseste requests in thread-uri
+    aiohttp = None
+
+from config import (
+    DEFAULT_USER_AGENT, DEFAULT_TIMEOUT, EXCLUDED_EXTENSIONS,
+    DEFAULT_CONCURRENCY, DEFAULT_PER_HOST_LIMIT,
+)
 import config
+from core.cache import decode_body
+from core.dnscache import aiohttp_resolver
+from core.extractor import extract_css_urls, get_extractor
+from core.frontier import (
+    FRONTIER_ORDERS, FingerprintSet, Frontier, PriorityFrontier, SQLiteCrawlStore, UrlScorer,
+)
+from core.neardup import SimHashIndex, page_words, simhash
+from core.resilience import CircuitOpenError, retry_delay, sleep as retry_sleep, sleep_async
+from core.seeder import SiteSeeder
+from core.snapshot import NOT_MODIFIED
+from core.traps import TrapDetector
+from core.transport import PooledSession
+from utils.urlcanon import canonicalize_url
+from utils.urlmatch import ExcludeMatcher
 
 logger = logging.getLogger(__name__)
 
+# Motoare de crawling disponibile
+CRAWL_ENGINES = ('sync', 'threads', 'async')
+
+# Unde se tine starea crawl-ului (frontiera, vizitate, pagini)
+CRAWL_STORAGES = ('memory', 'sqlite')
+
+# Cate URL-uri poate tine planificatorul in cozile pe host (restul raman in frontiera)
+_SCHEDULER_BUFFER = 4096
+
+# Cat se asteapta cel mult inainte de a reverifica hosturile (secunde)
+_MAX_IDLE_WAIT = 0.5
+
+# Ce se face cu link-urile de pagina care raspund cu altceva decat HTML
+NON_HTML_MODES = ('skip', 'download')
+
+# Rezultatul _fetch pentru un raspuns care nu e HTML (abandonat dupa header-e
+# sau dupa primii octeti)
+NON_HTML = object()
+
+# Rezultatul _fetch cand jobul a fost anulat in pauza dintre incercari: pagina
+# nu a fost descarcata, deci ramane in coada checkpoint-ului pentru reluare
+NOT_FETCHED = object()
+
+_READ_CHUNK = 64 * 1024
+_SNIFF_BYTES = 512
+# Content-Type care nu spune nimic despre continut: decid primii octeti
+_UNKNOWN_TYPES = ('', 'application/octet-stream', 'application/unknown', 'unknown/unknown', '*/*')
+# Semnaturile HTML din algoritmul de sniffing WHATWG (dupa BOM si spatii)
+_HTML_SIGNATURE = re.compile(
+    rb'\s*(?:<!--|<(?:!doctype\s+html|html|head|body|script|iframe|style|title'
+    rb'|table|div|font|h1|br|a|b|p)[\s>])',
+    re.I,
+)
+
+
+def _content_kind(headers):
+    """'html', 'sniff' (tip necunoscut) sau 'non-html', dupa Content-Type"""
+    content_type = headers.get('content-type', '').lower()
+    if 'text/html' in content_type:
+        return 'html'
+    if content_type.split(';')[0].strip() in _UNKNOWN_TYPES:
+        return 'sniff'
+    return 'non-html'
+
+
+def _looks_like_html(head):
+    """Primii octeti ai unui corp fara Content-Type util incep ca HTML"""
+    return _HTML_SIGNATURE.match(head.removeprefix(b'\xef\xbb\xbf')) is not None
+
+
+class _BodyReader:
+    """
+    Corpul unei pagini citit in flux. Tipul se decide din header-e sau, daca
+    Content-Type lipseste, din primii _SNIFF_BYTES octeti; citirea se
+    opreste la primul semn ca raspunsul nu e HTML sau depaseste max_size.
+    """
+
+    __slots__ = ('max_size', 'state', 'chunks', 'size')
+
+    def __init__(self, headers, max_size):
+        self.max_size = max_size
+        self.chunks = []
+        self.size = 0
+        self.state = _content_kind(headers)  # + 'too-large'
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            length = 0
+        if self.state != 'non-html' and length > max_size:
+            self.state = 'too-large'
+
+    @property
+    def rejected(self):
+        return self.state in ('non-html', 'too-large')
+
+    def feed(self, chunk):
+        """Adauga o bucata din corp; False daca citirea trebuie oprita"""
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            self.state = 'too-large'
+        elif self.state == 'sniff' and self.size >= _SNIFF_BYTES:
+            self._sniff()
+        return not self.rejected
+
+    def finish(self):
+        """Corpul complet sau None daca raspunsul a fost respins"""
+        if self.state == 'sniff':
+            self._sniff()
+        return None if self.rejected else b''.join(self.chunks)
+
+    def _sniff(self):
+        head = b''.join(self.chunks)[:_SNIFF_BYTES]
+        self.state = 'html' if _looks_like_html(head) else 'non-html'
+
+
+class TokenBucket:
+    """
+    Galeata de jetoane: `rate` jetoane pe secunda, cel mult `capacity`
+    acumulate. Fiecare request consuma un jeton.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self._last = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def ready(self, now):
+        self._refill(now)
+        return self.tokens >= 1.0
+
+    def take(self, now):
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def wait_time(self, now):
+        """Secunde pana la urmatorul jeton disponibil"""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+
+class _NoRateLimit:
+    """Galeata fara limita (host_rate None): hostul e limitat doar de conexiuni"""
+
+    def ready(self, now):
+        return True
+
+    def take(self, now):
+        pass
+
+    def wait_time(self, now):
+        return 0.0
+
+
+_NO_RATE_LIMIT = _NoRateLimit()
+
+
+class _HostState:
+    """Starea unui host in planificator: coada proprie, robots.txt, rata"""
+
+    __slots__ = ('queue', 'robots', 'robots_future', 'bucket')
+
+    def __init__(self, bucket):
+        self.queue = []           # heap de (-scor, secventa, url, adancime)
+        self.robots = None        # RobotFileParser dupa incarcare
+        self.robots_future = None
+        self.bucket = bucket
+
+
+class PolitenessScheduler:
+    """
+    Planificator politicos intre frontiera si motorul de crawling.
+
+    URL-urile sunt scoase din frontiera in cozi separate pe host (cel mult
+    _SCHEDULER_BUFFER in total). La fiecare cerere se alege, dintre hosturile
+    care au robots.txt incarcat, un jeton disponibil si loc sub limita de
+    conexiuni, pe cel cu URL-ul cel mai bun: scorul cel mai mare dintr-o
+    frontiera ordonata (PriorityFrontier), apoi cel intrat cel mai devreme;
+    astfel un host lent sau cu Crawl-delay nu blocheaza celelalte hosturi.
+
+    Dintr-o frontiera ordonata, un host primeste in coada proprie cel mult
+    per_host_limit URL-uri: restul raman in frontiera, unde scorul lor inca
+    poate creste cu fiecare link nou.
+
+    Cu un AIMDController, limita de request-uri simultane a fiecarui host
+    este cea adaptata de controller (comuna cu downloader-ul de resurse), iar
+    un URL intors de next_url() tine un slot pana la release() pe controller.
+
+    robots.txt este descarcat in fundal, prin sesiunea comuna, la prima
+    intalnire a unui host. Crawl-delay si Request-rate reduc rata hostului;
+    URL-urile interzise sunt sarite si numarate in `robots_blocked`.
+
+    Fara host_rate (implicit), ritmul pe host il dau per_host_limit si
+    latenta serverului: cel mult per_host_limit / latenta request-uri pe
+    secunda (4 conexiuni la 100 ms pe raspuns: ~40/s). Cu host_rate se
+    aplica in plus o galeata de jetoane, cu rafale de per_host_limit.
+
+    Args:
+        frontier: Frontier / PriorityFrontier / SQLiteFrontier din care se
+            extrag URL-uri
+        session: sesiunea HTTP folosita pentru robots.txt
+        accept: functie (url, adancime) -> bool pentru filtrarea la extragere
+        per_host_limit: request-uri simultane permise pe host
+        host_rate: request-uri pe secunda permise pe host; None = fara limita
+            de rata (raman per_host_limit si Crawl-delay din robots.txt)
+        respect_robots: daca se respecta robots.txt
+        user_agent: agentul folosit pentru regulile din robots.txt
+        controller: AIMDController cu limitele adaptive pe host (optional)
+    """
+
+    def __init__(self, frontier, session, accept, per_host_limit,
+                 host_rate=config.DEFAULT_HOST_RATE,
+                 respect_robots=config.RESPECT_ROBOTS,
+                 user_agent=DEFAULT_USER_AGENT, controller=None):
+        self.frontier = frontier
+        self._ranked = hasattr(frontier, 'pop_ranked')
+        self.session = session
+        self.accept = accept
+        self.per_host_limit = per_host_limit
+        self.host_rate = host_rate
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.controller = controller
+        self.hosts = {}
+        self.buffered = 0
+        self.robots_blocked = 0
+        self._seq = 0
+        self._lock = threading.Lock()  # allowed() / acquire() vin din mai multe thread-uri
+        self._robots_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='robots')
+
+    # ------------------------------------------------------------------ #
+    def has_work(self):
+        """Mai exista URL-uri in cozile pe host sau in frontiera"""
+        return self.buffered > 0 or bool(self.frontier)
+
+    def next_url(self, host_active=None):
+        """
+        Intoarce urmatorul (url, adancime) eligibil sau None daca acum nu
+        exista niciunul (vezi has_work() si wait_time()).
+        """
+        host_active = host_active if host_active is not None else {}
+        while True:
+            now = time.monotonic()
+            best = None
+            for host, state in self.hosts.items():
+                if (not state.queue or
+                        self._host_full(host, host_active) or
+                        not self._robots_ready(host, state) or
+                        not state.bucket.ready(now)):
+                    continue
+                if best is None or state.queue[0][0] < best[1].queue[0][0]:
+                    best = (host, state)
+            if best is None:
+                if not self._pull(host_active):
+                    return None
+                continue
+            
+            host, state = best
+            item = heapq.heappop(state.queue)
+            _key, _seq, url, depth = item
+            self.buffered -= 1
+            if not self.accept(url, depth):  # ex. bugetul de pagini s-a epuizat intre timp
+                continue
+            if state.robots is not None and not state.robots.can_fetch(self.user_agent, url):
+                self.robots_blocked += 1
+                logger.debug(f"Interzis de robots.txt: {url}")
+                continue
+            if self.controller is not None and not self.controller.try_acquire(host):
+                # slotul a fost luat intre timp (ex. de downloader)
+                heapq.heappush(state.queue, item)
+                self.buffered += 1
+                return None
+            state.bucket.take(now)
+            return url, depth
+
+    def wait_time(self, host_active=None):
+        """Secunde pana cand un host cu URL-uri in asteptare poate primi un request"""
+        host_active = host_active if host_active is not None else {}
+        now = time.monotonic()
+        waits = [_MAX_IDLE_WAIT]
+        for host, state in self.hosts.items():
+            if not state.queue:
+                continue
+            pause = self.controller.pause_remaining(host) if self.controller is not None else 0
+            if pause:  # Retry-After
+                waits.append(pause)
+                continue
+            # hosturile la limita de conexiuni se elibereaza la terminarea unui request
+            if self._host_full(host, host_active):
+                continue
+            # robots.txt in curs de incarcare: reverificam des
+            waits.append(state.bucket.wait_time(now) if state.robots is not None else 0.05)
+        return max(min(waits), 0.01)
+
+    def robots_for(self, url):
+        """
+        robots.txt-ul hostului URL-ului, incarcat sincron si refolosit apoi de
+        planificator (ex. pentru liniile Sitemap: la insamantare). Se citeste
+        chiar daca regulile nu sunt respectate.
+        """
+        parsed = urlparse(url)
+        state = self._state(parsed.netloc)
+        if state.robots_future is None:
+            state.robots_future = self._robots_executor.submit(
+                self._load_robots, f"{parsed.scheme}://{parsed.netloc}"
+            )
+        try:
+            return state.robots_future.result()
+        except Exception as e:
+            logger.warning(f"robots.txt nu a putut fi citit pentru {parsed.netloc}: {e}")
+            return _ALLOW_ALL
+
+    def allowed(self, url):
+        """
+        True daca robots.txt permite URL-ul; pentru request-urile facute in
+        afara frontierei (ex. caile ghicite la insamantare)
+        """
+        state = self._loaded_state(url)
+        if state.robots.can_fetch(self.user_agent, url):
+            return True
+        with self._lock:
+            self.robots_blocked += 1
+        logger.debug(f"Interzis de robots.txt: {url}")
+        return False
+
+    def acquire(self, url):
+        """
+        Consuma un jeton din rata hostului URL-ului, asteptand daca e nevoie,
+        pentru un request facut in afara frontierei. False daca jobul a fost
+        anulat intre timp.
+        """
+        state = self._loaded_state(url)
+        while not config.CANCELLED:
+            with self._lock:
+                now = time.monotonic()
+                if state.bucket.ready(now):
+                    state.bucket.take(now)
+                    return True
+                wait = state.bucket.wait_time(now)
+            time.sleep(min(wait, 0.2))
+        return False
+
+    def close(self):
+        self._robots_executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------ #
+    def _pull(self, host_active):
+        """
+        Muta URL-uri din frontiera in cozile pe host pana cand unul dintre ele
+        poate fi servit acum. False daca nu s-a adaugat nimic.
+        """
+        added = False
+        now = time.monotonic()
+        while self.frontier and self.buffered < _SCHEDULER_BUFFER:
+            if self._ranked:
+                item = self.frontier.pop_ranked(skip=self._host_saturated)
+                if item is None:
+                    break
+                score, url, depth = item
+            else:
+                score = 0.0
+                url, depth = self.frontier.pop()
+            if not self.accept(url, depth):
+                continue
+            host = urlparse(url).netloc
+            state = self._state(host)
+            self._seq += 1
+            heapq.heappush(state.queue, (-score, self._seq, url, depth))
+            self.buffered += 1
+            added = True
+            if (not self._host_full(host, host_active) and
+                    self._robots_ready(host, state) and state.bucket.ready(now)):
+                break
+        return added
+
+    def _host_saturated(self, url):
+        """Hostul URL-ului are deja destule URL-uri in coada proprie"""
+        # URL-urile din frontiera sunt absolute (scheme://host/...), deci
+        # hostul se poate lua fara urlparse, apelat aici pentru fiecare URL sarit
+        host = url.split('/', 3)[2]
+        state = self.hosts.get(host)
+        return state is not None and len(state.queue) >= self._host_limit(host)
+
+    def _host_limit(self, host):
+        if self.controller is not None:
+            return self.controller.limit(host)
+        return self.per_host_limit
+
+    def _host_full(self, host, host_active):
+        """Hostul si-a atins limita de request-uri simultane"""
+        if self.controller is not None:
+            return not self.controller.available(host)
+        return host_active.get(host, 0) >= self.per_host_limit
+
+    def _state(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = _HostState(
+                TokenBucket(self.host_rate, self.per_host_limit) if self.host_rate else _NO_RATE_LIMIT
+            )
+        return state
+
+    def _loaded_state(self, url):
+        """Starea hostului URL-ului, cu robots.txt incarcat (sincron) si aplicat ratei"""
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._state(host)
+            if state.robots is None:
+                if self.respect_robots:
+                    state.robots = self.robots_for(url)
+                    self._apply_robots_rate(host, state)
+                else:
+                    state.robots = _ALLOW_ALL
+            return state
+
+    def _robots_ready(self, host, state):
+        """True daca regulile hostului sunt cunoscute; altfel porneste incarcarea"""
+        if state.robots is not None:
+            return True
+        if not self.respect_robots:
+            state.robots = _ALLOW_ALL
+            return True
+        if state.robots_future is None:
+            scheme = urlparse(state.queue[0][2]).scheme if state.queue else 'http'
+            state.robots_future = self._robots_executor.submit(
+                self._load_robots, f"{scheme}://{host}"
+            )
+            return False
+        if not state.robots_future.done():
+            return False
+        try:
+            state.robots = state.robots_future.result()
+        except Exception as e:
+            logger.warning(f"robots.txt nu a putut fi citit pentru {host}: {e}")
+            state.robots = _ALLOW_ALL
+        self._apply_robots_rate(host, state)
+        return True
+
+    def _load_robots(self, origin):
+        """Descarca si parseaza robots.txt; erorile de retea permit totul"""
+        parser = RobotFileParser(origin + '/robots.txt')
+        try:
+            response = self.session.get(
+                origin + '/robots.txt', timeout=config.ROBOTS_TIMEOUT, allow_redirects=True
+            )
+        except requests.RequestException as e:
+            logger.debug(f"robots.txt indisponibil pentru {origin}: {e}")
+            parser.allow_all = True
+            return parser
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            lines = response.text.splitlines()
+            parser.parse(lines)
+            parser.fractional_delay = _crawl_delay(lines, self.user_agent)
+        return parser
+
+    def _apply_robots_rate(self, host, state):
+        limit = rate = self.host_rate or float('inf')
+        delay = (state.robots.crawl_delay(self.user_agent) or
+                 getattr(state.robots, 'fractional_delay', None))
+        request_rate = state.robots.request_rate(self.user_agent)
+        if delay:
+            rate = min(rate, 1.0 / float(delay))
+        if request_rate and request_rate.seconds:
+            rate = min(rate, request_rate.requests / request_rate.seconds)
+        if rate < limit:
+            # cu Crawl-delay nu permitem rafale: un request la fiecare interval
+            state.bucket = TokenBucket(rate, 1)
+            logger.info(f"robots.txt pentru {host}: cel mult {rate:.2f} request-uri/s")
+
+
+def _crawl_delay(lines, user_agent):
+    """
+    Crawl-delay pentru agentul dat, acceptand si valori fractionare (0.5),
+    pe care RobotFileParser le ignora. Grupul agentului are prioritate fata de *.
+    """
+    token = user_agent.split('/')[0].lower()
+    agents, in_rules = [], False
+    specific = default = None
+    for line in lines:
+        key, _sep, value = line.split('#', 1)[0].partition(':')
+        key, value = key.strip().lower(), value.strip()
+        if key == 'user-agent':
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+        elif key:
+            in_rules = True
+            if key != 'crawl-delay':
+                continue
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            if any(a != '*' and a in token for a in agents):
+                specific = delay
+            elif '*' in agents and default is None:
+                default = delay
+    return specific if specific is not None else default
+
+
+def _allow_all_robots():
+    parser = RobotFileParser()
+    parser.allow_all = True
+    return parser
+
+
+_ALLOW_ALL = _allow_all_robots()
+
+
+def _call_sinks(calls):
+    """Apelurile page_sink / resource_sink amanate de motorul async, in ordine"""
+    for sink, args in calls:
+        sink(*args)
+
 
 class DomainCrawler:
     """
@@ -23,7 +551,19 @@ class DomainCrawler:
     
     def __init__(self, base_url, max_depth=3, max_pages=1000, 
                  same_domain_only=True, include_subdomains=False, 
-                 exclude_patterns=None):
+                 exclude_patterns=None, engine='sync',
+                 concurrency=DEFAULT_CONCURRENCY,
+                 per_host_limit=DEFAULT_PER_HOST_LIMIT, extractor='bs4',
+                 session=None, dedup='exact', storage='memory',
+                 storage_path=None, checkpoint=None, page_sink=None,
+                 resource_sink=None, respect_robots=config.RESPECT_ROBOTS,
+                 host_rate=config.DEFAULT_HOST_RATE, seed=config.SEED_FRONTIER,
+                 validators=None, cache=None, order=config.FRONTIER_ORDER,
+                 path_weights=config.FRONTIER_PATH_WEIGHTS,
+                 max_page_size=config.MAX_PAGE_SIZE, non_html=config.NON_HTML_PAGES,
+                 controller=None, retry=None, breaker=None,
+                 near_dup=config.NEAR_DUP_DETECTION, traps=config.TRAP_DETECTION,
+                 resolver=None, prewarm=config.PREWARM_CONNECTIONS):
         """
         Initializeaza crawler-ul
         
@@ -34,25 +574,166 @@ class DomainCrawler:
             same_domain_only: Daca sa scaneze doar acelasi domeniu
             include_subdomains: Daca sa includa subdomenii
             exclude_patterns: Liste de pattern-uri de exclus
+            engine: 'sync' (o pagina pe rand), 'threads' (pool de thread-uri)
+                sau 'async' (asyncio)
+            concurrency: Numarul maxim de request-uri simultane (threads/async)
+            per_host_limit: Request-uri simultane permise pe acelasi host
+            extractor: Backend-ul de extragere ('bs4', 'html.parser', 'lxml', 'auto')
+            session: PooledSession comun jobului; daca lipseste, crawler-ul
+                isi creeaza unul propriu, dimensionat dupa concurenta. Cu o
+                sesiune HTTP/2 si motorul async foloseste sesiunea (thread-uri)
+            dedup: Deduplicarea frontierei: 'exact' (amprente de 64 biti)
+                sau 'bloom' (filtru Bloom, memorie minima)
+            storage: 'memory' sau 'sqlite' (frontiera, URL-urile vizitate si
+                paginile pe disc, pentru crawl-uri mai mari decat memoria)
+            storage_path: Fisierul SQLite; daca lipseste se foloseste unul
+                temporar, sters la close()
+            checkpoint: CrawlCheckpoint in care se jurnalizeaza starea; daca
+                are deja stare (job intrerupt), crawl-ul continua de acolo
+            page_sink: Functie (url, html) apelata imediat pentru fiecare
+                pagina descarcata (streaming); HTML-ul nu mai este pastrat,
+                page_content ramane gol, iar page_index tine doar url -> adancime
+            resource_sink: Functie (resurse_noi, url_pagina) apelata cu
+                resursele descoperite pentru prima oara intr-o pagina.
+                In motorul async ambele sunt apelate dintr-un thread separat
+                (pot bloca: scriere pe disc, cozi limitate), nu din bucla
+            respect_robots: Respecta robots.txt (Disallow, Crawl-delay)
+            host_rate: Request-uri pe secunda permise pe fiecare host; None
+                (implicit) lasa ritmul pe seama per_host_limit si a Crawl-delay
+            seed: Pune in frontiera, inainte de crawl, URL-urile din
+                sitemap-uri si caile ghicite care exista
+            validators: ValidatorStore al unui snapshot anterior; paginile
+                sunt cerute conditionat, iar cele nemodificate nu mai sunt
+                trimise spre scriere (link-urile lor vin din snapshot)
+            cache: ResponseCache comun joburilor; paginile proaspete din
+                cache nu mai sunt cerute, cele expirate sunt revalidate
+            order: 'bfs' (in ordinea descoperirii) sau 'priority' (intai URL-ul
+                cu scorul cel mai mare: adancime, link-uri spre el, path)
+            path_weights: Perechi (pattern, pondere) adunate la scor ('priority')
+            max_page_size: Paginile mai mari (Content-Length sau octeti cititi)
+                sunt abandonate in timpul descarcarii
+            non_html: Raspunsurile non-HTML sunt abandonate dupa header-e;
+                'skip' le ignora, 'download' le preda downloader-ului de resurse
+            controller: AIMDController comun cu downloader-ul; inlocuieste
+                per_host_limit cu limite adaptate dupa latenta si 429/503
+            retry: RetryPolicy pentru erorile trecatoare (retea, 408/429/5xx);
+                sesiunea proprie nu mai face atunci retry-uri in urllib3
+            breaker: CircuitBreaker comun cu downloader-ul; URL-urile unui
+                host cu circuitul deschis esueaza imediat, fara request
+            near_dup: Paginile aproape identice (SimHash) cu una deja scanata
+                nu mai sunt trimise spre scriere; raman in `aliases`
+                (url -> original), iar link-urile lor sunt puse in frontiera
+                abia dupa epuizarea celorlalte. Tot in `aliases` ajung si
+                adresele redirectionate (url cerut -> url final)
+            traps: Sabloanele de URL care cresc fara limita (calendare,
+                paginare infinita, filtre combinate, segmente repetate) sunt
+                oprite si scrise in log; statisticile raman in `traps` (TrapDetector)
+            resolver: DNSCache comun jobului; implicit cel al sesiunii. Il
+                folosesc si conexiunile aiohttp ale motorului async
+            prewarm: Hosturile noi ale resurselor si link-urilor sunt
+                rezolvate si conectate in fundal (PooledSession.prewarm)
         """
+        if engine not in CRAWL_ENGINES:
+            raise ValueError(f"Motor de crawling necunoscut: {engine}")
+        if storage not in CRAWL_STORAGES:
+            raise ValueError(f"Stocare necunoscuta: {storage}")
+        if order not in FRONTIER_ORDERS:
+            raise ValueError(f"Ordine de frontiera necunoscuta: {order}")
+        if non_html not in NON_HTML_MODES:
+            raise ValueError(f"Mod non-HTML necunoscut: {non_html}")
+        self.engine = engine
+        self.concurrency = max(1, int(concurrency))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self._extract = get_extractor(extractor)
+        self.controller = controller
+        # cu limite adaptive, pool-ul trebuie sa permita limita maxima
+        self._max_per_host = controller.max_limit if controller is not None else self.per_host_limit
+        self._owns_session = session is None
+        self.retry = retry
+        self.breaker = breaker
+        self.resolver = resolver if resolver is not None else getattr(session, 'resolver', None)
+        self.session = session or PooledSession(
+            self.concurrency, self._max_per_host,
+            retries=0 if retry is not None else config.DEFAULT_RETRIES,
+            resolver=self.resolver,
+        )
+        self._prewarm = getattr(self.session, 'prewarm', None) if prewarm else None
+        # se descarca adresa data; forma canonica serveste doar la comparatii
         self.base_url = self._normalize_url(base_url)
-        self.base_domain = urlparse(self.base_url).netloc
+        self.base_domain = urlparse(canonicalize_url(self.base_url)).netloc
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.same_domain_only = same_domain_only
         self.include_subdomains = include_subdomains
         self.exclude_patterns = exclude_patterns or []
+        self._exclude = ExcludeMatcher(self.exclude_patterns, EXCLUDED_EXTENSIONS)
         
         # Stare interna
-        self.visited_urls = set()
-        self.url_queue = deque([(self.base_url, 0)])
-        self.page_content = {}
+        if storage == 'sqlite':
+            # frontiera pe disc este mereu exacta (tabela de amprente) si FIFO
+            self.store = SQLiteCrawlStore(storage_path, key=canonicalize_url)
+            self.visited_urls = self.store.visited
+            self.url_queue = self.store.frontier
+            self.page_content = self.store.pages
+        else:
+            self.store = None
+            self.visited_urls = FingerprintSet()
+            self.url_queue = Frontier(dedup, key=canonicalize_url) if order == 'bfs' else PriorityFrontier(
+                dedup, UrlScorer(path_weights=path_weights), key=canonicalize_url
+            )
+            self.page_content = {}
+        self.page_sink = page_sink
+        self.resource_sink = resource_sink
+        self._sink_calls = None   # motorul async: apelurile sink-urilor amanate
+        self.page_index = {}
         self.resources = set()
+        self.near_dups = SimHashIndex() if near_dup else None
+        self.aliases = {}         # pagina aproape identica -> pagina originala
+        self._deferred = {}       # link-urile aliasurilor -> adancime
+        self.traps = TrapDetector() if traps else None
+        self._redirects = {}      # URL cerut -> URL final, pana la _handle_page
         self.errors = []
         
         # Statistici
         self.pages_found = 0
         self.pages_processed = 0
+        self.urls_collapsed = 0   # variante ale unor URL-uri deja cunoscute
+        self.seed = seed
+        self.seeded = 0
+        self.validators = validators
+        self.cache = cache
+        self.pages_unchanged = 0  # 304 sau acelasi continut ca in snapshot
+        self.near_duplicates = 0
+        self.max_page_size = max_page_size
+        self.non_html = non_html
+        self.non_html_skipped = 0
+        self.pages_too_large = 0
+        self.bytes_wasted = 0     # cititi din raspunsuri abandonate
+        self.bytes_avoided = 0    # anuntati de Content-Length, necititi
+        self.retries = 0          # request-uri repetate dupa o eroare trecatoare
+        self.circuit_rejected = 0  # URL-uri ale unor hosturi cu circuitul deschis
+        self._stats_lock = threading.Lock()  # _fetch ruleaza si in thread-uri
+        
+        self.checkpoint = checkpoint
+        if checkpoint is not None:
+            if page_sink is None:
+                self.page_content = checkpoint.pages
+            if checkpoint.resumed:
+                checkpoint.restore(self)
+        if self.url_queue.push(self.base_url, 0) and checkpoint is not None:
+            checkpoint.url_queued(self.base_url, 0)
+        
+        # Planificatorul dintre frontiera si motor: robots.txt si rata pe host
+        self.scheduler = PolitenessScheduler(
+            self.url_queue,
+            self.session,
+            accept=lambda url, depth: (canonicalize_url(url) not in self.visited_urls and
+                                       self.should_crawl_url(url, depth)),
+            per_host_limit=self.per_host_limit,
+            host_rate=host_rate,
+            respect_robots=respect_robots,
+            controller=controller,
+        )
         self.start_time = time.time()
         
         # Headers pentru request-uri
@@ -74,7 +755,7 @@ class DomainCrawler:
             # Încearca mai intai HTTPS
             test_url = f"https://{url}"
             try:
-                response = requests.head(test_url, timeout=5, allow_redirects=True)
+                response = self.session.head(test_url, timeout=5, allow_redirects=True)
                 if response.status_code < 400:
                     return response.url
             except:
@@ -94,6 +775,8 @@ class DomainCrawler:
         if self.pages_processed >= self.max_pages:
             return False
             
+        # regulile se aplica formei canonice (host fara port implicit etc.)
+        url = canonicalize_url(url)
         parsed = urlparse(url)
         
         # Verifica restrictiile de domeniu
@@ -109,116 +792,27 @@ class DomainCrawler:
                 if url_domain != self.base_domain:
                     return False
                     
-        # Verifica pattern-urile de excludere
-        url_path = parsed.path
-        for pattern in self.exclude_patterns:
-            if '*' in pattern:
-                # Potrivire simpla cu wildcard
-                regex_pattern = pattern.replace('*', '.*')
-                if re.match(regex_pattern, url_path):
-                    return False
-            elif pattern in url_path:
-                return False
-                
-        # Nu scana anumite tipuri de fisiere
-        if any(url_path.lower().endswith(ext) for ext in EXCLUDED_EXTENSIONS):
+        # Pattern-urile de excludere si tipurile de fisiere nescanate
+        if self._exclude.excluded(parsed.path):
+            return False
+            
+        # Sabloanele oprite ca si capcane dupa ce URL-ul a intrat in frontiera
+        if self.traps is not None and self.traps.cut_off(url):
             return False
             
         return True
         
     def extract_links(self, html, base_url):
         """Extrage toate link-urile din HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        links = set()
-        
-        # Gaseste link-uri in diverse tag-uri
-        for tag in soup.find_all(['a', 'link', 'area']):
-            href = tag.get('href')
-            if href and not href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
-                absolute_url = urljoin(base_url, href)
-                # Elimina fragmentul
-                absolute_url = absolute_url.split('#')[0]
-                if absolute_url:
-                    links.add(absolute_url)
-                    
-        return links
+        return self._extract(html, base_url).links
         
     def extract_resources(self, html, base_url):
         """Extrage toate resursele (imagini, CSS, JS, etc.) din HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        resources = set()
-        
-        # Imagini
-        for tag in soup.find_all(['img', 'source', 'picture']):
-            src = tag.get('src') or tag.get('srcset') or tag.get('data-src')
-            if src:
-                # Gestioneaza srcset cu URL-uri multiple
-                if ',' in src:
-                    for part in src.split(','):
-                        url = part.strip().split()[0]
-                        if url:
-                            resources.add(urljoin(base_url, url))
-                else:
-                    resources.add(urljoin(base_url, src))
-                    
-        # Fisiere CSS
-        for tag in soup.find_all('link'):
-            if 'stylesheet' in tag.get('rel', []):
-                href = tag.get('href')
-                if href:
-                    resources.add(urljoin(base_url, href))
-                
-        # Fisiere JavaScript
-        for tag in soup.find_all('script'):
-            src = tag.get('src')
-            if src:
-                resources.add(urljoin(base_url, src))
-                
-        # Video si audio
-        for tag in soup.find_all(['video', 'audio', 'source']):
-            src = tag.get('src')
-            if src:
-                resources.add(urljoin(base_url, src))
-                
-        # Fonturi si alte resurse in stiluri inline
-        for tag in soup.find_all(style=True):
-            css_resources = self._extract_css_urls(tag['style'], base_url)
-            resources.update(css_resources)
-            
-        # Resurse din tag-uri <style>
-        for style in soup.find_all('style'):
-            if style.string:
-                css_resources = self._extract_css_urls(style.string, base_url)
-                resources.update(css_resources)
-                
-        # Favicon si alte meta resurse
-        for tag in soup.find_all('link'):
-            if tag.get('rel') and any(rel in ['icon', 'apple-touch-icon', 'manifest'] 
-                                     for rel in tag.get('rel')):
-                href = tag.get('href')
-                if href:
-                    resources.add(urljoin(base_url, href))
-                
-        return resources
+        return self._extract(html, base_url).resources
         
     def _extract_css_urls(self, css_content, base_url):
         """Extrage URL-uri din continut CSS"""
-        urls = set()
-        
-        # Pattern-uri pentru diverse formate de URL in CSS
-        patterns = [
-            r'url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)',
-            r'@import\s+["\']([^"\']+)["\']',
-            r'@import\s+url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)'
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, css_content, re.IGNORECASE):
-                url = match.group(1).strip()
-                if url and not url.startswith(('data:', 'javascript:', '#')):
-                    urls.add(urljoin(base_url, url))
-                    
-        return urls
+        return extract_css_urls(css_content, base_url)
         
     def crawl(self, progress_callback=None):
         """
@@ -230,82 +824,678 @@ class DomainCrawler:
         Returns:
             tuple: (dictionar cu continutul paginilor, set cu resursele gasite)
         """
-        logger.info(f"Incepe scanarea pentru: {self.base_url}")
+        logger.info(f"Incepe scanarea pentru: {self.base_url} (motor: {self.engine})")
         
-        while self.url_queue and not config.CANCELLED:
-            # Gestioneaza pauza
-            while config.PAUSED and not config.CANCELLED:
-                time.sleep(0.5)
+        try:
+            if self.seed and not (self.checkpoint is not None and self.checkpoint.resumed):
+                self._seed_frontier()
+            if self.engine == 'async':
+                asyncio.run(self._crawl_async(progress_callback))
+            elif self.engine == 'threads':
+                self._crawl_threads(progress_callback)
+            else:
+                self._crawl_sync(progress_callback)
+        finally:
+            self.scheduler.close()
+            if self.store is not None:
+                self.store.flush()
+            if self.checkpoint is not None:
+                self.checkpoint.flush(self)
+            if self._owns_session:
+                self.session.close()
                 
-            if config.CANCELLED:
+        logger.info(f"Scanare completa. Pagini: {self.pages_processed}, Resurse: {len(self.resources)}")
+        if self.traps is not None:
+            self.traps.log_stats()
+        return self.page_content, self.resources
+        
+    def _crawl_sync(self, progress_callback):
+        """Motorul clasic: un singur request in zbor"""
+        while not config.CANCELLED:
+            if not self.scheduler.has_work() and not self._release_deferred():
+                break
+            if not self._wait_while_paused():
                 logger.info("Scanare anulata de utilizator")
                 break
                 
-            current_url, depth = self.url_queue.popleft()
-            
-            # Sari peste URL-urile deja vizitate
-            if current_url in self.visited_urls:
-                continue
-                
-            # Verifica daca ar trebui sa scanam acest URL
-            if not self.should_crawl_url(current_url, depth):
+            item = self._next_url()
+            if item is None:
+                # niciun host nu are inca jeton / robots.txt incarcat
+                time.sleep(self.scheduler.wait_time())
                 continue
-                
-            self.visited_urls.add(current_url)
+            current_url, depth = item
             
             try:
-                # Actualizeaza progresul
-                if progress_callback:
-                    from utils.constants import TEXTS
-                    progress_callback(
-                        -1, 
-                        f"{TEXTS['status_crawling']} {TEXTS['pages_processed'].format(self.pages_processed, self.pages_found)}",
-                        current_url
-                    )
+                self._report_progress(progress_callback, current_url)
+                html = self._fetch(current_url)
+                self._handle_page(current_url, depth, html)
+            except Exception as e:
+                self._record_error(current_url, e)
+            finally:
+                self._release_host(urlparse(current_url).netloc)
                 
-                # Descarca pagina
-                response = requests.get(
-                    current_url, 
-                    headers=self.headers, 
-                    timeout=DEFAULT_TIMEOUT,
-                    allow_redirects=True
+    def _crawl_threads(self, progress_callback):
+        """
+        Motorul cu pool de thread-uri: thread-urile doar descarca, iar
+        procesarea paginilor si actualizarea cozii raman in thread-ul curent,
+        deci starea crawler-ului nu are nevoie de lock-uri.
+        """
+        host_active = {}
+        pending = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='crawler'
+        )
+        
+        try:
+            while not config.CANCELLED:
+                if not config.PAUSED:
+                    # Umple sloturile libere (paginile in zbor intra in bugetul max_pages)
+                    while (len(pending) < self.concurrency and
+                           self.pages_processed + len(pending) < self.max_pages):
+                        item = self._next_url(host_active)
+                        if item is None:
+                            break
+                        url, depth = item
+                        host = urlparse(url).netloc
+                        host_active[host] = host_active.get(host, 0) + 1
+                        self._report_progress(progress_callback, url)
+                        future = executor.submit(self._fetch, url)
+                        pending[future] = (url, depth, host)
+                        
+                waiting = self._has_waiting_urls()
+                if not pending:
+                    if config.PAUSED:
+                        time.sleep(0.5)
+                        continue
+                    if waiting:
+                        time.sleep(self.scheduler.wait_time())
+                        continue
+                    if self._release_deferred():
+                        continue
+                    break
+                    
+                done, _not_done = wait(
+                    pending,
+                    timeout=self.scheduler.wait_time(host_active) if waiting else 0.5,
+                    return_when=FIRST_COMPLETED,
                 )
-                response.raise_for_status()
-                
-                # Verifica tipul de continut
-                content_type = response.headers.get('content-type', '').lower()
-                if 'text/html' not in content_type:
+                for future in done:
+                    url, depth, host = pending.pop(future)
+                    host_active[host] -= 1
+                    self._release_host(host)
+                    try:
+                        html = future.result()
+                        self._handle_page(url, depth, html)
+                    except Exception as e:
+                        self._record_error(url, e)
+                        
+            if config.CANCELLED:
+                logger.info("Scanare anulata de utilizator")
+        finally:
+            executor.shutdown(wait=not config.CANCELLED, cancel_futures=True)
+            
+    async def _crawl_async(self, progress_callback):
+        """
+        Motorul asyncio: pastreaza pana la `concurrency` request-uri in zbor,
+        cel mult `per_host_limit` pe acelasi host. Pauza opreste pornirea de
+        request-uri noi, anularea le abandoneaza pe cele in curs.
+        """
+        host_active = {}
+        pending = set()
+        executor = None
+        # sink-urile (rescriere, scriere pe disc, cozi limitate) ruleaza intr-un
+        # singur thread, in ordinea paginilor, ca bucla sa nu fie blocata
+        self._sink_calls = []
+        sinks = ThreadPoolExecutor(max_workers=1, thread_name_prefix='crawler-sink')
+        
+        # aiohttp nu are HTTP/2: cu o sesiune HTTP/2 request-urile trec prin ea
+        if aiohttp is not None and not getattr(self.session, 'http2', False):
+            session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                connector=aiohttp.TCPConnector(
+                    limit=self.concurrency,
+                    limit_per_host=self._max_per_host,
+                    resolver=aiohttp_resolver(self.resolver),
+                ),
+            )
+            
+            async def fetch(url):
+                return await self._fetch_aiohttp(session, url)
+        else:
+            # Fara aiohttp (sau pe HTTP/2): request-uri prin sesiunea comuna, in thread-uri
+            session = None
+            executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            
+            async def fetch(url):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, self._fetch, url)
+            
+        try:
+            while not config.CANCELLED:
+                if config.PAUSED:
+                    await asyncio.sleep(0.5)
                     continue
+                    
+                # Umple sloturile libere (paginile in zbor intra in bugetul max_pages)
+                while (len(pending) < self.concurrency and
+                       self.pages_processed + len(pending) < self.max_pages):
+                    item = self._next_url(host_active)
+                    if item is None:
+                        break
+                    url, depth = item
+                    host = urlparse(url).netloc
+                    host_active[host] = host_active.get(host, 0) + 1
+                    self._report_progress(progress_callback, url)
+                    pending.add(asyncio.ensure_future(
+                        self._fetch_task(url, depth, host, host_active, fetch, sinks)
+                    ))
+                    
+                waiting = self._has_waiting_urls()
+                if not pending:
+                    if waiting:
+                        await asyncio.sleep(self.scheduler.wait_time())
+                        continue
+                    if self._release_deferred():
+                        continue
+                    break
+                    
+                _done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.scheduler.wait_time(host_active) if waiting else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
                 
-                # Stocheaza continutul
-                self.page_content[current_url] = response.text
-                self.pages_processed += 1
-                logger.info(f"Pagina scanata: {current_url}")
-                
-                # Extrage link-uri pentru scanare ulterioara
-                if depth < self.max_depth:
-                    links = self.extract_links(response.text, current_url)
-                    for link in links:
-                        if link not in self.visited_urls:
-                            self.url_queue.append((link, depth + 1))
-                            self.pages_found += 1
-                            
-                # Extrage resurse
-                resources = self.extract_resources(response.text, current_url)
-                self.resources.update(resources)
+            if config.CANCELLED:
+                logger.info("Scanare anulata de utilizator")
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if session is not None:
+                await session.close()
+            if executor is not None:
+                executor.shutdown(wait=False)
+            # paginile deja predate sink-urilor se termina de scris
+            self._sink_calls = None
+            sinks.shutdown(wait=True)
                 
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Eroare la accesarea {current_url}: {str(e)}"
-                logger.error(error_msg)
-                self.errors.append((current_url, str(e)))
+    async def _fetch_task(self, url, depth, host, host_active, fetch, sinks):
+        """
+        Descarca si proceseaza o pagina in motorul async. Sink-urile paginii
+        ruleaza in thread-ul `sinks`; task-ul ramane in zbor pana se termina,
+        deci o coada plina a pipeline-ului incetineste crawl-ul (backpressure)
+        """
+        calls = []
+        try:
+            html = await fetch(url)
+            try:
+                self._handle_page(url, depth, html)
+            finally:
+                # _handle_page nu cedeaza bucla: apelurile notate sunt ale acestei pagini
+                calls, self._sink_calls = self._sink_calls, []
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._record_error(url, e)
+        finally:
+            host_active[host] -= 1
+            self._release_host(host)
+        if calls:
+            try:
+                await asyncio.get_running_loop().run_in_executor(sinks, _call_sinks, calls)
             except Exception as e:
-                error_msg = f"Eroare neasteptata pentru {current_url}: {str(e)}"
-                logger.error(error_msg)
-                self.errors.append((current_url, str(e)))
-                
-        logger.info(f"Scanare completa. Pagini: {self.pages_processed}, Resurse: {len(self.resources)}")
-        return self.page_content, self.resources
+                self._record_error(url, e)
+            
+    def _fetch(self, url):
+        """
+        Descarca o pagina; returneaza HTML-ul, NON_HTML daca raspunsul nu e
+        HTML, None daca pagina depaseste max_page_size, NOT_MODIFIED daca
+        pagina din snapshot este inca actuala sau NOT_FETCHED daca jobul a
+        fost anulat inainte de o noua incercare. Corpul este citit in flux,
+        deci un raspuns respins nu mai este descarcat.
+        """
+        cached = self.cache.lookup(url) if self.cache is not None else None
+        if cached is not None and cached.fresh:
+            if cached.final_url != url:
+                self._redirects[url] = cached.final_url
+            return self._page_result(url, cached.headers, cached.body)
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            self._check_circuit(host)
+            started = time.monotonic()
+            try:
+                response = self.session.get(
+                    url, 
+                    headers={**self.headers, **self._conditional_headers(url, cached)}, 
+                    timeout=DEFAULT_TIMEOUT,
+                    allow_redirects=True,
+                    stream=True,
+                )
+            except requests.RequestException as e:
+                self._observe(host, started, error=True)
+                delay = self._retry_delay(host, attempt, error=e)
+                if delay is None:
+                    raise
+                if not retry_sleep(delay):
+                    return NOT_FETCHED
+                attempt += 1
+                continue
+            retry_after = response.headers.get('retry-after')
+            self._observe(host, started, response.status_code, retry_after)
+            delay = self._retry_delay(host, attempt, response.status_code, retry_after)
+            if delay is None:
+                break
+            response.close()
+            if not retry_sleep(delay):
+                return NOT_FETCHED
+            attempt += 1
+        if response.url != url:
+            self._redirects[url] = response.url
+        # la iesire, un corp citit partial inchide conexiunea in loc sa o refoloseasca
+        with response:
+            response.raise_for_status()
+            if response.status_code == 304:
+                if cached is None:
+                    return NOT_MODIFIED
+                self.cache.revalidated(url, response.headers)
+                return self._page_result(url, cached.headers, cached.body)
+            reader = _BodyReader(response.headers, self.max_page_size)
+            if not reader.rejected:
+                for chunk in response.iter_content(_READ_CHUNK):
+                    if not reader.feed(chunk):
+                        break
+            body = reader.finish()
+        if body is None:
+            return self._rejected(url, reader, response.headers)
+        if self.cache is not None:
+            self.cache.store(url, response.headers, body, response.url)
+        return self._page_result(url, response.headers, body)
+        
+    async def _fetch_aiohttp(self, session, url):
+        """Varianta aiohttp pentru _fetch"""
+        cached = self.cache.lookup(url) if self.cache is not None else None
+        if cached is not None and cached.fresh:
+            if cached.final_url != url:
+                self._redirects[url] = cached.final_url
+            return self._page_result(url, cached.headers, cached.body)
+        headers = self._conditional_headers(url, cached)
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            self._check_circuit(host)
+            started = time.monotonic()
+            try:
+                response = await session.get(url, headers=headers or None, allow_redirects=True)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._observe(host, started, error=True)
+                delay = self._retry_delay(host, attempt, error=e)
+                if delay is None:
+                    raise
+                if not await sleep_async(delay):
+                    return NOT_FETCHED
+                attempt += 1
+                continue
+            retry_after = response.headers.get('retry-after')
+            self._observe(host, started, response.status, retry_after)
+            delay = self._retry_delay(host, attempt, response.status, retry_after)
+            if delay is None:
+                break
+            response.release()
+            if not await sleep_async(delay):
+                return NOT_FETCHED
+            attempt += 1
+        if str(response.url) != url:
+            self._redirects[url] = str(response.url)
+        async with response:
+            response.raise_for_status()
+            if response.status == 304:
+                if cached is None:
+                    return NOT_MODIFIED
+                self.cache.revalidated(url, response.headers)
+                return self._page_result(url, cached.headers, cached.body)
+            reader = _BodyReader(response.headers, self.max_page_size)
+            if not reader.rejected:
+                async for chunk in response.content.iter_chunked(_READ_CHUNK):
+                    if not reader.feed(chunk):
+                        break
+            body = reader.finish()
+            if body is None:
+                response.close()  # restul corpului nu mai este citit
+                return self._rejected(url, reader, response.headers)
+            if self.cache is not None:
+                self.cache.store(url, response.headers, body, str(response.url))
+            try:
+                text = body.decode(response.charset or 'utf-8', errors='replace')
+            except LookupError:
+                text = None
+            return self._page_result(url, response.headers, body, text)
+            
+    def _observe(self, host, started, status=None, retry_after=None, error=False):
+        """Raspunsul (sau eroarea) unui request, pentru limitele adaptive"""
+        if self.controller is not None:
+            self.controller.observe(host, started, status, retry_after, error)
+            
+    def _check_circuit(self, host):
+        """Ridica CircuitOpenError daca hostul are circuitul deschis"""
+        if self.breaker is None:
+            return
+        try:
+            self.breaker.check(host)
+        except CircuitOpenError:
+            with self._stats_lock:
+                self.circuit_rejected += 1
+            raise
+            
+    def _retry_delay(self, host, attempt, status=None, retry_after=None, error=None):
+        """Secundele pana la o noua incercare sau None (rezultat final)"""
+        delay = retry_delay(self.retry, self.breaker, host, attempt, status, retry_after, error)
+        if delay is not None:
+            with self._stats_lock:
+                self.retries += 1
+            logger.debug(f"Reincercare {attempt + 1} in {delay:.1f}s: {host} "
+                         f"({error or f'HTTP {status}'})")
+        return delay
+            
+    def _release_host(self, host):
+        """Elibereaza slotul luat de planificator pentru host"""
+        if self.controller is not None:
+            self.controller.release(host)
+            
+    def _rejected(self, url, reader, headers):
+        """Contorizeaza un raspuns abandonat; intoarce rezultatul pentru _fetch"""
+        try:
+            announced = int(headers.get('content-length') or 0)
+        except ValueError:
+            announced = 0
+        too_large = reader.state == 'too-large'
+        with self._stats_lock:
+            self.bytes_wasted += reader.size
+            self.bytes_avoided += max(0, announced - reader.size)
+            if too_large:
+                self.pages_too_large += 1
+            else:
+                self.non_html_skipped += 1
+        if too_large:
+            logger.warning(f"Pagina mai mare de {self.max_page_size} octeti, abandonata: {url}")
+            return None
+        logger.debug(f"Raspuns non-HTML ({headers.get('content-type', '?')}), abandonat: {url}")
+        return NON_HTML
+            
+    def _conditional_headers(self, url, cached):
+        """
+        Header-e conditionale: ale copiei expirate din cache (un 304 o face
+        din nou utilizabila), altfel ale snapshot-ului (un 304 inseamna
+        NOT_MODIFIED)
+        """
+        if cached is not None:
+            return cached.conditional_headers()
+        if self.validators is not None:
+            return self.validators.conditional_headers(url)
+        return {}
+        
+    def _page_result(self, url, headers, body, text=None):
+        """Rezultatul _fetch pentru un raspuns 200 (din retea sau din cache)"""
+        # Verifica tipul de continut
+        kind = _content_kind(headers)
+        if kind == 'non-html' or (kind == 'sniff' and not _looks_like_html(body[:_SNIFF_BYTES])):
+            return NON_HTML
+        if self.validators is not None:
+            if self.validators.unchanged(url, body):
+                return NOT_MODIFIED
+            self.validators.record(url, headers, body)
+        return text if text is not None else decode_body(body, headers)
+            
+    def _next_url(self, host_active=None):
+        """
+        Cere planificatorului urmatorul URL eligibil si il marcheaza ca vizitat.
+        
+        `host_active` (host -> request-uri in zbor) limiteaza conexiunile pe
+        host; fara el se aplica doar robots.txt si rata pe host.
+        
+        Returns:
+            tuple: (url, adancime) sau None daca nu exista nimic de scanat acum
+        """
+        item = self.scheduler.next_url(host_active)
+        if item is not None:
+            self.visited_urls.add(canonicalize_url(item[0]))
+        return item
+        
+    def _has_waiting_urls(self):
+        """Exista URL-uri care asteapta un host liber si bugetul nu e epuizat"""
+        return self.scheduler.has_work() and self.pages_processed < self.max_pages
         
+    def _handle_page(self, url, depth, html):
+        """
+        Stocheaza o pagina descarcata si extrage link-urile si resursele ei
+        (html None inseamna o pagina abandonata, doar marcata ca terminata;
+        NON_HTML un raspuns non-HTML, predat eventual downloader-ului;
+        NOT_MODIFIED o pagina pastrata din snapshot-ul anterior;
+        NOT_FETCHED o pagina nedescarcata, care ramane de scanat la reluare)
+        """
+        if html is NOT_FETCHED:
+            return
+        fetched, final = url, self._redirects.pop(url, None)
+        if html is NON_HTML:
+            if self.non_html == 'download':
+                self._hand_off(url)
+            html = None
+        if html is not None and final is not None:
+            url = self._follow_redirect(url, final, depth)
+            if url is None:
+                return
+        unchanged = html is NOT_MODIFIED
+        # cu page_sink, pagina e terminata abia cand sink-ul o marcheaza scrisa
+        if self.checkpoint is not None and (html is None or unchanged or self.page_sink is None):
+            self.checkpoint.url_done(url, depth)
+        if html is None:
+            return
+        if not unchanged and self._near_duplicate(url, depth, html):
+            return
+        if unchanged:
+            # fisierul local ramane; link-urile si resursele vin din snapshot
+            self.page_index[url] = depth
+            self.pages_unchanged += 1
+            links, resources = self.validators.refs(fetched)
+        else:
+            if self.page_sink is not None:
+                self._sink(self.page_sink, url, html)
+                self.page_index[url] = depth
+            else:
+                self.page_content[url] = html
+            # O singura parsare pentru link-uri si resurse
+            refs = self._extract(html, url)
+            links, resources = refs.links, refs.resources
+            if self.validators is not None:
+                self.validators.record_refs(fetched, links, resources)
+        self.pages_processed += 1
+        logger.info(f"Pagina scanata: {url}")
+        
+        # Hosturile noi ale resurselor (CDN-uri, fonturi) se pregatesc in fundal
+        if self._prewarm is not None:
+            for resource in resources:
+                self._prewarm(resource)
+            
+        # Link-uri pentru scanare ulterioara
+        if self.traps is not None:
+            self.traps.page_done(canonicalize_url(url))
+        if depth < self.max_depth:
+            for link in links:
+                self._enqueue(link, depth + 1, url)
+                    
+        if self.checkpoint is not None or self.resource_sink is not None:
+            new_resources = [r for r in resources if r not in self.resources]
+            if self.checkpoint is not None:
+                self.checkpoint.resources_found(new_resources)
+            if self.resource_sink is not None and new_resources:
+                self._sink(self.resource_sink, new_resources, url)
+        self.resources.update(resources)
+        if self.checkpoint is not None:
+            self.checkpoint.tick(self)
+        
+    def _follow_redirect(self, url, final, depth):
+        """
+        O pagina redirectionata se pastreaza la adresa finala (link-urile ei
+        relative se rezolva fata de aceasta), iar adresa ceruta devine alias.
+        Intoarce URL-ul sub care se pastreaza pagina sau None daca adresa
+        finala a fost deja scanata.
+        """
+        canonical = canonicalize_url(final)
+        if canonical == canonicalize_url(url) or not self.should_crawl_url(final, depth):
+            return url
+        self.aliases[url] = final
+        self.url_queue.mark_seen(final)
+        if self.checkpoint is not None:
+            self.checkpoint.url_done(url, depth)
+        if not self.visited_urls.add(canonical):
+            self.pages_processed += 1  # descarcarea a consumat bugetul
+            return None
+        return final
+        
+    def _near_duplicate(self, url, depth, html):
+        """
+        True daca pagina e aproape identica cu una deja scanata: devine alias,
+        iar link-urile ei asteapta in _deferred
+        """
+        if self.near_dups is None:
+            return False
+        fingerprint = simhash(page_words(html))
+        if fingerprint is None:
+            return False
+        original = self.near_dups.match_or_add(fingerprint, url)
+        if original is None:
+            return False
+        self.aliases[url] = original
+        self.near_duplicates += 1
+        self.pages_processed += 1  # descarcarea a consumat bugetul
+        if self.checkpoint is not None and self.page_sink is not None:
+            self.checkpoint.url_done(url, depth)
+        logger.info(f"Pagina aproape identica cu {original}: {url}")
+        if depth < self.max_depth:
+            for link in self._extract(html, url).links:
+                if self._deferred.get(link, depth + 2) > depth + 1:
+                    self._deferred[link] = depth + 1
+        return True
+        
+    def _release_deferred(self):
+        """
+        Pune in frontiera link-urile amanate ale aliasurilor, cand nu mai e
+        nimic altceva de scanat; True daca a aparut macar un URL nou
+        """
+        deferred, self._deferred = self._deferred, {}
+        if self.pages_processed >= self.max_pages:
+            return False
+        added = 0
+        for link, depth in deferred.items():
+            added += self._enqueue(link, depth)
+        if added:
+            logger.info(f"{added} link-uri din pagini aproape identice adaugate in frontiera")
+        return added > 0
+        
+    def _hand_off(self, url):
+        """Un link de pagina spre un fisier: il descarca downloader-ul de resurse"""
+        if url in self.resources:
+            return
+        self.resources.add(url)
+        if self.checkpoint is not None:
+            self.checkpoint.resources_found([url])
+        if self.resource_sink is not None:
+            self._sink(self.resource_sink, [url], None)
+        
+    def _sink(self, sink, *args):
+        """
+        Apeleaza page_sink / resource_sink; in motorul async apelul doar se
+        noteaza, iar _fetch_task il executa in afara buclei
+        """
+        if self._sink_calls is None:
+            sink(*args)
+        else:
+            self._sink_calls.append((sink, args))
+            
+    def _enqueue(self, link, depth, parent=None):
+        """
+        Pune un link gasit pe pagina `parent` in frontiera; True daca e nou.
+        Deduplicarea foloseste forma canonica, dar se descarca link-ul original.
+        """
+        # frontiera deduplica la inserare; numaram doar URL-urile noi
+        canonical = canonicalize_url(link)
+        if (self.traps is not None and not self.url_queue.seen(link)
+                and not self.traps.admit(canonical, parent and canonicalize_url(parent))):
+            return False
+        if self.url_queue.push(link, depth):
+            self.pages_found += 1
+            if self.checkpoint is not None:
+                self.checkpoint.url_queued(link, depth)
+            if self._prewarm is not None and self.should_crawl_url(link, depth):
+                # motorul async are conexiunile lui (aiohttp, fara HTTP/2): doar DNS
+                self._prewarm(link, connect=self.engine != 'async' or aiohttp is None
+                              or getattr(self.session, 'http2', False))
+            return True
+        if canonical != link:
+            self.urls_collapsed += 1
+        return False
+        
+    def _seed_frontier(self):
+        """Sitemap-uri si cai ghicite, puse in frontiera la adancimea 1"""
+        seeder = SiteSeeder(
+            self.session,
+            self.base_url,
+            accept=lambda url: self.should_crawl_url(url, 1),
+            max_urls=self.max_pages,
+            robots=self.scheduler.robots_for(self.base_url),
+            scheduler=self.scheduler,
+            workers=min(config.PROBE_WORKERS, self.per_host_limit),
+        )
+        for url in seeder.iter_seeds():
+            if config.CANCELLED:
+                break
+            self.seeded += self._enqueue(url, 1)
+        logger.info(
+            f"Frontiera insamantata cu {self.seeded} URL-uri "
+            f"({seeder.from_sitemaps} din {seeder.sitemaps_read} sitemap-uri, "
+            f"{seeder.from_guesses} cai ghicite)"
+        )
+        
+    def _record_error(self, url, error):
+        """Inregistreaza o eroare de scanare"""
+        network_errors = (requests.exceptions.RequestException, asyncio.TimeoutError)
+        if aiohttp is not None:
+            network_errors += (aiohttp.ClientError,)
+        if isinstance(error, CircuitOpenError):
+            # deschiderea circuitului a fost deja raportata o data pentru host
+            logger.debug(f"Sarit (circuit deschis): {url}")
+        elif isinstance(error, network_errors):
+            logger.error(f"Eroare la accesarea {url}: {str(error)}")
+        else:
+            logger.error(f"Eroare neasteptata pentru {url}: {str(error)}")
+        self.errors.append((url, str(error)))
+        if self.checkpoint is not None:
+            self.checkpoint.url_failed(url)
+        
+    def _report_progress(self, progress_callback, url):
+        """Trimite progresul catre interfata"""
+        if progress_callback:
+            from utils.constants import TEXTS
+            progress_callback(
+                -1, 
+                f"{TEXTS['status_crawling']} {TEXTS['pages_processed'].format(self.pages_processed, self.pages_found)}",
+                url
+            )
+            
+    def _wait_while_paused(self):
+        """Asteapta cat timp procesul e in pauza; returneaza False la anulare"""
+        while config.PAUSED and not config.CANCELLED:
+            time.sleep(0.5)
+        return not config.CANCELLED
+        
+    def close(self):
+        """Elibereaza stocarea pe disc (paginile nu mai pot fi citite dupa)"""
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
     def get_statistics(self):
         """Returneaza statisticile crawling-ului"""
         elapsed_time = time.time() - self.start_time
@@ -315,5 +1505,21 @@ class DomainCrawler:
             'resources_found': len(self.resources),
             'errors': len(self.errors),
             'elapsed_time': elapsed_time,
-            'pages_per_second': self.pages_processed / elapsed_time if elapsed_time > 0 else 0
+            'pages_per_second': self.pages_processed / elapsed_time if elapsed_time > 0 else 0,
+            'duplicates_skipped': self.url_queue.duplicates,
+            'urls_collapsed': self.urls_collapsed,
+            'frontier_memory': self.url_queue.memory_bytes() + self.visited_urls.memory_bytes(),
+            'robots_blocked': self.scheduler.robots_blocked,
+            'seeded': self.seeded,
+            'pages_unchanged': self.pages_unchanged,
+            'near_duplicates': self.near_duplicates,
+            'non_html_skipped': self.non_html_skipped,
+            'pages_too_large': self.pages_too_large,
+            'bytes_wasted': self.bytes_wasted,
+            'bytes_avoided': self.bytes_avoided,
+            'retries': self.retries,
+            'circuit_rejected': self.circuit_rejected,
+            'trap_blocked': self.traps.blocked if self.traps is not None else 0,
+            'trap_templates': len(self.traps.stats()) if self.traps is not None else 0,
+            'hosts': len(self.scheduler.hosts),
         }
\ No newline at end of file
@@ -0,0 +1,228 @@
+# core/dnscache.py
+# -*- coding: utf-8 -*-
+"""
+Cache DNS in proces, comun unui job de clonare.
+
+Fiecare host nou (CDN, fonturi, imagini) costa o rezolvare DNS la primul
+request; cu mai multe thread-uri care pornesc simultan spre acelasi host,
+fiecare o face separat. DNSCache tine adresele (rezultatul getaddrinfo, deci
+si /etc/hosts si ordinea IPv6/IPv4 a sistemului) pana la expirarea TTL-ului,
+iar rezolvarile simultane ale aceluiasi host asteapta una singura.
+
+TTL-ul vine din inregistrarea A/AAAA cand dnspython este instalat; altfel
+(sau daca interogarea esueaza) se foloseste DNS_DEFAULT_TTL. Niciun TTL nu
+depaseste DNS_MAX_TTL. Erorile de rezolvare sunt tinute DNS_NEGATIVE_TTL
+secunde, ca un host inexistent legat din fiecare pagina sa nu fie cerut din
+nou la fiecare resursa.
+
+Cache-ul este folosit de PooledSession (conexiunile urllib3) si, prin
+aiohttp_resolver(), de motorul async al crawler-ului.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import DNS_DEFAULT_TTL, DNS_MAX_TTL, DNS_NEGATIVE_TTL
+
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:  # TTL-ul implicit pentru toate hosturile
+    dns = None
+
+try:
+    from aiohttp.abc import AbstractResolver
+except ImportError:
+    AbstractResolver = None
+
+logger = logging.getLogger(__name__)
+
+AddrInfo = Tuple[int, int, int, str, tuple]
+
+
+class _Entry:
+    __slots__ = ("expires", "addresses", "error")
+
+    def __init__(self, expires, addresses=None, error=None):
+        self.expires = expires
+        self.addresses: Optional[List[AddrInfo]] = addresses
+        self.error: Optional[socket.gaierror] = error
+
+
+def _numeric(host: str) -> Optional[List[AddrInfo]]:
+    """Rezultatul getaddrinfo pentru o adresa IP literala (None pentru nume)."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    return socket.getaddrinfo(host, None, type=socket.SOCK_STREAM, flags=socket.AI_NUMERICHOST)
+
+
+def _record_ttl(host: str) -> Optional[int]:
+    """TTL-ul inregistrarii A (sau AAAA) a hostului, daca poate fi aflat."""
+    if dns is None:
+        return None
+    for rdtype in ("A", "AAAA"):
+        try:
+            return dns.resolver.resolve(host, rdtype, lifetime=2.0).rrset.ttl
+        except (dns.exception.DNSException, OSError):
+            continue
+    return None
+
+
+class DNSCache:
+    """
+    Adresele hosturilor rezolvate, pana la expirarea TTL-ului; sigur din
+    mai multe thread-uri.
+
+    Args:
+        default_ttl: secunde pastrate cand TTL-ul inregistrarii nu e cunoscut
+        max_ttl: limita superioara a oricarui TTL
+        negative_ttl: secunde pastrata o eroare de rezolvare
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = DNS_DEFAULT_TTL,
+        max_ttl: float = DNS_MAX_TTL,
+        negative_ttl: float = DNS_NEGATIVE_TTL,
+    ):
+        self.default_ttl = default_ttl
+        self.max_ttl = max(default_ttl, max_ttl)
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.lookups = 0          # rezolvari facute efectiv
+        self.failures = 0
+        self.lookup_time = 0.0    # secunde petrecute in rezolvari
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, host: str) -> List[AddrInfo]:
+        """
+        Adresele hostului (tuple getaddrinfo, portul 0), din cache sau
+        rezolvate acum. Ridica socket.gaierror daca hostul nu poate fi rezolvat.
+        """
+        numeric = _numeric(host)
+        if numeric is not None:
+            return numeric
+        host = host.lower().rstrip(".")
+        while True:
+            with self._lock:
+                entry = self._entries.get(host)
+                if entry is not None and entry.expires > time.monotonic():
+                    self.hits += 1
+                    if entry.error is not None:
+                        raise entry.error
+                    return entry.addresses
+                pending = self._inflight.get(host)
+                if pending is None:
+                    pending = self._inflight[host] = threading.Event()
+                    break
+            # alt thread rezolva deja hostul; rezultatul lui ajunge in cache
+            pending.wait()
+        try:
+            return self._resolve(host)
+        finally:
+            with self._lock:
+                del self._inflight[host]
+            pending.set()
+
+    def cached(self, host: str) -> Optional[List[AddrInfo]]:
+        """Adresele hostului daca sunt in cache si valabile (fara retea)."""
+        numeric = _numeric(host)
+        if numeric is not None:
+            return numeric
+        with self._lock:
+            entry = self._entries.get(host.lower().rstrip("."))
+            if entry is None or entry.error is not None or entry.expires <= time.monotonic():
+                return None
+            self.hits += 1
+            return entry.addresses
+
+    def forget(self, host: str) -> None:
+        """Scoate hostul din cache (ex. nicio adresa nu mai accepta conexiuni)."""
+        with self._lock:
+            self._entries.pop(host.lower().rstrip("."), None)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "hosts": len(self._entries),
+                "hits": self.hits,
+                "lookups": self.lookups,
+                "failures": self.failures,
+                "avg_lookup_ms": 1000.0 * self.lookup_time / self.lookups if self.lookups else 0.0,
+            }
+
+    def log_stats(self) -> None:
+        st = self.stats()
+        logger.info(
+            "Cache DNS: %d hosturi, %d rezolvari (%d esuate, %.0f ms in medie), %d raspunsuri din cache",
+            st["hosts"], st["lookups"], st["failures"], st["avg_lookup_ms"], st["hits"],
+        )
+
+    # ------------------------------------------------------------------ #
+    def _resolve(self, host: str) -> List[AddrInfo]:
+        start = time.monotonic()
+        try:
+            addresses = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            with self._lock:
+                self.lookups += 1
+                self.failures += 1
+                self.lookup_time += time.monotonic() - start
+                self._entries[host] = _Entry(time.monotonic() + self.negative_ttl, error=e)
+            raise
+        ttl = _record_ttl(host)
+        ttl = self.default_ttl if ttl is None else min(ttl, self.max_ttl)
+        now = time.monotonic()
+        with self._lock:
+            self.lookups += 1
+            self.lookup_time += now - start
+            self._entries[host] = _Entry(now + ttl, addresses=addresses)
+        return addresses
+
+
+if AbstractResolver is not None:
+    class _AiohttpResolver(AbstractResolver):
+        """Resolver aiohttp peste un DNSCache comun (rezolvarile in thread-uri)."""
+
+        def __init__(self, cache: DNSCache):
+            self.cache = cache
+
+        async def resolve(self, host, port=0, family=socket.AF_INET):
+            addresses = self.cache.cached(host)
+            if addresses is None:
+                loop = asyncio.get_running_loop()
+                addresses = await loop.run_in_executor(None, self.cache.lookup, host)
+            flags = socket.AI_NUMERICHOST | socket.AI_NUMERICSERV
+            results = [
+                {"hostname": host, "host": sockaddr[0], "port": port,
+                 "family": fam, "proto": proto, "flags": flags}
+                for fam, _type, proto, _canon, sockaddr in addresses
+                if family in (socket.AF_UNSPEC, fam)
+            ]
+            if not results:
+                raise socket.gaierror(socket.EAI_NONAME, f"Nicio adresa pentru {host}")
+            return results
+
+        async def close(self):
+            pass
+
+
+def aiohttp_resolver(cache: Optional[DNSCache]):
+    """Resolver-ul pentru aiohttp.TCPConnector sau None (resolver-ul implicit)."""
+    if cache is None or AbstractResolver is None:
+        return None
+    return _AiohttpResolver(cache)
@@ -10,15 +10,26 @@ import logging
 import mimetypes
 import os
 import shutil
+import threading
 import time
-from typing import Callable, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
 
 import requests
 
 import config
+from core.resilience import CircuitOpenError, retry_delay, sleep as retry_sleep
+from core.snapshot import NOT_MODIFIED
 from utils.helpers import format_size
 from utils.pathmap import PathMapper, _clean_segment
 
+if TYPE_CHECKING:
+    from core.cache import ResponseCache
+    from core.checkpoint import CrawlCheckpoint
+    from core.concurrency import AIMDController
+    from core.resilience import CircuitBreaker, RetryPolicy
+    from core.snapshot import ValidatorStore
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MIME_MAP = {
@@ -48,6 +59,12 @@ class ResourceDownloader:
         allow_external: bool = True,
         session: Optional[requests.Session] = None,
         timeout: int = 20,
+        checkpoint: Optional["CrawlCheckpoint"] = None,
+        validators: Optional["ValidatorStore"] = None,
+        cache: Optional["ResponseCache"] = None,
+        controller: Optional["AIMDController"] = None,
+        retry: Optional["RetryPolicy"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
     ):
         self.base_dir = base_dir
         self.pathmap = pathmap
@@ -56,9 +73,19 @@ class ResourceDownloader:
         self.allow_external = allow_external
         self.session = session or requests.Session()
         self.timeout = timeout
+        self.checkpoint = checkpoint  # resursele deja descarcate sunt sarite
+        self.validators = validators  # re-snapshot: request-uri conditionale
+        self.cache = cache  # cache HTTP comun joburilor
+        self.controller = controller  # limite adaptive pe host, comune cu crawler-ul
+        self.retry = retry  # retry-uri cu backoff pentru erorile trecatoare
+        self.breaker = breaker  # circuit breaker pe host, comun cu crawler-ul
 
         self.downloaded_count = 0
         self.failed_count = 0
+        self.not_modified_count = 0  # copii locale pastrate (304 / acelasi hash)
+        self.retry_count = 0
+        self.circuit_rejected = 0  # resurse ale unor hosturi cu circuitul deschis
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     def download_all(
@@ -78,9 +105,7 @@ class ResourceDownloader:
             if config.CANCELLED:
                 break
 
-            ok = self._download_one(url, res_sources.get(url))
-            self.downloaded_count += ok
-            self.failed_count += (not ok)
+            self.download_one(url, res_sources.get(url))
 
             if progress_callback:
                 pct = int((idx / total) * 100)
@@ -92,20 +117,37 @@ class ResourceDownloader:
         if progress_callback:
             progress_callback(100, TEXTS_DL["done"])
 
+    def download_one(self, url: str, src_page: Optional[str] = None) -> bool:
+        """Descarca o resursa si actualizeaza contoarele (sigur din mai multe thread-uri)."""
+        if self.checkpoint is not None and self.checkpoint.is_downloaded(url):
+            ok = True
+        else:
+            ok = self._download_one(url, src_page)
+            if ok and self.checkpoint is not None:
+                self.checkpoint.resource_done(url)
+                self.checkpoint.tick()
+        with self._lock:
+            self.downloaded_count += ok
+            self.failed_count += (not ok)
+        return ok
+
     # ------------------------------------------------------------------ #
     def _download_one(self, url: str, src_page: Optional[str]) -> bool:
         if not self._should_dl(url):
             return True
 
-        try:
-            r = self.session.get(url, timeout=self.timeout, stream=True)
-            r.raise_for_status()
-        except Exception as e:
-            logger.warning("Network error %s: %s", url, e)
+        result = self._fetch(url)
+        if result is None:
             return False
+        if result is NOT_MODIFIED:  # copia locala e inca actuala
+            self._not_modified(url)
+            return True
 
-        content = r.content
-        mime = r.headers.get("Content-Type") or _guess_mime(url)
+        headers, content = result
+        if self.validators is not None and self.validators.unchanged(url, content):
+            self._not_modified(url)
+            return True
+        mime = headers.get("Content-Type") or _guess_mime(url)
 
         local_path = self.pathmap.path_for_resource(
             url,
@@ -117,6 +159,8 @@ class ResourceDownloader:
             with open(local_path, "wb") as f:
                 f.write(content)
             logger.debug("Saved %s -> %s (%s)", url, local_path, format_size(len(content)))
+            if self.validators is not None:
+                self.validators.record(url, headers, content, path=local_path)
             return True
         except OSError as e:
             logger.error("Write error %s: %s", local_path, e)
@@ -130,6 +174,96 @@ class ResourceDownloader:
                 logger.error("Fallback write failed %s: %s", url, e2)
                 return False
 
+    def _fetch(self, url: str):
+        """
+        (header-e, corp) din cache sau din retea; NOT_MODIFIED daca snapshot-ul
+        are deja resursa, None la eroare de retea.
+        """
+        cached = self.cache.lookup(url) if self.cache is not None else None
+        if cached is not None and cached.fresh:
+            return cached.headers, cached.body
+        headers = None
+        if cached is not None:
+            headers = cached.conditional_headers()
+        elif self.validators is not None:
+            headers = self.validators.conditional_headers(url)
+
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                try:
+                    self.breaker.check(host)
+                except CircuitOpenError as e:
+                    logger.debug("Skipped %s: %s", url, e)
+                    with self._lock:
+                        self.circuit_rejected += 1
+                    return None
+            if self.controller is not None:
+                while not self.controller.acquire(host, timeout=0.5):
+                    if config.CANCELLED:
+                        return None
+            try:
+                r, delay = self._fetch_network(url, host, headers, attempt)
+            finally:
+                # slotul nu este tinut in timpul asteptarii dintre incercari
+                if self.controller is not None:
+                    self.controller.release(host)
+            if delay is None:
+                break
+            with self._lock:
+                self.retry_count += 1
+            if not retry_sleep(delay):
+                return None
+            attempt += 1
+        if r is None:
+            return None
+
+        if r.status_code == 304:
+            r.close()
+            if cached is None:
+                return NOT_MODIFIED
+            self.cache.revalidated(url, r.headers)
+            return cached.headers, cached.body
+        content = r.content
+        if self.cache is not None:
+            self.cache.store(url, r.headers, content, r.url)
+        return r.headers, content
+
+    def _fetch_network(self, url: str, host: str, headers, attempt: int):
+        """
+        O incercare: (raspuns reusit sau None, secunde pana la o noua
+        incercare sau None daca rezultatul e final).
+        """
+        started = time.monotonic()
+        try:
+            r = self.session.get(url, timeout=self.timeout, stream=True, headers=headers)
+        except Exception as e:
+            if self.controller is not None:
+                self.controller.observe(host, started, error=True)
+            delay = retry_delay(self.retry, self.breaker, host, attempt, error=e)
+            if delay is None:
+                logger.warning("Network error %s: %s", url, e)
+            return None, delay
+
+        retry_after = r.headers.get("Retry-After")
+        if self.controller is not None:
+            self.controller.observe(host, started, r.status_code, retry_after)
+        delay = retry_delay(self.retry, self.breaker, host, attempt, r.status_code, retry_after)
+        try:
+            r.raise_for_status()
+        except requests.HTTPError as e:
+            r.close()  # stream=True: conexiunea revine in pool doar la close
+            if delay is None:
+                logger.warning("Network error %s: %s", url, e)
+            return None, delay
+        return r, None
+
+    def _not_modified(self, url: str) -> None:
+        logger.debug("Not modified %s", url)
+        with self._lock:
+            self.not_modified_count += 1
+
     # ------------------------------------------------------------------ #
     def _should_dl(self, url: str) -> bool:
         from urllib.parse import urlparse
@@ -0,0 +1,387 @@
+# core/extractor.py
+# -*- coding: utf-8 -*-
+"""
+Extragerea referintelor dintr-o pagina HTML intr-o singura trecere.
+
+Arborele este parcurs o singura data, iar fiecare referinta gasita este
+clasificata dupa tip:
+
+    PAGE         href din <a>, <area> si <link> care nu e resursa
+    FORM         action din <form>
+    RESOURCE     src / data-src din img, script, source, video ... si
+                 href din <link rel="stylesheet|icon|preload|...">
+    SRCSET       atributul srcset (mai multe URL-uri cu descriptori)
+    INLINE_CSS   atributul style
+    STYLE_BLOCK  continutul unui tag <style>
+
+Acelasi parcurs este folosit de:
+    - DomainCrawler (extract_refs -> link-uri de urmat + resurse absolute)
+    - ContentProcessor (iter_refs -> rescrierea pe loc a atributelor)
+
+Pentru crawler exista si backend-uri fara arbore (get_extractor):
+    "bs4"          arbore BeautifulSoup complet (implicit)
+    "html.parser"  tokenizer-ul din stdlib, bazat pe evenimente
+    "lxml"         parser-ul lxml cu interfata "target" (daca e instalat)
+    "auto"         lxml daca exista, altfel html.parser
+Toate produc acelasi PageRefs.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # backend-ul lxml este optional
+    _lxml_etree = None
+
+# Tipuri de referinte
+PAGE = "page"
+FORM = "form"
+RESOURCE = "resource"
+SRCSET = "srcset"
+INLINE_CSS = "inline_css"
+STYLE_BLOCK = "style_block"
+
+# Valori rel pentru care <link href> este o resursa, nu o pagina
+_RESOURCE_RELS = {"stylesheet", "icon", "apple-touch-icon", "manifest"}
+# <link rel="preload|modulepreload|prefetch"> incarca o resursa (fonturi,
+# scripturi, imagini); doar as="document" (pagina urmatoare) e un link de pagina
+_PRELOAD_RELS = {"preload", "modulepreload", "prefetch"}
+
+# Tag-uri ale caror src / data-src / srcset sunt resurse statice
+_SRC_TAGS = {"img", "source", "script", "video", "audio", "input"}
+
+# Singurele atribute de care au nevoie backend-urile fara arbore
+_WANTED_ATTRS = {"href", "src", "srcset", "data-src", "rel", "as", "style", "action"}
+
+EXTRACTOR_BACKENDS = ("bs4", "html.parser", "lxml", "auto")
+
+# Prefixe pe care nu le urmam ca link-uri
+_SKIP_LINK_PREFIXES = ("#", "mailto:", "tel:", "javascript:")
+
+# Prefixe care nu sunt resurse descarcabile
+_SKIP_RESOURCE_PREFIXES = ("data:", "javascript:", "#")
+
+# Scanner-ul CSS: cuvintele cheie sunt cautate in textul cu litere mici
+# (alternanta de literali, fara IGNORECASE), iar expresia tokenului este
+# aplicata doar acolo. Grupurile 1-3 sunt URL-ul din url() (ghilimele
+# duble / simple / fara); -webkit-image-set contine "image-set".
+_URL_TOKEN = r"""url\s*\(\s*(?:"([^"]*)"|'([^']*)'|([^"'()\s]+))\s*\)"""
+_CSS_KEYWORD_RE = re.compile(r"url|@import|image-set")
+_CSS_URL_RE = re.compile(_URL_TOKEN, re.IGNORECASE)
+_CSS_IMPORT_RE = re.compile(r"""@import\s+(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_CSS_IMAGE_SET_RE = re.compile(r"image-set\s*\(", re.IGNORECASE)
+# In interiorul image-set(): url(), siruri (4-5) si paranteze (6-7); doar
+# sirurile de pe primul nivel sunt URL-uri (nu cele din type("image/avif"))
+_IMAGE_SET_RE = re.compile(
+    _URL_TOKEN + r"""|"([^"]*)"|'([^']*)'|(\()|(\))""",
+    re.IGNORECASE,
+)
+_UNQUOTED_GROUP = 3
+
+
+class CssUrl(NamedTuple):
+    """Un URL din CSS: pozitia lui in text si daca era intre ghilimele."""
+
+    start: int
+    end: int
+    url: str
+    quoted: bool
+
+
+class PageRefs(NamedTuple):
+    """Rezultatul extragerii: link-uri de pagini si resurse (URL-uri absolute)."""
+
+    links: Set[str]
+    resources: Set[str]
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """Construieste arborele BeautifulSoup folosit de crawler si procesor."""
+    return BeautifulSoup(html, "html.parser")
+
+
+def iter_refs(soup: BeautifulSoup) -> Iterator[Tuple[object, Optional[str], str]]:
+    """
+    Parcurge arborele o singura data si produce (tag, atribut, tip) pentru
+    fiecare referinta. Pentru STYLE_BLOCK atributul este None.
+
+    Consumatorul poate modifica atributele tag-ului primit.
+    """
+    for tag in soup.find_all(True):
+        if tag.name == "style" and tag.string:
+            yield tag, None, STYLE_BLOCK
+        for attr, kind in _classify(tag.name, tag.attrs):
+            yield tag, attr, kind
+
+
+def extract_refs(html, base_url: str) -> PageRefs:
+    """
+    Extrage intr-o singura trecere link-urile de pagini si resursele statice.
+
+    Args:
+        html: continutul HTML (str) sau un arbore deja construit
+        base_url: URL-ul paginii, folosit pentru rezolvarea URL-urilor relative
+    """
+    soup = html if isinstance(html, BeautifulSoup) else parse_html(html)
+    collector = _RefCollector(base_url)
+    for tag, attr, kind in iter_refs(soup):
+        collector.add(kind, tag.string if attr is None else tag[attr])
+    return collector.refs()
+
+
+def extract_refs_tokenizer(html: str, base_url: str) -> PageRefs:
+    """Varianta extract_refs pe tokenizer-ul din stdlib (fara arbore)."""
+    collector = _RefCollector(base_url)
+    parser = _TokenizerExtractor(collector)
+    parser.feed(html)
+    parser.close()
+    return collector.refs()
+
+
+def extract_refs_lxml(html: str, base_url: str) -> PageRefs:
+    """Varianta extract_refs pe parser-ul lxml cu interfata target."""
+    if _lxml_etree is None:
+        raise RuntimeError("lxml nu este instalat")
+    collector = _RefCollector(base_url)
+    parser = _lxml_etree.HTMLParser(target=_LxmlTarget(collector))
+    parser.feed(html)
+    return parser.close()
+
+
+def get_extractor(backend: str = "bs4") -> Callable[[str, str], PageRefs]:
+    """Intoarce functia de extragere pentru backend-ul cerut."""
+    if backend not in EXTRACTOR_BACKENDS:
+        raise ValueError(f"Backend de extragere necunoscut: {backend}")
+    if backend == "auto":
+        backend = "lxml" if _lxml_etree is not None else "html.parser"
+    if backend == "lxml":
+        return extract_refs_lxml
+    if backend == "html.parser":
+        return extract_refs_tokenizer
+    return extract_refs
+
+
+def split_srcset(srcset: str) -> list:
+    """Intoarce URL-urile dintr-un srcset (fara descriptorii 1x / 300w)."""
+    urls = []
+    for part in srcset.split(","):
+        bits = part.strip().split()
+        if bits:
+            urls.append(bits[0])
+    return urls
+
+
+def iter_css_urls(css: str) -> Iterator[CssUrl]:
+    """
+    URL-urile dintr-un text CSS, in ordinea aparitiei, intr-o singura trecere:
+    url(), @import "..." / @import url(...) si image-set() (cu sau fara url()).
+    """
+    low = css.lower()
+    search = _CSS_KEYWORD_RE.search
+    hit = search(low)
+    while hit is not None:
+        start = hit.start()
+        first = low[start]
+        if first == "u":
+            match = _CSS_URL_RE.match(css, start)
+        elif first == "@":  # @import url(...) este gasit apoi ca "url"
+            match = _CSS_IMPORT_RE.match(css, start)
+        else:
+            match = _CSS_IMAGE_SET_RE.match(css, start)
+        if match is None:  # cuvantul cheie nu incepe un token ("curl", "@import;")
+            pos = start + 1
+        elif first == "i":
+            pos = yield from _iter_image_set(css, match.end())
+        else:
+            group = match.lastindex
+            yield CssUrl(match.start(group), match.end(group), match.group(group),
+                         group != _UNQUOTED_GROUP or first == "@")
+            pos = match.end()
+        hit = search(low, pos)
+
+
+def _iter_image_set(css: str, pos: int):
+    """URL-urile unui image-set(); intoarce pozitia de dupa paranteza inchisa."""
+    depth = 0
+    for match in _IMAGE_SET_RE.finditer(css, pos):
+        group = match.lastindex
+        if group == 6:
+            depth += 1
+        elif group == 7:
+            if not depth:
+                return match.end()
+            depth -= 1
+        elif group <= _UNQUOTED_GROUP or not depth:
+            yield CssUrl(match.start(group), match.end(group), match.group(group),
+                         group != _UNQUOTED_GROUP)
+    return len(css)
+
+
+# stilurile inline ale unei pagini repeta aceleasi URL-uri (iconite, sprite-uri)
+_css_urljoin = functools.lru_cache(maxsize=4096)(urljoin)
+
+
+def extract_css_urls(css_content: str, base_url: str) -> Set[str]:
+    """Extrage URL-urile absolute din continut CSS."""
+    urls = set()
+    for ref in iter_css_urls(css_content):
+        url = ref.url.strip()
+        if url and not url.lower().startswith(_SKIP_RESOURCE_PREFIXES):
+            urls.add(_css_urljoin(base_url, url))
+    return urls
+
+
+def rewrite_css_urls(css_content: str, convert: Callable[[str], str]) -> str:
+    """
+    Inlocuieste fiecare URL din CSS cu convert(url), intr-o singura trecere;
+    restul textului ramane neschimbat (un url() fara ghilimele le primeste).
+    """
+    parts = []
+    last = 0
+    for ref in iter_css_urls(css_content):
+        new = convert(ref.url.strip())
+        parts.append(css_content[last:ref.start])
+        parts.append(new if ref.quoted else f'"{new}"')
+        last = ref.end
+    if not parts:
+        return css_content
+    parts.append(css_content[last:])
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Clasificare si colectare (comune tuturor backend-urilor)
+# ---------------------------------------------------------------------------
+
+
+def _classify(name: str, attrs: Dict) -> Iterator[Tuple[str, str]]:
+    """Produce (atribut, tip) pentru referintele unui tag (fara STYLE_BLOCK)."""
+    if name in ("a", "area"):
+        if attrs.get("href"):
+            yield "href", PAGE
+    elif name == "link":
+        if attrs.get("href"):
+            rels = attrs.get("rel") or []
+            if isinstance(rels, str):
+                rels = rels.split()
+            rels = {r.lower() for r in rels}
+            is_res = bool(rels & _RESOURCE_RELS) or (
+                bool(rels & _PRELOAD_RELS) and (attrs.get("as") or "").lower() != "document"
+            )
+            yield "href", RESOURCE if is_res else PAGE
+    elif name == "form":
+        if attrs.get("action"):
+            yield "action", FORM
+    elif name in _SRC_TAGS:
+        if attrs.get("src"):
+            yield "src", RESOURCE
+        if attrs.get("data-src"):
+            yield "data-src", RESOURCE
+        if attrs.get("srcset"):
+            yield "srcset", SRCSET
+
+    if attrs.get("style"):
+        yield "style", INLINE_CSS
+
+
+class _RefCollector:
+    """Transforma valorile brute ale referintelor in URL-uri absolute."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.links: Set[str] = set()
+        self.resources: Set[str] = set()
+
+    def add(self, kind: str, value: str) -> None:
+        if kind == PAGE:
+            if not value.startswith(_SKIP_LINK_PREFIXES):
+                absolute_url = urljoin(self.base_url, value).split("#")[0]
+                if absolute_url:
+                    self.links.add(absolute_url)
+        elif kind == RESOURCE:
+            self._add_resource(value)
+        elif kind == SRCSET:
+            for url in split_srcset(value):
+                self._add_resource(url)
+        elif kind in (INLINE_CSS, STYLE_BLOCK):
+            self.resources.update(extract_css_urls(value, self.base_url))
+
+    def refs(self) -> PageRefs:
+        return PageRefs(self.links, self.resources)
+
+    def _add_resource(self, raw: str) -> None:
+        raw = raw.strip()
+        if raw and not raw.lower().startswith(_SKIP_RESOURCE_PREFIXES):
+            self.resources.add(urljoin(self.base_url, raw))
+
+
+class _TokenizerExtractor(HTMLParser):
+    """Tokenizer stdlib: pastreaza doar atributele din _WANTED_ATTRS."""
+
+    def __init__(self, collector: _RefCollector):
+        super().__init__(convert_charrefs=True)
+        self._collector = collector
+        self._style_parts: Optional[list] = None
+
+    def handle_starttag(self, tag, attrs):
+        self._emit(tag, attrs)
+        if tag == "style":
+            self._style_parts = []
+
+    def handle_startendtag(self, tag, attrs):
+        self._emit(tag, attrs)
+
+    def handle_data(self, data):
+        if self._style_parts is not None:
+            self._style_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "style" and self._style_parts is not None:
+            css = "".join(self._style_parts)
+            self._style_parts = None
+            if css:
+                self._collector.add(STYLE_BLOCK, css)
+
+    def _emit(self, tag, attrs):
+        wanted = {k: v for k, v in attrs if v and k in _WANTED_ATTRS}
+        if wanted:
+            for attr, kind in _classify(tag, wanted):
+                self._collector.add(kind, wanted[attr])
+
+
+class _LxmlTarget:
+    """Target pentru lxml.etree.HTMLParser: primeste evenimente, nu arbore."""
+
+    def __init__(self, collector: _RefCollector):
+        self._collector = collector
+        self._style_parts: Optional[list] = None
+
+    def start(self, tag, attrib):
+        wanted = {k: v for k, v in attrib.items() if v and k in _WANTED_ATTRS}
+        if wanted:
+            for attr, kind in _classify(tag, wanted):
+                self._collector.add(kind, wanted[attr])
+        if tag == "style":
+            self._style_parts = []
+
+    def data(self, data):
+        if self._style_parts is not None:
+            self._style_parts.append(data)
+
+    def end(self, tag):
+        if tag == "style" and self._style_parts is not None:
+            css = "".join(self._style_parts)
+            self._style_parts = None
+            if css:
+                self._collector.add(STYLE_BLOCK, css)
+
+    def close(self):
+        return self._collector.refs()
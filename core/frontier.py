@@ -0,0 +1,766 @@
+# core/frontier.py
+# -*- coding: utf-8 -*-
+"""
+Frontiera crawler-ului: coada de URL-uri de scanat cu deduplicare la inserare.
+
+Fiecare URL este redus la o amprenta de 64 de biti (blake2b). Amprentele sunt
+tinute intr-o structura compacta, nu ca string-uri complete:
+
+    FingerprintSet   exact: array('q') sortat + buffer mic, ~8-10 octeti/URL
+    BloomFilter      aproximativ: ~1.8 octeti/URL la 0.1% fals pozitive
+                     (un fals pozitiv inseamna un URL nou sarit)
+
+Un URL intra in coada o singura data, deci pages_found numara URL-uri unice.
+Cu `key` (de exemplu canonicalize_url), amprenta se calculeaza pe cheie, dar
+in coada ramane URL-ul original: variantele aceleiasi pagini sunt colapsate,
+iar pagina se descarca exact de la adresa gasita in link.
+
+Frontier scoate URL-urile in ordinea descoperirii (BFS). PriorityFrontier
+scoate intai URL-ul cu scorul cel mai mare (UrlScorer: adancime, cate link-uri
+duc spre el, ponderi pe path), recalculat la fiecare link nou spre un URL
+aflat inca in coada; cand max_pages opreste crawl-ul devreme, raman paginile
+importante, nu doar primele gasite.
+
+Pentru crawl-uri mai mari decat memoria, SQLiteCrawlStore tine frontiera,
+multimea URL-urilor vizitate si HTML-ul paginilor intr-o baza SQLite (WAL),
+cu aceeasi interfata ca variantele din memorie.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+import math
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import MutableMapping
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEDUP_MODES = ("exact", "bloom")
+FRONTIER_ORDERS = ("bfs", "priority")
+
+# Cost aproximativ al unei intrari (url, depth) in coada, fara textul URL-ului
+_QUEUE_ENTRY_OVERHEAD = 120
+# PriorityFrontier: starea URL-ului in dict + o intrare in heap
+_PRIORITY_ENTRY_OVERHEAD = 260
+_HEAP_ENTRY_OVERHEAD = 100
+
+# Ponderile implicite ale scorului (vezi UrlScorer)
+DEFAULT_SCORE_WEIGHTS = {
+    "depth": 1.0,     # per nivel de adancime
+    "inlinks": 1.5,   # per dublare a numarului de link-uri spre URL
+    "segments": 0.25,  # per segment de path peste primul
+    "query": 1.0,     # URL cu query string
+}
+
+
+def url_fingerprint(url: str) -> int:
+    """Amprenta de 64 de biti (cu semn, incape in INTEGER SQLite) a unui URL."""
+    digest = hashlib.blake2b(url.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _as_fingerprint(item: Union[str, int]) -> int:
+    return item if isinstance(item, int) else url_fingerprint(item)
+
+
+def _same_url(url: str) -> str:
+    return url
+
+
+class FingerprintSet:
+    """
+    Multime exacta de amprente de 64 de biti.
+
+    Amprentele noi intra intr-un set mic; cand acesta depaseste 1/8 din partea
+    compacta, sunt interclasate intr-un array('q') sortat (8 octeti/intrare).
+    Accepta atat URL-uri (str) cat si amprente (int).
+    """
+
+    _MIN_BUFFER = 4096
+
+    def __init__(self, items: Iterable[Union[str, int]] = ()):
+        self._sorted = array("q")
+        self._buffer: set = set()
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Union[str, int]) -> bool:
+        fp = _as_fingerprint(item)
+        if fp in self._buffer:
+            return True
+        arr = self._sorted
+        i = bisect_left(arr, fp)
+        return i < len(arr) and arr[i] == fp
+
+    def add(self, item: Union[str, int]) -> bool:
+        """Adauga o amprenta; intoarce True daca nu exista deja."""
+        fp = _as_fingerprint(item)
+        if fp in self:
+            return False
+        self._buffer.add(fp)
+        if len(self._buffer) >= max(self._MIN_BUFFER, len(self._sorted) // 8):
+            self._compact()
+        return True
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._buffer)
+
+    def __iter__(self):
+        yield from self._sorted
+        yield from self._buffer
+
+    def _compact(self) -> None:
+        # timsort recunoaste cele doua secvente deja sortate: interclasare liniara in C
+        merged = self._sorted.tolist()
+        merged.extend(sorted(self._buffer))
+        merged.sort()
+        self._sorted = array("q", merged)
+        self._buffer = set()
+
+    def memory_bytes(self) -> int:
+        """Memoria ocupata (aproximativ) de multime."""
+        return (
+            self._sorted.buffer_info()[1] * self._sorted.itemsize
+            + sys.getsizeof(self._buffer)
+            + 32 * len(self._buffer)
+        )
+
+
+class BloomFilter:
+    """
+    Filtru Bloom scalabil peste amprente de 64 de biti.
+
+    Cand un strat se umple, se adauga altul de doua ori mai mare si cu rata
+    de eroare injumatatita, astfel incat rata totala ramane sub `error_rate`.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self._error_rate = error_rate
+        self._layers: List[Tuple[bytearray, int, int, int]] = []  # (biti, m, k, capacitate)
+        self._counts: List[int] = []
+        self._add_layer(max(1024, int(capacity)), error_rate / 2)
+
+    def _add_layer(self, capacity: int, error_rate: float) -> None:
+        m = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        k = max(1, int(round(m / capacity * math.log(2))))
+        self._layers.append((bytearray((m + 7) // 8), m, k, capacity))
+        self._counts.append(0)
+
+    @staticmethod
+    def _positions(fp: int, m: int, k: int) -> List[int]:
+        # double hashing (Kirsch-Mitzenmacher) din cele doua jumatati ale amprentei
+        h1 = fp & 0xFFFFFFFF
+        h2 = ((fp >> 32) & 0xFFFFFFFF) | 1
+        return [(h1 + i * h2) % m for i in range(k)]
+
+    def __contains__(self, item: Union[str, int]) -> bool:
+        fp = _as_fingerprint(item)
+        for bits, m, k, _cap in self._layers:
+            for p in self._positions(fp, m, k):
+                if not bits[p >> 3] & (1 << (p & 7)):
+                    break
+            else:
+                return True
+        return False
+
+    def add(self, item: Union[str, int]) -> bool:
+        """Adauga o amprenta; intoarce True daca (probabil) nu exista deja."""
+        fp = _as_fingerprint(item)
+        if fp in self:
+            return False
+        bits, m, k, cap = self._layers[-1]
+        if self._counts[-1] >= cap:
+            depth = len(self._layers) + 1
+            self._add_layer(cap * 2, self._error_rate / (2 ** depth))
+            bits, m, k, cap = self._layers[-1]
+        for p in self._positions(fp, m, k):
+            bits[p >> 3] |= 1 << (p & 7)
+        self._counts[-1] += 1
+        return True
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def memory_bytes(self) -> int:
+        return sum(len(bits) for bits, _m, _k, _cap in self._layers)
+
+
+class Frontier:
+    """
+    Coada FIFO de (url, adancime) cu deduplicare la inserare.
+
+    Args:
+        dedup: "exact" (FingerprintSet) sau "bloom" (BloomFilter)
+        expected_urls: dimensionarea initiala a filtrului Bloom
+        error_rate: rata de fals pozitive pentru modul "bloom"
+        key: functia url -> cheie de deduplicare; implicit URL-ul insusi
+    """
+
+    def __init__(
+        self,
+        dedup: str = "exact",
+        expected_urls: int = 1_000_000,
+        error_rate: float = 0.001,
+        key: Optional[Callable[[str], str]] = None,
+    ):
+        if dedup not in DEDUP_MODES:
+            raise ValueError(f"Mod de deduplicare necunoscut: {dedup}")
+        self.dedup = dedup
+        self._key = key or _same_url
+        self._seen = FingerprintSet() if dedup == "exact" else BloomFilter(expected_urls, error_rate)
+        self._queue: deque = deque()
+        self._queued_chars = 0
+        self.duplicates = 0
+
+    # ------------------------------------------------------------------ #
+    def push(self, url: str, depth: int) -> bool:
+        """Pune URL-ul in coada daca nu a mai fost vazut; intoarce True daca e nou."""
+        if not self._seen.add(self._key(url)):
+            self.duplicates += 1
+            return False
+        self._queue.append((url, depth))
+        self._queued_chars += len(url)
+        return True
+
+    def pop(self) -> Tuple[str, int]:
+        """Scoate urmatorul (url, adancime); IndexError daca e goala."""
+        url, depth = self._queue.popleft()
+        self._queued_chars -= len(url)
+        return url, depth
+
+    def unpop(self, items: List[Tuple[str, int]]) -> None:
+        """Pune inapoi in fata cozii intrari scoase cu pop(), in aceeasi ordine."""
+        for url, depth in reversed(items):
+            self._queue.appendleft((url, depth))
+            self._queued_chars += len(url)
+
+    def seen(self, url: str) -> bool:
+        return self._key(url) in self._seen
+
+    def mark_seen(self, url: str) -> None:
+        """Marcheaza URL-ul ca vazut fara a-l pune in coada (la reluare)."""
+        self._seen.add(self._key(url))
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    # ------------------------------------------------------------------ #
+    def memory_bytes(self) -> int:
+        """Memoria estimata: amprentele vazute + URL-urile aflate in coada."""
+        queued = len(self._queue) * _QUEUE_ENTRY_OVERHEAD + self._queued_chars
+        return self._seen.memory_bytes() + queued
+
+    def seen_bytes_per_million(self) -> Optional[float]:
+        """Memoria structurii de deduplicare raportata la un milion de URL-uri."""
+        n = len(self._seen)
+        if not n:
+            return None
+        return self._seen.memory_bytes() * 1_000_000 / n
+
+
+# ---------------------------------------------------------------------------
+# Ordine dupa prioritate
+# ---------------------------------------------------------------------------
+
+
+class UrlScorer:
+    """
+    Scorul unui URL din frontiera (mai mare = descarcat mai devreme):
+
+        - depth    * adancime
+        + inlinks  * log2(1 + link-uri spre URL)
+        - segments * segmente de path peste primul
+        - query    (daca URL-ul are query string)
+        + ponderile pattern-urilor potrivite
+
+    Pattern-urile au sintaxa celor de excludere ('*' = orice, fara '*' =
+    subsir) si se potrivesc pe path + query. Partea care depinde doar de URL
+    se calculeaza o data (static_score); adancimea si link-urile se schimba.
+
+    Args:
+        weights: ponderi care inlocuiesc DEFAULT_SCORE_WEIGHTS
+        path_weights: perechi (pattern, pondere)
+    """
+
+    def __init__(self, weights: Optional[dict] = None, path_weights: Iterable[Tuple[str, float]] = ()):
+        weights = {**DEFAULT_SCORE_WEIGHTS, **(weights or {})}
+        self.depth_weight = float(weights["depth"])
+        self.inlink_weight = float(weights["inlinks"])
+        self.segment_weight = float(weights["segments"])
+        self.query_weight = float(weights["query"])
+        self._patterns = []
+        for pattern, weight in path_weights:
+            regex = pattern.replace("*", ".*") if "*" in pattern else ".*" + re.escape(pattern)
+            try:
+                self._patterns.append((re.compile(regex), float(weight)))
+            except re.error as e:
+                logger.warning("Pattern de prioritate invalid ignorat %r: %s", pattern, e)
+
+    def static_score(self, url: str) -> float:
+        parts = urlsplit(url)
+        segments = sum(1 for segment in parts.path.split("/") if segment)
+        score = -self.segment_weight * max(0, segments - 1)
+        target = parts.path
+        if parts.query:
+            score -= self.query_weight
+            target = f"{parts.path}?{parts.query}"
+        for regex, weight in self._patterns:
+            if regex.match(target):
+                score += weight
+        return score
+
+    def score(self, static: float, depth: int, inlinks: int) -> float:
+        return static - self.depth_weight * depth + self.inlink_weight * math.log2(1 + inlinks)
+
+
+class PriorityFrontier:
+    """
+    Frontiera ordonata dupa scor, cu aceeasi interfata ca Frontier.
+
+    Fiecare push() al unui URL aflat inca in coada (un link nou spre el)
+    ii creste numarul de link-uri si, daca drumul e mai scurt, ii scade
+    adancimea. Scorul nou intra in heap ca intrare separata; cea veche are
+    o versiune depasita si este sarita la pop(). Cand intrarile depasite
+    ajung majoritare, heap-ul este reconstruit. La scor egal castiga URL-ul
+    descoperit primul.
+
+    Args:
+        dedup: "exact" sau "bloom", ca la Frontier
+        scorer: UrlScorer; implicit doar ponderile DEFAULT_SCORE_WEIGHTS
+        key: functia url -> cheie de deduplicare, ca la Frontier
+    """
+
+    def __init__(
+        self,
+        dedup: str = "exact",
+        scorer: Optional[UrlScorer] = None,
+        expected_urls: int = 1_000_000,
+        error_rate: float = 0.001,
+        key: Optional[Callable[[str], str]] = None,
+    ):
+        if dedup not in DEDUP_MODES:
+            raise ValueError(f"Mod de deduplicare necunoscut: {dedup}")
+        self.dedup = dedup
+        self.scorer = scorer or UrlScorer()
+        self._key = key or _same_url
+        self._seen = FingerprintSet() if dedup == "exact" else BloomFilter(expected_urls, error_rate)
+        self._heap: list = []  # (-scor, secventa, versiune, cheie)
+        # cheie -> [adancime, link-uri, scor static, secventa, versiune, url]
+        self._queued: dict = {}
+        self._queued_chars = 0
+        self._seq = 0
+        self.duplicates = 0
+        self.rescored = 0
+
+    # ------------------------------------------------------------------ #
+    def push(self, url: str, depth: int) -> bool:
+        """Pune URL-ul in coada daca nu a mai fost vazut; intoarce True daca e nou."""
+        key = self._key(url)
+        if not self._seen.add(key):
+            self.duplicates += 1
+            entry = self._queued.get(key)
+            if entry is not None:
+                entry[0] = min(entry[0], depth)
+                entry[1] += 1
+                entry[4] += 1
+                self.rescored += 1
+                self._push_entry(key, entry)
+            return False
+        self._add_entry(key, url, depth)
+        return True
+
+    def pop_ranked(
+        self, skip: Optional[Callable[[str], bool]] = None, lookahead: int = 64
+    ) -> Optional[Tuple[float, str, int]]:
+        """
+        Scoate (scor, url, adancime) cu scorul cel mai mare. URL-urile pentru
+        care skip(url) e True raman in coada cu tot cu scor; dupa `lookahead`
+        astfel de URL-uri (sau la coada goala) intoarce None.
+        """
+        heap, held = self._heap, []
+        try:
+            while heap:
+                item = heapq.heappop(heap)
+                neg_score, _seq, version, key = item
+                entry = self._queued.get(key)
+                if entry is None or entry[4] != version:
+                    continue  # intrare depasita
+                url = entry[5]
+                if skip is not None and skip(url):
+                    held.append(item)
+                    if len(held) >= lookahead:
+                        return None
+                    continue
+                del self._queued[key]
+                self._queued_chars -= _chars(key, url)
+                return -neg_score, url, entry[0]
+            return None
+        finally:
+            for item in held:
+                heapq.heappush(heap, item)
+
+    def pop(self) -> Tuple[str, int]:
+        """Scoate urmatorul (url, adancime); IndexError daca e goala."""
+        item = self.pop_ranked()
+        if item is None:
+            raise IndexError("pop from an empty frontier")
+        return item[1], item[2]
+
+    def unpop(self, items: List[Tuple[str, int]]) -> None:
+        """Pune inapoi intrari scoase cu pop(); link-urile numarate inainte se pierd."""
+        for url, depth in items:
+            self._add_entry(self._key(url), url, depth)
+
+    def seen(self, url: str) -> bool:
+        return self._key(url) in self._seen
+
+    def mark_seen(self, url: str) -> None:
+        """Marcheaza URL-ul ca vazut fara a-l pune in coada (la reluare)."""
+        self._seen.add(self._key(url))
+
+    def __len__(self) -> int:
+        return len(self._queued)
+
+    def __bool__(self) -> bool:
+        return bool(self._queued)
+
+    # ------------------------------------------------------------------ #
+    def _add_entry(self, key: str, url: str, depth: int) -> None:
+        self._seq += 1
+        entry = [depth, 1, self.scorer.static_score(url), self._seq, 0, url]
+        self._queued[key] = entry
+        self._queued_chars += _chars(key, url)
+        self._push_entry(key, entry)
+
+    def _push_entry(self, key: str, entry: list) -> None:
+        depth, inlinks, static, seq, version, _url = entry
+        heapq.heappush(self._heap, (-self.scorer.score(static, depth, inlinks), seq, version, key))
+        if len(self._heap) > 2 * len(self._queued) + 1024:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Reconstruieste heap-ul doar din intrarile curente."""
+        score = self.scorer.score
+        self._heap = [
+            (-score(static, depth, inlinks), seq, version, key)
+            for key, (depth, inlinks, static, seq, version, _url) in self._queued.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def memory_bytes(self) -> int:
+        """Memoria estimata: amprentele vazute + starea si heap-ul URL-urilor din coada."""
+        queued = (
+            len(self._queued) * _PRIORITY_ENTRY_OVERHEAD
+            + len(self._heap) * _HEAP_ENTRY_OVERHEAD
+            + self._queued_chars
+        )
+        return self._seen.memory_bytes() + queued
+
+
+def _chars(key: str, url: str) -> int:
+    """Caracterele tinute pentru o intrare: URL-ul si, daca difera, cheia."""
+    return len(url) if key is url else len(url) + len(key)
+
+
+# ---------------------------------------------------------------------------
+# Stocare pe disc (SQLite)
+# ---------------------------------------------------------------------------
+
+
+class SQLiteFrontier:
+    """
+    Frontiera FIFO pe disc, cu aceeasi interfata ca Frontier.
+
+    URL-urile noi sunt adunate intr-un buffer si scrise in loturi
+    (executemany); pop() citeste cate `batch_size` intrari odata, deci
+    memoria ramane proportionala cu lotul, nu cu frontiera. `key` ca la Frontier.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        batch_size: int = 1000,
+        key: Optional[Callable[[str], str]] = None,
+    ):
+        self._conn = conn
+        self.batch_size = batch_size
+        self._key = key or _same_url
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen (fp INTEGER PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS queue (
+                id INTEGER PRIMARY KEY, url TEXT NOT NULL, depth INTEGER NOT NULL
+            );
+            """
+        )
+        self._push_buf: List[Tuple[int, str, int]] = []
+        self._push_fps: set = set()
+        self._pop_buf: deque = deque()
+        self._size = conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+        self.duplicates = 0
+
+    # ------------------------------------------------------------------ #
+    def push(self, url: str, depth: int) -> bool:
+        """Pune URL-ul in coada daca nu a mai fost vazut; intoarce True daca e nou."""
+        fp = url_fingerprint(self._key(url))
+        if self._seen_fp(fp):
+            self.duplicates += 1
+            return False
+        self._push_buf.append((fp, url, depth))
+        self._push_fps.add(fp)
+        self._size += 1
+        if len(self._push_buf) >= self.batch_size:
+            self.flush()
+        return True
+
+    def pop(self) -> Tuple[str, int]:
+        """Scoate urmatorul (url, adancime); IndexError daca e goala."""
+        if not self._pop_buf:
+            self.flush()
+            rows = self._conn.execute(
+                "SELECT id, url, depth FROM queue ORDER BY id LIMIT ?", (self.batch_size,)
+            ).fetchall()
+            if not rows:
+                raise IndexError("pop from an empty frontier")
+            with self._conn:
+                self._conn.execute("DELETE FROM queue WHERE id <= ?", (rows[-1][0],))
+            self._pop_buf.extend((url, depth) for _id, url, depth in rows)
+        self._size -= 1
+        return self._pop_buf.popleft()
+
+    def unpop(self, items: List[Tuple[str, int]]) -> None:
+        """Pune inapoi in fata cozii intrari scoase cu pop(), in aceeasi ordine."""
+        self._pop_buf.extendleft(reversed(items))
+        self._size += len(items)
+
+    def flush(self) -> None:
+        """Scrie in baza URL-urile din buffer, intr-o singura tranzactie."""
+        if not self._push_buf:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (fp) VALUES (?)",
+                [(fp,) for fp, _url, _depth in self._push_buf],
+            )
+            self._conn.executemany(
+                "INSERT INTO queue (url, depth) VALUES (?, ?)",
+                [(url, depth) for _fp, url, depth in self._push_buf],
+            )
+        self._push_buf = []
+        self._push_fps = set()
+
+    def seen(self, url: str) -> bool:
+        return self._seen_fp(url_fingerprint(self._key(url)))
+
+    def mark_seen(self, url: str) -> None:
+        """Marcheaza URL-ul ca vazut fara a-l pune in coada (la reluare)."""
+        self._conn.execute("INSERT OR IGNORE INTO seen (fp) VALUES (?)", (url_fingerprint(self._key(url)),))
+
+    def _seen_fp(self, fp: int) -> bool:
+        if fp in self._push_fps:
+            return True
+        return self._conn.execute("SELECT 1 FROM seen WHERE fp = ?", (fp,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def memory_bytes(self) -> int:
+        """Memoria tinuta in buffere (restul frontierei este pe disc)."""
+        buffered = len(self._push_buf) + len(self._pop_buf)
+        return buffered * (_QUEUE_ENTRY_OVERHEAD + 80) + sys.getsizeof(self._push_fps)
+
+
+class SQLiteFingerprintSet:
+    """Multimea URL-urilor vizitate, pe disc; aceeasi interfata ca FingerprintSet."""
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "visited", batch_size: int = 1000):
+        self._conn = conn
+        self._table = table
+        self.batch_size = batch_size
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (fp INTEGER PRIMARY KEY) WITHOUT ROWID")
+        self._buffer: set = set()
+        self._count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def __contains__(self, item: Union[str, int]) -> bool:
+        fp = _as_fingerprint(item)
+        if fp in self._buffer:
+            return True
+        row = self._conn.execute(f"SELECT 1 FROM {self._table} WHERE fp = ?", (fp,)).fetchone()
+        return row is not None
+
+    def add(self, item: Union[str, int]) -> bool:
+        """Adauga o amprenta; intoarce True daca nu exista deja."""
+        fp = _as_fingerprint(item)
+        if fp in self:
+            return False
+        self._buffer.add(fp)
+        self._count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO {self._table} (fp) VALUES (?)",
+                [(fp,) for fp in self._buffer],
+            )
+        self._buffer = set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        self.flush()
+        for (fp,) in self._conn.execute(f"SELECT fp FROM {self._table}"):
+            yield fp
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._buffer) + 32 * len(self._buffer)
+
+
+class SQLitePageStore(MutableMapping):
+    """
+    Dictionar url -> HTML pe disc (comprimat zlib), folosit ca page_content.
+
+    Scrierile sunt confirmate (commit) in loturi; iterarea citeste in bucati,
+    deci procesarea paginilor dupa crawl nu incarca totul in memorie.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = 200):
+        self._conn = conn
+        self.batch_size = batch_size
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages (id INTEGER PRIMARY KEY, url TEXT UNIQUE NOT NULL, html BLOB NOT NULL)"
+        )
+        conn.commit()
+        self._uncommitted = 0
+
+    def __setitem__(self, url: str, html: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (url, html) VALUES (?, ?)",
+            (url, zlib.compress(html.encode("utf-8", "surrogatepass"), 3)),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.batch_size:
+            self.flush()
+
+    def __getitem__(self, url: str) -> str:
+        row = self._conn.execute("SELECT html FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            raise KeyError(url)
+        return _decompress(row[0])
+
+    def __delitem__(self, url: str) -> None:
+        cur = self._conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+        if not cur.rowcount:
+            raise KeyError(url)
+        self._uncommitted += 1
+
+    def __contains__(self, url) -> bool:
+        return self._conn.execute("SELECT 1 FROM pages WHERE url = ?", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        for row in self._iter_rows("url"):
+            yield row[1]
+
+    def items(self):
+        for _id, url, html in self._iter_rows("url, html"):
+            yield url, _decompress(html)
+
+    def _iter_rows(self, columns: str):
+        """Parcurge tabela in bucati dupa id (fara un cursor tinut deschis)."""
+        last_id = 0
+        while True:
+            rows = self._conn.execute(
+                f"SELECT id, {columns} FROM pages WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, self.batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1][0]
+
+    def flush(self) -> None:
+        self._conn.commit()
+        self._uncommitted = 0
+
+
+class SQLiteCrawlStore:
+    """
+    O baza SQLite (WAL) care tine toata starea mare a unui crawl:
+    frontiera, URL-urile vizitate si paginile descarcate.
+
+    Args:
+        path: fisierul bazei; daca lipseste se creeaza unul temporar,
+            sters la close()
+        batch_size: dimensiunea loturilor de scriere / citire
+        key: cheia de deduplicare a frontierei (vezi Frontier)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = 1000,
+        key: Optional[Callable[[str], str]] = None,
+    ):
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="fwc_crawl_", suffix=".sqlite")
+            os.close(fd)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-16000")  # ~16 MB cache de pagini
+
+        self.frontier = SQLiteFrontier(self.conn, batch_size, key)
+        self.visited = SQLiteFingerprintSet(self.conn, "visited", batch_size)
+        self.pages = SQLitePageStore(self.conn)
+
+    def flush(self) -> None:
+        self.frontier.flush()
+        self.visited.flush()
+        self.pages.flush()
+
+    def close(self) -> None:
+        """Scrie bufferele si inchide baza (o sterge daca era temporara)."""
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+        if self._temporary:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path + suffix)
+                except OSError:
+                    pass
+
+
+def _decompress(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8", "surrogatepass")
+
@@ -0,0 +1,387 @@
+# core/http2.py
+# -*- coding: utf-8 -*-
+"""
+Transport HTTP/2 optional (httpx + h2) pentru PooledSession.
+
+O pagina tipica are zeci sau sute de resurse pe aceleasi cateva hosturi
+(CDN-uri); pe HTTP/1.1 fiecare request simultan spre un host are nevoie de
+o conexiune proprie (TCP + TLS), limitata de per_host_limit. Pe HTTP/2 toate
+request-urile spre un host sunt stream-uri ale unei singure conexiuni.
+
+Http2Adapter este un adapter requests: crawler-ul, downloader-ul si
+seeder-ul folosesc in continuare API-ul requests (Response, iter_content,
+raw, cookies, redirect-uri), doar trimiterea trece prin httpx. Pentru
+https:// protocolul se negociaza prin ALPN, deci serverele fara HTTP/2
+raman pe HTTP/1.1, cel mult per_host_limit conexiuni simultane pe host, ca
+pool-ul urllib3. Hosturile care raspund pe HTTP/2 nu mai au limita de
+conexiuni (una singura); numarul de stream-uri simultane il impune
+serverul (SETTINGS_MAX_CONCURRENT_STREAMS), iar politetea ramane treaba
+crawler-ului si a AIMDController-ului. Pentru http:// (h2c) nu exista
+negociere: cu `cleartext` request-urile sunt trimise direct pe HTTP/2
+("prior knowledge"), deci doar spre servere care il accepta.
+
+Conexiunile httpx nu folosesc DNSCache (fiind una pe host, rezolvarea se
+face o singura data) si nu sunt pregatite de PooledSession.prewarm().
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import os
+import socket
+import ssl
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+
+from core.resilience import RetryPolicy, transient_error
+
+try:
+    import h2  # noqa: F401  (httpx il cere pentru http2=True)
+    import httpx
+except ImportError:
+    httpx = None
+
+# header-e ale conexiunii HTTP/1.1, interzise pe HTTP/2
+_HOP_BY_HOP = frozenset({
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade",
+})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def http2_available() -> bool:
+    """httpx si h2 sunt instalate."""
+    return httpx is not None
+
+
+def _ssl_context(verify, cert) -> ssl.SSLContext:
+    """Contextul TLS pentru `verify` si `cert` in forma requests."""
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        bundle = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if os.path.isdir(bundle):
+            context = ssl.create_default_context(capath=bundle)
+        else:
+            context = ssl.create_default_context(cafile=bundle)
+    if cert:
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(cert[0], cert[1])
+        else:
+            context.load_cert_chain(cert)
+    return context
+
+
+def _origin(url: str) -> str:
+    """scheme://host:port, aceeasi cheie ca transport.host_key."""
+    parsed = httpx.URL(url)
+    port = parsed.port or _DEFAULT_PORTS.get(parsed.scheme)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+def _timeout(timeout) -> "httpx.Timeout":
+    """Timeout-ul requests (secunde sau (conectare, citire)) in forma httpx."""
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect, pool=None)
+    return httpx.Timeout(timeout, pool=None)
+
+
+def _network_error(error: "httpx.TransportError", request) -> requests.RequestException:
+    """Eroarea httpx ridicata la trimitere, ca exceptie requests."""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.ReadTimeout(error, request=request)
+    if isinstance(error, httpx.ProxyError):
+        return requests.exceptions.ProxyError(error, request=request)
+    if isinstance(error, httpx.ConnectError) and "CERTIFICATE" in str(error).upper():
+        return requests.exceptions.SSLError(error, request=request)
+    if isinstance(error, httpx.UnsupportedProtocol):
+        return requests.exceptions.InvalidURL(error, request=request)
+    return requests.exceptions.ConnectionError(error, request=request)
+
+
+class _RawBody(io.RawIOBase):
+    """
+    Corpul unui raspuns httpx cu interfata folosita de requests din
+    response.raw (urllib3): stream(), read(), release_conn(), decode_content.
+    """
+
+    def __init__(self, response: "httpx.Response", release):
+        super().__init__()
+        self._response = response
+        self._release = release      # elibereaza locul hostului (o singura data)
+        self._chunks = None
+        self._buffer = b""
+        self.decode_content = False  # ca urllib3 sub requests
+        self.auto_close = True
+        self.status = response.status_code
+        self.version = response.http_version
+        # cookie-urile sunt citite de requests din _original_response.msg
+        msg = http.client.HTTPMessage()
+        for name, value in response.headers.multi_items():
+            msg[name] = value
+        self.headers = msg
+        self._original_response = SimpleNamespace(msg=msg)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._buffer:
+            self._buffer = self._next_chunk(self.decode_content)
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def read(self, amt: Optional[int] = None, decode_content: Optional[bool] = None) -> bytes:
+        decode = self.decode_content if decode_content is None else decode_content
+        parts, size = [self._buffer], len(self._buffer)
+        self._buffer = b""
+        while amt is None or amt < 0 or size < amt:
+            chunk = self._next_chunk(decode)
+            if not chunk:
+                break
+            parts.append(chunk)
+            size += len(chunk)
+        data = b"".join(parts)
+        if amt is not None and 0 <= amt < len(data):
+            data, self._buffer = data[:amt], data[amt:]
+        return data
+
+    def stream(self, amt: int = 65536, decode_content: Optional[bool] = None):
+        while True:
+            data = self.read(amt, decode_content)
+            if not data:
+                break
+            yield data
+
+    def release_conn(self) -> None:
+        self._finish()
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    # ------------------------------------------------------------------ #
+    def _next_chunk(self, decode: bool) -> bytes:
+        """Urmatoarea bucata a corpului; b"" la sfarsit."""
+        if self.closed:
+            return b""
+        if self._chunks is None:
+            # decodarea (gzip, deflate) se alege la prima citire, ca in urllib3
+            self._chunks = self._response.iter_bytes() if decode else self._response.iter_raw()
+        try:
+            while True:
+                chunk = next(self._chunks)
+                if chunk:
+                    return chunk
+        except StopIteration:
+            self._finish()
+            if self.auto_close:
+                super().close()
+            return b""
+        except httpx.DecodingError as e:
+            self.close()
+            raise requests.exceptions.ContentDecodingError(e)
+        except httpx.TimeoutException as e:
+            self.close()
+            raise requests.exceptions.ConnectionError(e)
+        except httpx.TransportError as e:
+            self.close()
+            raise requests.exceptions.ChunkedEncodingError(e)
+
+    def _finish(self) -> None:
+        self._response.close()
+        self._release()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    Adapter requests care trimite prin httpx, pe HTTP/2 cand serverul il
+    accepta.
+
+    Args:
+        owner: PooledSession-ul care tine statisticile pe host
+        concurrency: numarul total de request-uri simultane ale jobului
+        per_host_limit: conexiuni HTTP/1.1 permise simultan pe host
+        retries: retry-uri pentru erori de conexiune si 502/503/504
+        cleartext: HTTP/2 fara negociere si pentru http:// (h2c)
+    """
+
+    def __init__(self, owner, concurrency: int, per_host_limit: int, retries: int, cleartext: bool = False):
+        super().__init__()
+        if httpx is None:
+            raise ImportError("HTTP/2 cere pachetele httpx si h2")
+        self._owner = owner
+        self.concurrency = concurrency
+        self.per_host_limit = per_host_limit
+        self.cleartext = cleartext
+        self._retry = RetryPolicy(retries, backoff=0.5)
+        self._transports: Dict[Tuple, "httpx.HTTPTransport"] = {}
+        self._cond = threading.Condition()
+        self._active: Dict[str, int] = {}   # request-uri HTTP/1.1 in curs pe host
+        self._http2_hosts = set()           # hosturi care au raspuns pe HTTP/2
+        self._connections: Dict[str, int] = {}
+        self._http2_requests: Dict[str, int] = {}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = _origin(request.url)
+        start = time.monotonic()
+        try:
+            response = self._send(request, key, timeout, verify, cert, proxies)
+        except Exception:
+            self._owner._record(request.url, time.monotonic() - start, error=True)
+            raise
+        self._owner._record(request.url, time.monotonic() - start, error=False)
+        return response
+
+    def close(self) -> None:
+        with self._cond:
+            transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            transport.close()
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Pe host: conexiuni deschise si request-uri servite pe HTTP/2."""
+        with self._cond:
+            return {
+                key: {"connections_opened": self._connections.get(key, 0),
+                      "http2_requests": self._http2_requests.get(key, 0)}
+                for key in set(self._connections) | set(self._http2_requests)
+            }
+
+    # ------------------------------------------------------------------ #
+    def _send(self, request, key, timeout, verify, cert, proxies):
+        transport = self._transport(request.url, verify, cert, proxies)
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = [
+            (name, value) for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP
+        ]
+
+        def trace(event, _info):
+            if event == "connection.connect_tcp.complete":
+                with self._cond:
+                    self._connections[key] = self._connections.get(key, 0) + 1
+
+        attempt = 0
+        while True:
+            release = self._acquire(key)
+            try:
+                response = transport.handle_request(httpx.Request(
+                    request.method, request.url, headers=headers, content=body,
+                    extensions={"timeout": _timeout(timeout).as_dict(), "trace": trace},
+                ))
+            except httpx.TransportError as e:
+                release()
+                error = _network_error(e, request)
+                delay = self._retry_delay(request, attempt, error=error)
+                if delay is None:
+                    raise error from e
+            except BaseException:
+                release()
+                raise
+            else:
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    break
+                response.close()
+                release()
+            time.sleep(delay)
+            attempt += 1
+
+        if response.http_version == "HTTP/2":
+            with self._cond:
+                self._http2_hosts.add(key)
+                self._http2_requests[key] = self._http2_requests.get(key, 0) + 1
+        return self._build_response(request, response, release)
+
+    def _retry_delay(self, request, attempt, response=None, error=None) -> Optional[float]:
+        if request.method not in _RETRY_METHODS:
+            return None
+        if response is not None:
+            if response.status_code not in _RETRY_STATUSES:
+                return None
+            return self._retry.delay(attempt, response.headers.get("Retry-After"))
+        if not transient_error(error):
+            return None
+        return self._retry.delay(attempt)
+
+    def _build_response(self, request, response, release) -> requests.Response:
+        # ca HTTPAdapter.build_response
+        r = requests.Response()
+        r.status_code = response.status_code
+        r.headers = CaseInsensitiveDict(response.headers.items())
+        r.encoding = get_encoding_from_headers(r.headers)
+        r.raw = _RawBody(response, release)
+        r.reason = response.reason_phrase
+        r.url = request.url
+        extract_cookies_to_jar(r.cookies, request, r.raw)
+        r.request = request
+        r.connection = self
+        return r
+
+    def _acquire(self, key: str):
+        """
+        Asteapta un loc HTTP/1.1 pe host (hosturile HTTP/2 nu au limita);
+        intoarce functia care il elibereaza.
+        """
+        with self._cond:
+            if key in self._http2_hosts:
+                return lambda: None
+            while self._active.get(key, 0) >= self.per_host_limit and key not in self._http2_hosts:
+                self._cond.wait()
+            if key in self._http2_hosts:
+                return lambda: None
+            self._active[key] = self._active.get(key, 0) + 1
+        released = []
+
+        def release():
+            with self._cond:
+                if released:
+                    return
+                released.append(True)
+                self._active[key] -= 1
+                self._cond.notify_all()
+
+        return release
+
+    def _transport(self, url, verify, cert, proxies) -> "httpx.HTTPTransport":
+        proxy = select_proxy(url, proxies)
+        prior_knowledge = self.cleartext and url.lower().startswith("http://")
+        config_key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy, prior_knowledge)
+        with self._cond:
+            transport = self._transports.get(config_key)
+            if transport is None:
+                transport = self._transports[config_key] = httpx.HTTPTransport(
+                    verify=_ssl_context(verify, cert),
+                    http1=not prior_knowledge,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=None,
+                        max_keepalive_connections=self.concurrency * self.per_host_limit,
+                    ),
+                    proxy=proxy,
+                    trust_env=False,  # requests a aplicat deja variabilele de mediu
+                    # ca urllib3: altfel frame-urile mici (HEADERS, WINDOW_UPDATE)
+                    # asteapta ACK-ul intarziat al serverului (Nagle)
+                    socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+                )
+        return transport
@@ -0,0 +1,183 @@
+# core/neardup.py
+# -*- coding: utf-8 -*-
+"""
+Detectarea paginilor aproape identice (SimHash) in timpul crawl-ului.
+
+Session ID-uri, ordini de sortare, vederi de tiparire sau parametri de
+tracking produc multe URL-uri cu acelasi continut. Fiecare pagina primeste
+o amprenta SimHash calculata din setul cuvintelor textului vizibil: doua
+pagini cu texte apropiate au amprente care difera in putini biti, iar o
+reordonare a acelorasi elemente nu schimba amprenta deloc. Fiecare cuvant
+distinct conteaza o singura data; ponderat dupa frecventa, cuvintele
+repetate ale sablonului ("produs", "pret") ar apropia pagini diferite.
+
+Amprenta are 128 de biti: doua SimHash-uri independente de 64. Pe un site cu
+sablon comun (navigatie, footer) paginile diferite au mult text identic, iar
+o singura amprenta de 64 de biti ajunge uneori, din intamplare, la distanta
+<= k; cerand ambele jumatati la distanta <= k, asemenea coincidente devin
+neglijabile.
+
+SimHashIndex gaseste o amprenta apropiata fara sa le compare pe toate:
+prima jumatate este impartita in k + 1 blocuri, iar doua amprente la
+distanta <= k au sigur (principiul cutiei) un bloc identic. Fiecare bloc are
+un dictionar valoare -> pagini, deci o cautare compara doar amprentele care
+au macar un bloc comun.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+import re
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from config import NEAR_DUP_DISTANCE, NEAR_DUP_MIN_WORDS
+
+if TYPE_CHECKING:
+    from utils.pathmap import PathMapper
+
+_HIDDEN = re.compile(
+    r"<!--.*?-->|<(script|style|noscript|template|svg)\b.*?</\1\s*>", re.S | re.I
+)
+_TAG = re.compile(r"<[^>]*>")
+_WORD = re.compile(r"\w+")
+
+_ALIAS_PAGE = (
+    '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+    '<meta http-equiv="refresh" content="0; url={href}">'
+    '<link rel="canonical" href="{href}"></head>'
+    '<body><a href="{href}">{href}</a></body></html>\n'
+)
+
+_BYTES = 16     # 128 de biti
+_HALF = (1 << 64) - 1
+# bit -> tabela bytes.translate: octet -> 1 daca bitul e setat, altfel 0
+_BIT_SET = [bytes(value >> bit & 1 for value in range(256)) for bit in range(8)]
+
+
+def page_words(html: str) -> List[str]:
+    """Cuvintele textului vizibil (fara script/style/comentarii), litere mici."""
+    text = _TAG.sub(" ", _HIDDEN.sub(" ", html))
+    return _WORD.findall(text.lower())
+
+
+def simhash(words, min_words: int = NEAR_DUP_MIN_WORDS) -> Optional[int]:
+    """
+    Amprenta SimHash de 128 de biti a unei liste de cuvinte sau None daca
+    textul are mai putin de `min_words` cuvinte distincte (prea putin text
+    pentru o comparatie sigura, ex. pagini facute doar din link-uri).
+    """
+    distinct = set(words)
+    if len(distinct) < min_words:
+        return None
+    # hash-urile cuvintelor lipite intr-un singur bytes; bitii sunt numarati
+    # pe coloane cu translate() si count(), in C, nu bit cu bit in Python
+    blake2b = hashlib.blake2b
+    blob = b"".join(
+        blake2b(word.encode("utf-8", "surrogatepass"), digest_size=_BYTES).digest()
+        for word in distinct
+    )
+    half = len(distinct) // 2
+    fingerprint = 0
+    for index in range(_BYTES):
+        column = blob[index::_BYTES]
+        for bit, table in enumerate(_BIT_SET):
+            if column.translate(table).count(1) > half:
+                fingerprint |= 1 << (8 * index + bit)
+    return fingerprint
+
+
+def distance(a: int, b: int) -> int:
+    """Distanta dintre doua amprente: maximul distantelor Hamming ale jumatatilor."""
+    diff = a ^ b
+    return max((diff & _HALF).bit_count(), (diff >> 64).bit_count())
+
+
+class SimHashIndex:
+    """
+    Amprentele paginilor pastrate, cu cautare dupa distanta Hamming.
+
+    Args:
+        distance: distanta maxima (biti diferiti in fiecare jumatate de 64)
+            intre doua pagini considerate aproape identice
+    """
+
+    def __init__(self, distance: int = NEAR_DUP_DISTANCE):
+        self.distance = max(0, min(int(distance), 31))
+        blocks = self.distance + 1
+        # blocuri de latimi cat mai egale: (deplasare, masca)
+        self._blocks: List[Tuple[int, int]] = []
+        shift = 0
+        for i in range(blocks):
+            width = 64 // blocks + (i < 64 % blocks)
+            self._blocks.append((shift, (1 << width) - 1))
+            shift += width
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in range(blocks)]
+        self._low = array("Q")
+        self._high = array("Q")
+        self._urls: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """URL-ul unei pagini la distanta <= distance sau None."""
+        low, high = fingerprint & _HALF, fingerprint >> 64
+        checked = set()
+        for (shift, mask), table in zip(self._blocks, self._tables):
+            for idx in table.get(low >> shift & mask, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                if ((self._low[idx] ^ low).bit_count() <= self.distance and
+                        (self._high[idx] ^ high).bit_count() <= self.distance):
+                    return self._urls[idx]
+        return None
+
+    def add(self, fingerprint: int, url: str) -> None:
+        idx = len(self._urls)
+        low = fingerprint & _HALF
+        self._low.append(low)
+        self._high.append(fingerprint >> 64)
+        self._urls.append(url)
+        for (shift, mask), table in zip(self._blocks, self._tables):
+            table.setdefault(low >> shift & mask, []).append(idx)
+
+    def match_or_add(self, fingerprint: int, url: str) -> Optional[str]:
+        """Pagina originala daca `url` e un duplicat, altfel il adauga (None)."""
+        original = self.find(fingerprint)
+        if original is None:
+            self.add(fingerprint, url)
+        return original
+
+    def memory_bytes(self) -> int:
+        """Aproximativ: amprentele, listele din blocuri si URL-urile (pointeri)."""
+        buckets = sum(len(table) for table in self._tables)
+        return (
+            16 * len(self._urls)
+            + 8 * len(self._urls) * (len(self._tables) + 1)
+            + 120 * buckets
+        )
+
+
+def write_alias_pages(aliases: Dict[str, str], pathmap: "PathMapper") -> int:
+    """
+    Pentru fiecare alias (url -> pagina originala) fara fisier propriu scrie
+    o pagina minima care redirectioneaza spre copia locala a originalului,
+    astfel incat link-urile spre alias din alte pagini nu raman rupte.
+    Intoarce numarul de pagini scrise.
+    """
+    written = 0
+    for alias, original in aliases.items():
+        path = pathmap.path_for_page(alias)
+        # query-ul nu face parte din cale: ?sort=... are deja fisierul paginii
+        if os.path.exists(path):
+            continue
+        href = html.escape(pathmap.rel_href(alias, original, is_page=True), quote=True)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_ALIAS_PAGE.format(href=href))
+        written += 1
+    return written
@@ -0,0 +1,192 @@
+# core/pipeline.py
+# -*- coding: utf-8 -*-
+"""
+Pipeline pe stagii pentru un job de clonare.
+
+Crawl-ul, rescrierea paginilor si descarcarea resurselor ruleaza in acelasi
+timp, legate prin cozi limitate:
+
+    DomainCrawler --page_sink--> [coada] -> rescriere (N workeri)
+                  --resource_sink--> [coada] -> download (M workeri)
+
+Cand o coada e plina, put() blocheaza producatorul (backpressure), deci
+crawler-ul nu poate aduna in memorie mai multe pagini decat poate scrie
+stagiul urmator. Fiecare stagiu tine metrici proprii: elemente procesate,
+erori, adancimea cozii, timpul in care producatorul a asteptat si gradul
+de ocupare al workerilor.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class Stage:
+    """
+    Un stagiu: o coada limitata si `workers` thread-uri care apeleaza
+    `handler(item)` pentru fiecare element.
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._threads = []
+        self._lock = threading.Lock()
+
+        # metrici
+        self.submitted = 0
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self._depth_total = 0
+        self.blocked_time = 0.0   # cat a asteptat producatorul la o coada plina
+        self.busy_time = 0.0      # timp total petrecut de workeri in handler
+        self._started = None
+        self._stopped = None
+
+    # ------------------------------------------------------------------ #
+    def start(self) -> None:
+        self._started = time.monotonic()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def put(self, item: Any) -> bool:
+        """Pune un element in coada; blocheaza cat timp e plina. False la anulare."""
+        depth = self._queue.qsize()
+        with self._lock:
+            self.submitted += 1
+            self._depth_total += depth
+            self.max_depth = max(self.max_depth, depth)
+        start = time.monotonic()
+        while not config.CANCELLED:
+            try:
+                self._queue.put(item, timeout=0.2)
+                break
+            except queue.Full:
+                continue
+        with self._lock:
+            self.blocked_time += time.monotonic() - start
+        return not config.CANCELLED
+
+    def close(self) -> None:
+        """Nu mai vin elemente: workerii se opresc dupa ce golesc coada."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+
+    def join(self) -> None:
+        for t in self._threads:
+            t.join()
+        self._stopped = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if config.CANCELLED:
+                continue  # golim coada fara sa mai lucram
+            start = time.monotonic()
+            ok = True
+            try:
+                self.handler(item)
+            except Exception as e:
+                ok = False
+                logger.error("Stagiul %s a esuat pentru %r: %s", self.name, item, e)
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self.busy_time += elapsed
+                self.processed += ok
+                self.failed += (not ok)
+
+    # ------------------------------------------------------------------ #
+    def stats(self) -> Dict[str, float]:
+        end = self._stopped or time.monotonic()
+        wall = end - self._started if self._started else 0.0
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "processed": self.processed,
+                "failed": self.failed,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self.max_depth,
+                "avg_queue_depth": self._depth_total / self.submitted if self.submitted else 0.0,
+                "producer_blocked_s": self.blocked_time,
+                "utilization": self.busy_time / (wall * self.workers) if wall else 0.0,
+            }
+
+
+class StagedPipeline:
+    """
+    Leaga crawler-ul de stagiile de rescriere si download.
+
+    Args:
+        write_page: functie (url, html) care rescrie si salveaza o pagina
+        download_resource: functie (url, pagina_sursa) care descarca o resursa
+        process_workers: thread-uri pentru rescrierea paginilor
+        download_workers: thread-uri pentru descarcarea resurselor
+        queue_size: capacitatea fiecarei cozi dintre stagii
+    """
+
+    def __init__(
+        self,
+        write_page: Callable[[str, str], Any],
+        download_resource: Callable[[str, Optional[str]], Any],
+        process_workers: int = config.PROCESS_WORKERS,
+        download_workers: int = config.DOWNLOAD_WORKERS,
+        queue_size: int = config.STAGE_QUEUE_SIZE,
+    ):
+        self.process = Stage("process", lambda item: write_page(*item), process_workers, queue_size)
+        self.download = Stage("download", lambda item: download_resource(*item), download_workers, queue_size)
+        self._finished = False
+
+    def start(self) -> None:
+        self.process.start()
+        self.download.start()
+
+    # sink-urile date crawler-ului ------------------------------------- #
+    def page_sink(self, url: str, html: str) -> None:
+        self.process.put((url, html))
+
+    def resource_sink(self, urls: Iterable[str], src_page: Optional[str] = None) -> None:
+        # crawler-ul trimite doar resursele noi, deci nu mai deduplicam aici
+        for url in urls:
+            if not self.download.put((url, src_page)):
+                return
+
+    # ------------------------------------------------------------------ #
+    def finish(self) -> None:
+        """Asteapta golirea cozilor: intai paginile, apoi resursele."""
+        if self._finished:
+            return
+        self._finished = True
+        self.process.close()
+        self.process.join()
+        self.download.close()
+        self.download.join()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {"process": self.process.stats(), "download": self.download.stats()}
+
+    def log_stats(self) -> None:
+        for name, st in self.stats().items():
+            logger.info(
+                "Stagiul %s: %d workeri, %d procesate, %d erori, coada medie %.1f / max %d, "
+                "producator blocat %.1fs, ocupare %.0f%%",
+                name, st["workers"], st["processed"], st["failed"],
+                st["avg_queue_depth"], st["max_queue_depth"],
+                st["producer_blocked_s"], 100.0 * st["utilization"],
+            )
@@ -19,15 +19,19 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup, Comment
 
+from core.extractor import (
+    FORM, INLINE_CSS, PAGE, RESOURCE, SRCSET, STYLE_BLOCK, iter_refs, parse_html,
+    rewrite_css_urls,
+)
 from utils.constants import EXCLUDED_EXTENSIONS, RESOURCE_TYPES
 from utils.helpers import ensure_dir, ext_from_url, write_text_file
 from utils.pathmap import PathMapper
+from utils.urlcanon import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -55,29 +59,8 @@ def _is_external(url: str, base_url: str) -> bool:
         return True
 
 def _rewrite_css_urls(css_text: str, source_url: str, convert_func) -> str:
-    """Rescrie url() si @import din CSS."""
-    def _repl_url(m):
-        raw = m.group(1).strip('\'"')
-        return f'url("{convert_func(raw, source_url, False)}")'
-
-    css_text = re.sub(
-        r"url\s*\(\s*['\"]?([^'\"()]+)['\"]?\s*\)",
-        _repl_url,
-        css_text,
-        flags=re.IGNORECASE,
-    )
-
-    def _repl_import(m):
-        raw = m.group(1).strip('\'"')
-        return f'@import "{convert_func(raw, source_url, False)}"'
-
-    css_text = re.sub(
-        r"@import\s+['\"]([^'\"]+)['\"]",
-        _repl_import,
-        css_text,
-        flags=re.IGNORECASE,
-    )
-    return css_text
+    """Rescrie url(), @import si image-set() din CSS (scanner-ul din extractor)."""
+    return rewrite_css_urls(css_text, lambda raw: convert_func(raw, source_url, False))
 
 
 class ContentProcessor:
@@ -126,7 +109,7 @@ class ContentProcessor:
         new_base_url: Optional[str] = None,
     ) -> str:
         """Proceseaza o singura pagina HTML."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = parse_html(html_content)
 
         if self.inject_base and new_base_url:
             self._ensure_base_tag(soup, new_base_url)
@@ -161,27 +144,18 @@ class ContentProcessor:
             (soup.head or soup.insert(0, soup.new_tag("head"))).insert(0, base)
 
     def _rewrite_links_and_resources(self, soup: BeautifulSoup, source_url: str):
-        # linkuri pagini
-        for tag in soup.find_all(["a", "area", "form"]):
-            attr = "href" if tag.name != "form" else "action"
-            if tag.get(attr):
+        # o singura parcurgere a arborelui pentru toate tipurile de referinte
+        for tag, attr, kind in iter_refs(soup):
+            if kind in (PAGE, FORM):
                 tag[attr] = self._convert_url(tag[attr], source_url, is_page=True)
-
-        # resurse statice
-        for tag in soup.find_all(["img", "input", "source", "link", "script"]):
-            attr = "src" if tag.name in ("img", "input", "source", "script") else "href"
-            if tag.get(attr):
+            elif kind == RESOURCE:
                 tag[attr] = self._convert_url(tag[attr], source_url, is_page=False)
-            # srcset special
-            if tag.name in ("img", "source") and tag.get("srcset"):
-                tag["srcset"] = self._rewrite_srcset(tag["srcset"], source_url)
-
-        # stil inline + <style>
-        for tag in soup.find_all(style=True):
-            tag["style"] = _rewrite_css_urls(tag["style"], source_url, self._convert_url)
-        for style_tag in soup.find_all("style"):
-            if style_tag.string:
-                style_tag.string = _rewrite_css_urls(style_tag.string, source_url, self._convert_url)
+            elif kind == SRCSET:
+                tag[attr] = self._rewrite_srcset(tag[attr], source_url)
+            elif kind == INLINE_CSS:
+                tag[attr] = _rewrite_css_urls(tag[attr], source_url, self._convert_url)
+            elif kind == STYLE_BLOCK:
+                tag.string = _rewrite_css_urls(tag.string, source_url, self._convert_url)
 
     def _rewrite_srcset(self, srcset: str, source_url: str) -> str:
         out = []
@@ -205,7 +179,7 @@ class ContentProcessor:
         if raw_url.lower().startswith(_IGNORE_SCHEMES):
             return raw_url
 
-        abs_url = urljoin(source_url, raw_url)
+        abs_url = canonicalize_url(urljoin(source_url, raw_url))
         ext = ext_from_url(abs_url)            # ① <‑‑ adaugi linia asta
 
         # ----- resursa statica ------------------------------------------
@@ -0,0 +1,263 @@
+# core/resilience.py
+# -*- coding: utf-8 -*-
+"""
+Retry-uri si circuit breaker pe host, comune crawler-ului si downloader-ului
+de resurse.
+
+RetryPolicy decide daca un request esuat merita repetat si cat se asteapta:
+backoff exponential cu "full jitter" (aleator intre 0 si
+RETRY_BACKOFF * 2^incercare, cel mult RETRY_MAX_DELAY), dar niciodata mai
+putin decat cere Retry-After. Se repeta doar erorile trecatoare: conexiune
+refuzata/intrerupta, timeout-uri si 408/425/429/5xx.
+
+CircuitBreaker numara esecurile consecutive ale fiecarui host (erori de
+retea si 5xx; 429 inseamna "mai rar", nu "cazut", si il trateaza
+AIMDController). Dupa BREAKER_THRESHOLD esecuri circuitul se deschide:
+request-urile spre host esueaza imediat cu CircuitOpenError, fara retea,
+BREAKER_COOLDOWN secunde. Apoi un singur request de proba trece; daca
+reuseste circuitul se inchide, altfel pauza se dubleaza (pana la
+BREAKER_MAX_COOLDOWN).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+import config
+from core.concurrency import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+SERVER_FAILURES = frozenset({500, 502, 503, 504})
+
+try:
+    import aiohttp
+    _AIOHTTP_TRANSIENT = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+    _AIOHTTP_PERMANENT = (aiohttp.ClientSSLError, aiohttp.InvalidURL)
+except ImportError:
+    _AIOHTTP_TRANSIENT = _AIOHTTP_PERMANENT = ()
+
+# certificatul sau URL-ul nu se schimba de la o incercare la alta
+_PERMANENT = (requests.exceptions.SSLError, requests.exceptions.InvalidURL) + _AIOHTTP_PERMANENT
+_TRANSIENT = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    asyncio.TimeoutError,
+) + _AIOHTTP_TRANSIENT
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Hostul are circuitul deschis; request-ul nu a mai fost trimis."""
+
+
+def transient_error(error: BaseException) -> bool:
+    """Eroare de retea care poate disparea la o noua incercare."""
+    return (isinstance(error, _TRANSIENT) and not isinstance(error, _PERMANENT)
+            and not isinstance(error, CircuitOpenError))
+
+
+class RetryPolicy:
+    """
+    Args:
+        retries: incercari suplimentare dupa primul request
+        backoff: baza backoff-ului exponential, in secunde
+        max_delay: asteptarea maxima intre incercari; un Retry-After mai
+            lung opreste retry-urile (hostul e oprit de AIMDController)
+    """
+
+    def __init__(
+        self,
+        retries: int = config.DEFAULT_RETRIES,
+        backoff: float = config.RETRY_BACKOFF,
+        max_delay: float = config.RETRY_MAX_DELAY,
+    ):
+        self.retries = max(0, int(retries))
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.retried = 0
+        self.gave_up = 0
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Secundele de asteptat inainte de incercarea `attempt` + 1 (0 = primul
+        request) sau None daca nu se mai incearca.
+        """
+        wait = random.uniform(0.0, min(self.max_delay, self.backoff * 2 ** attempt))
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            wait = max(wait, requested)
+        with self._lock:
+            if attempt >= self.retries or wait > self.max_delay:
+                self.gave_up += 1
+                return None
+            self.retried += 1
+        return wait
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_until", "cooldown", "probing", "trips", "rejected")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_until = 0.0
+        self.cooldown = 0.0
+        self.probing = 0.0      # momentul la care a plecat proba (0 = nicio proba)
+        self.trips = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Starea circuitului pe host, sigura din mai multe thread-uri.
+
+    Args:
+        threshold: esecuri consecutive dupa care circuitul se deschide
+        cooldown: prima pauza a unui host cu circuitul deschis (secunde)
+        max_cooldown: pauza maxima dupa probe esuate repetat
+    """
+
+    def __init__(
+        self,
+        threshold: int = config.BREAKER_THRESHOLD,
+        cooldown: float = config.BREAKER_COOLDOWN,
+        max_cooldown: float = config.BREAKER_MAX_COOLDOWN,
+    ):
+        self.threshold = max(1, int(threshold))
+        self.cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self._hosts: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def check(self, host: str) -> None:
+        """Ridica CircuitOpenError daca hostul nu poate primi acum un request."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or not state.opened_until:
+                return
+            # o singura proba dupa pauza; una care nu s-a intors in `cooldown`
+            # secunde (ex. anulata) nu mai blocheaza hostul
+            if now >= state.opened_until and (
+                    not state.probing or now - state.probing >= state.cooldown):
+                state.probing = now
+                return
+            state.rejected += 1
+        raise CircuitOpenError(f"Circuit deschis pentru {host}")
+
+    def record(self, host: str, ok: bool) -> None:
+        """Rezultatul unui request trimis (ok: raspuns HTTP care nu e 5xx)."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if ok:
+                if state is not None and (state.failures or state.opened_until):
+                    if state.opened_until:
+                        logger.info("Circuit inchis pentru %s", host)
+                    state.failures = 0
+                    state.opened_until = state.probing = state.cooldown = 0.0
+                return
+            if state is None:
+                state = self._hosts[host] = _Circuit()
+            state.failures += 1
+            if state.opened_until:
+                if not state.probing:
+                    return  # raspunsul intarziat al unui request de dinainte
+                state.cooldown = min(self.max_cooldown, 2 * state.cooldown)
+            elif state.failures >= self.threshold:
+                state.cooldown = self.cooldown
+            else:
+                return
+            state.opened_until = time.monotonic() + state.cooldown
+            state.probing = 0.0
+            state.trips += 1
+            cooldown, failures = state.cooldown, state.failures
+        logger.warning(
+            "Circuit deschis pentru %s dupa %d esecuri consecutive: pauza %.0fs",
+            host, failures, cooldown,
+        )
+
+    def open_remaining(self, host: str) -> float:
+        """Secunde pana la proba urmatoare (0 daca circuitul e inchis)."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or not state.opened_until:
+                return 0.0
+            return max(0.0, state.opened_until - time.monotonic())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                host: {
+                    "open": bool(state.opened_until),
+                    "failures": state.failures,
+                    "trips": state.trips,
+                    "rejected": state.rejected,
+                }
+                for host, state in self._hosts.items()
+                if state.trips
+            }
+
+    def log_stats(self) -> None:
+        """Scrie hosturile la care circuitul s-a deschis macar o data."""
+        for host, st in sorted(self.stats().items()):
+            logger.info(
+                "Circuit %s: deschis de %d ori, %d request-uri evitate%s",
+                host, st["trips"], st["rejected"], " (inca deschis)" if st["open"] else "",
+            )
+
+
+def retry_delay(
+    retry: Optional[RetryPolicy],
+    breaker: Optional[CircuitBreaker],
+    host: str,
+    attempt: int,
+    status: Optional[int] = None,
+    retry_after: Optional[str] = None,
+    error: Optional[BaseException] = None,
+) -> Optional[float]:
+    """
+    Inregistreaza rezultatul unei incercari (raspuns cu `status` sau
+    `error`) si intoarce secundele de asteptat inainte de urmatoarea,
+    sau None daca rezultatul e final.
+    """
+    transient = error is not None and transient_error(error)
+    if breaker is not None and not isinstance(error, CircuitOpenError):
+        breaker.record(host, ok=error is None and status not in SERVER_FAILURES)
+    if retry is None:
+        return None
+    if not (transient or (error is None and status in RETRY_STATUSES)):
+        return None
+    if breaker is not None and breaker.open_remaining(host):
+        return None  # hostul a cazut: URL-urile lui esueaza imediat
+    return retry.delay(attempt, retry_after)
+
+
+def sleep(delay: float) -> bool:
+    """Asteapta `delay` secunde; False daca jobul a fost anulat intre timp."""
+    deadline = time.monotonic() + delay
+    while not config.CANCELLED:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(remaining, 0.2))
+    return False
+
+
+async def sleep_async(delay: float) -> bool:
+    """Varianta asyncio pentru sleep()."""
+    deadline = time.monotonic() + delay
+    while not config.CANCELLED:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        await asyncio.sleep(min(remaining, 0.2))
+    return False
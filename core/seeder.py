@@ -0,0 +1,207 @@
+# core/seeder.py
+# -*- coding: utf-8 -*-
+"""
+Insamantarea frontierei inainte de urmarirea link-urilor.
+
+Doua surse de URL-uri, folosite inainte ca motorul de crawling sa porneasca:
+
+* sitemap-urile declarate in robots.txt (sau /sitemap.xml daca nu e
+  declarat niciunul), cu sitemap index-uri si fisiere .gz; XML-ul este parsat in flux
+  (iterparse peste raspunsul HTTP), deci un sitemap de zeci de MB nu este
+  tinut in memorie;
+* dictionarul COMMON_PATH_GUESSES, verificat in paralel cu request-uri HEAD
+  (GET doar daca serverul nu accepta HEAD).
+
+Cu un planificator (PolitenessScheduler), caile interzise de robots.txt nu
+sunt verificate, iar fiecare request consuma un jeton din rata hostului, ca
+paginile din frontiera.
+
+Paginile adanci ajung astfel in frontiera dintr-o singura runda, nu dupa
+max_depth salturi succesive.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+from urllib.parse import urljoin, urlsplit
+from xml.etree import ElementTree
+
+import requests
+
+from config import DEFAULT_TIMEOUT, PROBE_WORKERS, SITEMAP_MAX_FILES
+from utils.constants import COMMON_PATH_GUESSES
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _local(tag: str) -> str:
+    """Numele elementului fara namespace ({http://...}loc -> loc)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+class SiteSeeder:
+    """
+    Gaseste URL-uri de pagini pentru un site inainte de crawl.
+
+    Args:
+        session: sesiunea HTTP comuna jobului
+        base_url: URL-ul de pornire (canonic)
+        accept: functie url -> bool; URL-urile respinse nu sunt intoarse
+        max_urls: cate URL-uri sunt intoarse cel mult
+        robots: RobotFileParser deja incarcat pentru host (liniile Sitemap:)
+        path_guesses: cai verificate direct pe host
+        scheduler: PolitenessScheduler prin care trec request-urile
+            (robots.txt si rata pe host); fara el nu se aplica nicio limita
+        workers: verificari de cai simultane
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        accept: Callable[[str], bool],
+        max_urls: int,
+        robots=None,
+        path_guesses: Optional[List[str]] = None,
+        workers: int = PROBE_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        scheduler=None,
+    ):
+        self.session = session
+        self.base_url = base_url
+        self.accept = accept
+        self.max_urls = max_urls
+        self.robots = robots
+        self.path_guesses = COMMON_PATH_GUESSES if path_guesses is None else path_guesses
+        self.workers = workers
+        self.timeout = timeout
+        self.scheduler = scheduler
+
+        self.sitemaps_read = 0
+        self.from_sitemaps = 0
+        self.from_guesses = 0
+
+    # ------------------------------------------------------------------ #
+    def iter_seeds(self) -> Iterator[str]:
+        """
+        URL-urile gasite: intai cele din sitemap-uri (in flux), apoi caile
+        ghicite care raspund cu HTML. Verificarile de cai ruleaza in paralel
+        cu citirea sitemap-urilor.
+        """
+        emitted = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="probe") as pool:
+            probes = [
+                pool.submit(self._probe, urljoin(self.base_url, path))
+                for path in self.path_guesses
+                if path != "/robots.txt"
+            ]
+            for url in self._iter_sitemap_urls():
+                if emitted >= self.max_urls:
+                    break
+                if self.accept(url):
+                    emitted += 1
+                    self.from_sitemaps += 1
+                    yield url
+            for future in probes:
+                url = future.result()
+                if url and emitted < self.max_urls and self.accept(url):
+                    emitted += 1
+                    self.from_guesses += 1
+                    yield url
+
+    # ------------------------------------------------------------------ #
+    # Sitemap-uri
+    # ------------------------------------------------------------------ #
+    def _sitemap_roots(self) -> List[str]:
+        roots = list((self.robots.site_maps() if self.robots is not None else None) or [])
+        if not roots:
+            roots = [urljoin(self.base_url, "/sitemap.xml")]
+        return roots
+
+    def _iter_sitemap_urls(self) -> Iterator[str]:
+        pending = self._sitemap_roots()
+        seen = set(pending)
+        while pending and self.sitemaps_read < SITEMAP_MAX_FILES:
+            sitemap_url = pending.pop(0)
+            self.sitemaps_read += 1
+            for kind, loc in self._parse_sitemap(sitemap_url):
+                if kind == "sitemap":
+                    if loc not in seen:
+                        seen.add(loc)
+                        pending.append(loc)
+                else:
+                    yield loc
+
+    def _parse_sitemap(self, sitemap_url: str) -> Iterator[tuple]:
+        """Intoarce ("url"|"sitemap", loc) pe masura ce fisierul este citit."""
+        if not self._acquire(sitemap_url):
+            return
+        try:
+            response = self.session.get(sitemap_url, timeout=self.timeout, stream=True)
+        except requests.RequestException as e:
+            logger.debug("Sitemap indisponibil %s: %s", sitemap_url, e)
+            return
+        try:
+            if response.status_code != 200:
+                return
+            response.raw.decode_content = True  # Content-Encoding: gzip
+            response.raw.auto_close = False      # BufferedReader citeste pana la EOF
+            stream = io.BufferedReader(response.raw, 64 * 1024)
+            if stream.peek(2)[:2] == _GZIP_MAGIC:  # fisier .xml.gz
+                stream = gzip.GzipFile(fileobj=stream)
+
+            root = container = None
+            for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+                name = _local(elem.tag)
+                if event == "start":
+                    if root is None:
+                        root, container = elem, name  # urlset sau sitemapindex
+                    continue
+                if name == "loc" and elem.text:
+                    loc = elem.text.strip()
+                    yield ("sitemap" if container == "sitemapindex" else "url"), loc
+                elif name in ("url", "sitemap"):
+                    root.clear()  # memoria ramane constanta pe fisiere mari
+        except (ElementTree.ParseError, OSError, EOFError, requests.RequestException) as e:
+            logger.warning("Sitemap invalid %s: %s", sitemap_url, e)
+        finally:
+            response.close()
+
+    # ------------------------------------------------------------------ #
+    # Cai ghicite
+    # ------------------------------------------------------------------ #
+    def _acquire(self, url: str) -> bool:
+        """Asteapta randul request-ului in rata hostului; False la anulare."""
+        return self.scheduler is None or self.scheduler.acquire(url)
+
+    def _probe(self, url: str) -> Optional[str]:
+        """URL-ul final daca pagina exista si e HTML, altfel None."""
+        if self.scheduler is not None and not self.scheduler.allowed(url):
+            return None
+        try:
+            if not self._acquire(url):
+                return None
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (405, 501):  # HEAD neacceptat
+                if not self._acquire(url):
+                    return None
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True)
+                response.close()
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        content_type = response.headers.get("content-type", "text/html").lower()
+        if "text/html" not in content_type:
+            return None
+        final = response.url or url
+        # redirectul catre alt host (ex. login extern) nu este o pagina a site-ului
+        if urlsplit(final).netloc != urlsplit(self.base_url).netloc:
+            return None
+        return final
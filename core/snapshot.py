@@ -0,0 +1,198 @@
+# core/snapshot.py
+# -*- coding: utf-8 -*-
+"""
+Validatori HTTP pentru re-snapshot incremental al unui folder de iesire.
+
+Pentru fiecare URL descarcat se pastreaza, in `<folder>/VALIDATORS_FILE`
+(config.VALIDATORS_FILE),
+ETag-ul, Last-Modified, hash-ul continutului si calea copiei locale; pentru
+pagini si link-urile / resursele extrase. La rularea urmatoare in acelasi
+folder, crawler-ul si downloader-ul trimit If-None-Match / If-Modified-Since:
+
+* 304 -> copia locala ramane neatinsa; pentru pagini, link-urile si
+  resursele salvate sunt refolosite, deci crawl-ul continua ca si cum
+  pagina ar fi fost descarcata;
+* 200 cu acelasi hash (server fara validatori) -> continutul nu mai este
+  rescris pe disc.
+
+Cererile conditionale se trimit doar daca copia locala inca exista.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import VALIDATORS_FILE
+
+logger = logging.getLogger(__name__)
+
+# Rezultatul unui fetch pentru o pagina nemodificata (304 sau acelasi hash)
+NOT_MODIFIED = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    path TEXT,
+    refs BLOB
+);
+"""
+
+_UPSERT = (
+    "INSERT INTO validators (url, etag, last_modified, content_hash, path, refs) "
+    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET "
+    "etag = excluded.etag, last_modified = excluded.last_modified, "
+    "content_hash = excluded.content_hash, path = excluded.path, refs = excluded.refs"
+)
+
+
+def validators_path(folder: str) -> str:
+    return os.path.join(folder, VALIDATORS_FILE)
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def find_snapshot(output_folder: str, job_url: str) -> Optional[str]:
+    """
+    Ultimul folder dintre folder, folder_1, folder_2, ... care are validatorii
+    unui snapshot anterior pentru acelasi URL.
+    """
+    found = None
+    candidate, counter = output_folder, 0
+    while os.path.isdir(candidate):
+        path = validators_path(candidate)
+        if os.path.exists(path):
+            try:
+                conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                try:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'job_url'").fetchone()
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.warning("Validatori ilizibili %s: %s", path, e)
+                row = None
+            if row is not None and row[0] == job_url:
+                found = candidate
+        counter += 1
+        candidate = f"{output_folder}_{counter}"
+    return found
+
+
+class ValidatorStore:
+    """
+    Validatorii tuturor URL-urilor dintr-un folder de iesire.
+
+    Args:
+        folder: folderul de iesire (baza se pastreaza intre rulari)
+        job_url: URL-ul cerut de utilizator (identifica snapshot-ul)
+        pathmap: PathMapper-ul jobului, pentru calea locala a paginilor
+        commit_every: cate scrieri se strang inainte de commit
+    """
+
+    def __init__(self, folder: str, job_url: str, pathmap=None, commit_every: int = 200):
+        self.path = validators_path(folder)
+        self.pathmap = pathmap
+        self.commit_every = commit_every
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('job_url', ?)", (job_url,)
+            )
+        self._uncommitted = 0
+        self._pending = {}  # pagina -> validatori, scrisi impreuna cu link-urile
+        self.known = self.conn.execute("SELECT COUNT(*) FROM validators").fetchone()[0]
+
+    # ------------------------------------------------------------------ #
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since pentru URL, daca avem o copie locala."""
+        if not self.known:
+            return {}
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, path FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified, path = row
+        if not path or not os.path.exists(path):
+            return {}
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def unchanged(self, url: str, body: bytes) -> bool:
+        """True daca un raspuns 200 are acelasi continut ca data trecuta."""
+        if not self.known:
+            return False
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content_hash, path FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+        return bool(row and row[0] == content_hash(body) and row[1] and os.path.exists(row[1]))
+
+    def record(self, url: str, headers, body: bytes, path: Optional[str] = None) -> None:
+        """
+        Validatorii unui raspuns 200. Pentru o resursa (path dat) sunt scrisi
+        imediat; pentru o pagina (path din pathmap) abia la record_refs, ca
+        o pagina fara link-uri salvate sa nu fie niciodata considerata actuala.
+        """
+        row = (url, headers.get("ETag"), headers.get("Last-Modified"), content_hash(body))
+        if path is not None:
+            self._write(_UPSERT, row + (path, None))
+            return
+        with self._lock:
+            self._pending[url] = row
+
+    def record_refs(self, url: str, links: Iterable[str], resources: Iterable[str]) -> None:
+        """Link-urile si resursele unei pagini, refolosite cand pagina raspunde 304."""
+        with self._lock:
+            row = self._pending.pop(url, None)
+        if row is None:
+            return
+        path = self.pathmap.path_for_page(url) if self.pathmap is not None else None
+        blob = zlib.compress(json.dumps([list(links), list(resources)]).encode("utf-8"))
+        self._write(_UPSERT, row + (path, blob))
+
+    def refs(self, url: str) -> Tuple[List[str], List[str]]:
+        with self._lock:
+            row = self.conn.execute("SELECT refs FROM validators WHERE url = ?", (url,)).fetchone()
+        if not row or row[0] is None:
+            return [], []
+        links, resources = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        return links, resources
+
+    # ------------------------------------------------------------------ #
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self.conn.execute(sql, params)
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.conn.commit()
+                self._uncommitted = 0
+
+    def close(self) -> None:
+        if self.conn is None:
+            return
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
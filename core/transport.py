@@ -0,0 +1,348 @@
+# core/transport.py
+# -*- coding: utf-8 -*-
+"""
+Stratul de transport HTTP comun pentru un job de clonare.
+
+Un singur PooledSession este creat de job si injectat in DomainCrawler si
+ResourceDownloader, astfel incat conexiunile keep-alive (TCP + TLS) sunt
+refolosite intre pagini si resurse. Pool-ul este dimensionat dupa nivelul
+de concurenta, iar pool_stats() expune statistici pe host pentru reglaj.
+
+Cu un DNSCache, conexiunile noi iau adresele hostului din cache (incercate
+pe rand, ca in urllib3), iar prewarm() rezolva un host nou si deschide in
+fundal o conexiune in pool-ul pe care il va folosi primul request spre el.
+
+Cu `http2` (httpx + h2 instalate), request-urile https:// trec prin
+Http2Adapter (core/http2.py): toate request-urile spre un host care accepta
+HTTP/2 impart o singura conexiune, celelalte raman pe HTTP/1.1.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError, EmptyPoolError, NameResolutionError, NewConnectionError,
+)
+from urllib3.util.retry import Retry
+
+from config import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PER_HOST_LIMIT,
+    DEFAULT_RETRIES,
+    DEFAULT_USER_AGENT,
+    HTTP2_CLEARTEXT,
+    HTTP2_ENABLED,
+    PREWARM_TIMEOUT,
+    PREWARM_WORKERS,
+)
+from core.http2 import Http2Adapter, http2_available
+
+if TYPE_CHECKING:
+    from core.dnscache import DNSCache
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def host_key(url: str) -> str:
+    """scheme://host:port - cheia folosita pentru statisticile pe host."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    port = parts.port or _DEFAULT_PORTS.get(scheme)
+    return f"{scheme}://{(parts.hostname or '').lower()}:{port}"
+
+
+class _ResolvingConnection:
+    """
+    Conexiune urllib3 care ia adresele hostului dintr-un DNSCache.
+
+    Depinde de interne urllib3 2.x (_new_conn conecteaza la _dns_host), la
+    fel ca prewarm() (_get_conn / _put_conn); versiunea minora testata e
+    fixata in requirements.txt, iar tests/test_transport.py le verifica.
+    """
+
+    resolver: "DNSCache" = None
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = self.resolver.lookup(host)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        error = None
+        # adresele pe rand, ca socket.create_connection; SNI si Host raman numele
+        for address in dict.fromkeys(sockaddr[0] for *_info, sockaddr in addresses):
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        self.resolver.forget(host)  # poate hostul s-a mutat intre timp
+        if error is None:  # raspuns DNS fara nicio adresa
+            raise NameResolutionError(
+                self.host, self, socket.gaierror(socket.EAI_NONAME, "no addresses for host")
+            )
+        raise error
+
+
+def _resolving_pools(resolver: "DNSCache"):
+    """Clasele de pool (http, https) cu conexiuni rezolvate prin `resolver`."""
+    pools = {}
+    for scheme, pool_cls, conn_cls in (
+        ("http", HTTPConnectionPool, HTTPConnection),
+        ("https", HTTPSConnectionPool, HTTPSConnection),
+    ):
+        connection = type(conn_cls.__name__, (_ResolvingConnection, conn_cls), {"resolver": resolver})
+        pools[scheme] = type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": connection})
+    return pools
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter care numara request-urile, erorile si latenta pe host."""
+
+    def __init__(self, owner: "PooledSession", **kwargs):
+        self._owner = owner
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self._owner.resolver is not None:
+            self.poolmanager.pool_classes_by_scheme = _resolving_pools(self._owner.resolver)
+
+    def send(self, request, **kwargs):
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self._owner._record(request.url, time.monotonic() - start, error=True)
+            raise
+        self._owner._record(request.url, time.monotonic() - start, error=False)
+        return response
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session cu pool de conexiuni dimensionat si retry-uri configurate.
+
+    Args:
+        concurrency: numarul total de request-uri simultane ale jobului
+        per_host_limit: conexiuni pastrate (si permise simultan) pe host
+        retries: retry-uri pentru erori de conexiune si 502/503/504
+        headers: header-e implicite (User-Agent etc.)
+        resolver: DNSCache comun jobului (optional)
+        http2: request-urile https:// prin Http2Adapter (HTTP/2 negociat
+            prin ALPN); ignorat, cu un avertisment, fara httpx si h2
+        http2_cleartext: si request-urile http:// pe HTTP/2, fara negociere
+            (h2c, doar pentru servere care il accepta)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        retries: int = DEFAULT_RETRIES,
+        headers: Optional[Dict[str, str]] = None,
+        resolver: Optional["DNSCache"] = None,
+        http2: bool = HTTP2_ENABLED,
+        http2_cleartext: bool = HTTP2_CLEARTEXT,
+    ):
+        super().__init__()
+        self.resolver = resolver
+        self.concurrency = max(1, int(concurrency))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+        if headers:
+            self.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._host_stats: Dict[str, Dict[str, float]] = {}
+        self._warmed = set()      # hosturi pregatite prin prewarm()
+        self._prewarm_executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self.prewarmed = 0        # conexiuni deschise in avans
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = _CountingAdapter(
+            self,
+            pool_connections=self.concurrency,   # cate host-uri tinem in cache
+            pool_maxsize=self.per_host_limit,    # conexiuni keep-alive pe host
+            pool_block=True,                     # nu deschide conexiuni peste limita
+            max_retries=retry,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+        self.http2 = False
+        if http2 and not http2_available():
+            logger.warning("HTTP/2 cere pachetele httpx si h2; se foloseste HTTP/1.1")
+        elif http2:
+            adapter = Http2Adapter(self, self.concurrency, self.per_host_limit, retries,
+                                   cleartext=http2_cleartext)
+            self.mount("https://", adapter)
+            if http2_cleartext:
+                self.mount("http://", adapter)
+            self.http2 = True
+
+    # ------------------------------------------------------------------ #
+    def prewarm(self, url: str, connect: bool = True) -> bool:
+        """
+        Rezolva in fundal hostul URL-ului si, cu `connect`, deschide o
+        conexiune (TCP + TLS) in pool-ul lui, ca primul request spre host sa
+        nu mai astepte. True daca hostul e nou (fara request-uri si
+        nepregatit inca).
+        """
+        try:
+            key = host_key(url)
+        except ValueError:
+            return False
+        if not key.startswith(("http://", "https://")):
+            return False
+        with self._lock:
+            if self._closed or key in self._warmed or key in self._host_stats:
+                return False
+            self._warmed.add(key)
+            if self._prewarm_executor is None:
+                self._prewarm_executor = ThreadPoolExecutor(
+                    max_workers=PREWARM_WORKERS, thread_name_prefix="prewarm"
+                )
+            self._prewarm_executor.submit(self._prewarm, url, connect)
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._prewarm_executor is not None:
+                self._prewarm_executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+    def _prewarm(self, url: str, connect: bool) -> None:
+        try:
+            if self.resolver is not None:
+                self.resolver.lookup(urlsplit(url).hostname)
+            if connect:
+                self._open_connection(url)
+        except Exception as e:  # doar o optimizare: primul request va reincerca
+            logger.debug("Conexiunea spre %s nu a putut fi pregatita: %s", url, e)
+
+    def _open_connection(self, url: str) -> None:
+        # acelasi pool ca request-ul real: aceleasi setari TLS si proxy
+        adapter = self.get_adapter(url)
+        if not isinstance(adapter, _CountingAdapter):
+            return  # conexiunile httpx (HTTP/2) se deschid la primul request
+        settings = self.merge_environment_settings(url, {}, None, None, None)
+        request = requests.Request("GET", url).prepare()
+        pool = adapter.get_connection_with_tls_context(
+            request, settings["verify"], settings["proxies"], settings["cert"]
+        )
+        try:
+            conn = pool._get_conn(timeout=0)
+        except EmptyPoolError:
+            return  # toate conexiunile hostului sunt deja folosite
+        try:
+            if conn.sock is None:
+                conn.timeout = PREWARM_TIMEOUT
+                conn.connect()
+                with self._lock:
+                    self.prewarmed += 1
+        except Exception:
+            conn.close()
+            raise
+        finally:
+            pool._put_conn(conn)
+
+    def _record(self, url: str, elapsed: float, error: bool) -> None:
+        key = host_key(url)
+        with self._lock:
+            st = self._host_stats.setdefault(
+                key, {"requests": 0, "errors": 0, "total_time": 0.0}
+            )
+            st["requests"] += 1
+            st["errors"] += int(error)
+            st["total_time"] += elapsed
+
+    def pool_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistici pe host: request-uri, erori, latenta medie pana la
+        header-e, conexiuni deschise (urllib3 sau httpx), conexiuni inactive
+        in pool-ul urllib3, request-uri servite pe HTTP/2 si rata de
+        refolosire a conexiunilor.
+        """
+        with self._lock:
+            stats = {
+                key: {
+                    "requests": st["requests"],
+                    "errors": st["errors"],
+                    "avg_latency_ms": 1000.0 * st["total_time"] / st["requests"],
+                    "connections_opened": 0,
+                    "idle_connections": 0,
+                    "http2_requests": 0,
+                }
+                for key, st in self._host_stats.items()
+                if st["requests"]
+            }
+
+        empty = {"requests": 0, "errors": 0, "avg_latency_ms": 0.0,
+                 "connections_opened": 0, "idle_connections": 0, "http2_requests": 0}
+        for adapter in set(self.adapters.values()):
+            if isinstance(adapter, Http2Adapter):
+                for key, conn in adapter.connection_stats().items():
+                    st = stats.setdefault(key, dict(empty))
+                    st["connections_opened"] += conn["connections_opened"]
+                    st["http2_requests"] += conn["http2_requests"]
+                continue
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None:
+                continue
+            for pool_key in list(manager.pools.keys()):
+                pool = manager.pools.get(pool_key)
+                if pool is None:
+                    continue
+                port = pool.port or _DEFAULT_PORTS.get(pool.scheme)
+                key = f"{pool.scheme}://{pool.host}:{port}"
+                st = stats.setdefault(key, dict(empty))
+                st["connections_opened"] += pool.num_connections
+                # coada e umpluta cu None pana la pool_maxsize; doar conexiunile conteaza
+                idle = list(pool.pool.queue) if pool.pool else []
+                st["idle_connections"] += sum(conn is not None for conn in idle)
+
+        for st in stats.values():
+            opened, reqs = st["connections_opened"], st["requests"]
+            st["reuse_ratio"] = 1.0 - opened / reqs if reqs and opened <= reqs else 0.0
+        return stats
+
+    def log_pool_stats(self) -> None:
+        """Scrie statisticile pool-ului in log (util pentru reglarea limitelor)."""
+        if self.prewarmed:
+            logger.info("Pool: %d conexiuni deschise in avans", self.prewarmed)
+        for key, st in sorted(self.pool_stats().items()):
+            logger.info(
+                "Pool %s: %d request-uri, %d erori, %.0f ms latenta medie, "
+                "%d conexiuni deschise, %d inactive, %d pe HTTP/2, refolosire %.0f%%",
+                key, st["requests"], st["errors"], st["avg_latency_ms"],
+                st["connections_opened"], st["idle_connections"],
+                st["http2_requests"], 100.0 * st["reuse_ratio"],
+            )
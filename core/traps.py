@@ -0,0 +1,262 @@
+# core/traps.py
+# -*- coding: utf-8 -*-
+"""
+Detectarea capcanelor pentru crawler: spatii de URL-uri generate automat
+(calendare, paginare fara sfarsit, combinatii de parametri de query, path-uri
+cu segmente repetate) care ar consuma tot bugetul max_pages.
+
+Fiecare URL nou este redus la un sablon: hostul, path-ul cu partile variabile
+inlocuite ({n} pentru numere, {id} pentru identificatori lungi) si cheile
+sortate ale query-ului, fara valori:
+
+    /calendar/2031/01/15?view=day   ->  host/calendar/{n}/{n}/{n}?view
+    /s/3fa9c0d18e/product/p17       ->  host/s/{id}/product/p{n}
+
+Pentru fiecare sablon se tin din mers:
+
+    urls         URL-uri unice admise; peste TRAP_TEMPLATE_LIMIT sablonul e oprit
+    growth       URL-uri noi ale sablonului gasite, in medie, pe o pagina
+                 scanata a aceluiasi sablon. Filtrele combinate (fiecare
+                 pagina de cautare da link-uri spre alte zeci de combinatii)
+                 cresc mereu; intr-un catalog produsele vin din categorii,
+                 iar "produse similare" sunt de obicei deja cunoscute. Peste
+                 TRAP_MAX_GROWTH, dupa TRAP_MIN_PAGES pagini, sablonul e oprit.
+    generations  lantul cel mai lung de pagini ale sablonului, fiecare
+                 descoperita pe precedenta. Un calendar (luna urmatoare), o
+                 paginare fara sfarsit sau un session ID nou pe fiecare
+                 pagina cresc cu o generatie la fiecare pagina. Peste
+                 TRAP_MAX_GENERATIONS sablonul e oprit.
+
+Pe langa acestea, un URL cu un segment de path repetat de mai mult de
+TRAP_MAX_SEGMENT_REPEAT ori (/a/b/a/b/a/b), cu mai mult de
+TRAP_MAX_QUERY_PARAMS parametri, mai lung de TRAP_MAX_URL_LENGTH sau cu o
+data (an/luna, an-luna, year=) la mai mult de TRAP_DATE_YEARS_AHEAD ani in
+viitor opreste direct sablonul sau: link-ul "luna urmatoare" al unui
+calendar ajunge acolo dupa cateva zeci de pagini. Canonicalizarea sorteaza parametrii dupa cheie, dar
+pastreaza ordinea valorilor unei chei repetate (?c=1&c=2 fata de ?c=2&c=1);
+o asemenea permutare a unui URL deja admis este respinsa.
+
+Fiecare sablon oprit este scris in log o singura data, cu motivul; URL-urile
+lui aflate deja in frontiera sunt sarite la extragere.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import (
+    TRAP_DATE_YEARS_AHEAD, TRAP_MAX_GENERATIONS, TRAP_MAX_GROWTH, TRAP_MAX_QUERY_PARAMS, TRAP_MAX_SEGMENT_REPEAT,
+    TRAP_MAX_URL_LENGTH, TRAP_MIN_PAGES, TRAP_TEMPLATE_LIMIT,
+)
+from core.frontier import url_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_DIGITS = re.compile(r"\d+")
+# identificatori: hex de cel putin 8 caractere sau siruri lungi cu cifre
+_HEX_ID = re.compile(r"[0-9a-fA-F]{8,}")
+_LONG_ID = re.compile(r"[\w-]{16,}")
+# an urmat de luna (/2031/01, 2031-01-15) sau un parametru year=
+_DATE = re.compile(r"(?<!\d)((?:19|20|21)\d\d)[/-](?:0?[1-9]|1[0-2])(?!\d)|\byear=(\d{4})(?!\d)", re.I)
+
+
+def _segment_shape(segment: str) -> str:
+    if not any(ch.isdigit() for ch in segment):
+        return segment
+    if _HEX_ID.fullmatch(segment) or (_LONG_ID.fullmatch(segment) and "-" not in segment):
+        return "{id}"
+    return _DIGITS.sub("{n}", segment)
+
+
+def url_template(url: str) -> str:
+    """Sablonul unui URL: host, path cu partile variabile inlocuite, chei de query."""
+    parts = urlsplit(url)
+    path = "/".join(_segment_shape(segment) for segment in parts.path.split("/"))
+    if not parts.query:
+        return parts.netloc + path
+    keys = sorted({pair.partition("=")[0] for pair in parts.query.split("&") if pair})
+    return f"{parts.netloc}{path}?{'&'.join(keys)}"
+
+
+def _unordered_query(url: str) -> Optional[str]:
+    """URL-ul cu perechile de query sortate complet, daca o cheie se repeta."""
+    base, _sep, query = url.partition("?")
+    pairs = query.split("&")
+    keys = [pair.partition("=")[0] for pair in pairs]
+    if len(set(keys)) == len(keys):
+        return None
+    return base + "?" + "&".join(sorted(pairs))
+
+
+class _Template:
+    __slots__ = ("urls", "pages", "found", "generations", "blocked", "reason")
+
+    def __init__(self):
+        self.urls = 0
+        self.pages = 0          # pagini ale sablonului scanate
+        self.found = 0          # URL-uri noi ale sablonului gasite pe ele
+        self.generations = 0
+        self.blocked = 0
+        self.reason = None  # motivul opririi (None = sablon activ)
+
+
+class TrapDetector:
+    """
+    Statisticile pe sablon de URL si sabloanele oprite.
+
+    Args:
+        template_limit: URL-uri unice admise pe sablon
+        max_growth: URL-uri noi ale sablonului pe pagina a sablonului
+        min_pages: pagini ale sablonului scanate inainte de a judeca cresterea
+        max_generations: generatii de auto-crestere admise pe sablon
+        max_segment_repeat: de cate ori poate aparea un segment in path
+        max_query_params: parametri de query admisi intr-un URL
+        max_url_length: lungimea maxima a unui URL
+        date_years_ahead: cati ani in viitor poate fi o data din URL
+    """
+
+    def __init__(
+        self,
+        template_limit: int = TRAP_TEMPLATE_LIMIT,
+        max_growth: float = TRAP_MAX_GROWTH,
+        min_pages: int = TRAP_MIN_PAGES,
+        max_generations: int = TRAP_MAX_GENERATIONS,
+        max_segment_repeat: int = TRAP_MAX_SEGMENT_REPEAT,
+        max_query_params: int = TRAP_MAX_QUERY_PARAMS,
+        max_url_length: int = TRAP_MAX_URL_LENGTH,
+        date_years_ahead: int = TRAP_DATE_YEARS_AHEAD,
+    ):
+        self.template_limit = max(1, int(template_limit))
+        self.max_growth = max_growth
+        self.min_pages = max(1, int(min_pages))
+        self.max_generations = max(1, int(max_generations))
+        self.max_segment_repeat = max(1, int(max_segment_repeat))
+        self.max_query_params = max(1, int(max_query_params))
+        self.max_url_length = max(1, int(max_url_length))
+        self.max_year = time.localtime().tm_year + max(0, int(date_years_ahead))
+        self._templates: Dict[str, _Template] = {}
+        # amprenta URL -> generatie, doar pentru URL-urile cu generatie > 0
+        self._generation: Dict[int, int] = {}
+        # amprentele formelor sortate ale URL-urilor cu chei de query repetate
+        self._unordered = set()
+        self._parent: Tuple[Optional[str], str] = (None, "")
+        self.blocked = 0
+
+    def page_done(self, url: str) -> None:
+        """O pagina a fost scanata (numitorul cresterii sablonului ei)."""
+        state = self._templates.get(url_template(url))
+        if state is not None:
+            state.pages += 1
+
+    def admit(self, url: str, parent: Optional[str] = None) -> bool:
+        """
+        Inregistreaza un URL nou (canonic) descoperit pe pagina `parent`;
+        False daca sablonul lui este (sau tocmai a fost) oprit.
+        """
+        template = url_template(url)
+        state = self._templates.get(template)
+        if state is None:
+            state = self._templates[template] = _Template()
+        if state.reason is None:
+            reason = self._static_reason(url)
+            if reason is not None:
+                self._cut(template, state, reason)
+        if state.reason is not None or self._permutation(url):
+            state.blocked += 1
+            self.blocked += 1
+            return False
+
+        generation = 0
+        if parent is not None and self._template_of(parent) == template:
+            state.found += 1
+            generation = self._generation.get(url_fingerprint(parent), 0) + 1
+            self._generation[url_fingerprint(url)] = generation
+        state.urls += 1
+        if generation > state.generations:
+            state.generations = generation
+        if state.urls > self.template_limit:
+            self._cut(template, state, f"peste {self.template_limit} URL-uri unice")
+        elif state.pages >= self.min_pages and state.found > self.max_growth * state.pages:
+            self._cut(template, state, f"{state.found / state.pages:.1f} URL-uri noi "
+                                       f"pe pagina a sablonului")
+        elif generation > self.max_generations:
+            self._cut(template, state, f"peste {self.max_generations} generatii descoperite "
+                                       f"din propriile pagini")
+        else:
+            return True
+        state.blocked += 1
+        self.blocked += 1
+        return False
+
+    def cut_off(self, url: str) -> bool:
+        """URL-ul apartine unui sablon oprit (ex. pus in frontiera inainte de oprire)."""
+        state = self._templates.get(url_template(url))
+        return state is not None and state.reason is not None
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Sabloanele oprite: motiv, URL-uri admise inainte, link-uri respinse."""
+        return {
+            template: {
+                "reason": state.reason,
+                "urls": state.urls,
+                "generations": state.generations,
+                "blocked": state.blocked,
+            }
+            for template, state in self._templates.items()
+            if state.reason is not None
+        }
+
+    def log_stats(self) -> None:
+        """Scrie sabloanele oprite in timpul crawl-ului."""
+        for template, st in sorted(self.stats().items()):
+            logger.info(
+                "Capcana %s: %d URL-uri admise, %d link-uri respinse (%s)",
+                template, st["urls"], st["blocked"], st["reason"],
+            )
+
+    # ------------------------------------------------------------------ #
+    def _template_of(self, parent: str) -> str:
+        # link-urile unei pagini vin unul dupa altul: sablonul paginii se
+        # calculeaza o singura data
+        if self._parent[0] != parent:
+            self._parent = (parent, url_template(parent))
+        return self._parent[1]
+
+    def _permutation(self, url: str) -> bool:
+        unordered = _unordered_query(url)
+        if unordered is None:
+            return False
+        fingerprint = url_fingerprint(unordered)
+        if fingerprint in self._unordered:
+            return True
+        self._unordered.add(fingerprint)
+        return False
+
+    def _static_reason(self, url: str) -> Optional[str]:
+        if len(url) > self.max_url_length:
+            return f"URL mai lung de {self.max_url_length} caractere"
+        parts = urlsplit(url)
+        if parts.query and parts.query.count("&") + 1 > self.max_query_params:
+            return f"peste {self.max_query_params} parametri de query"
+        for match in _DATE.finditer(url, len(parts.scheme) + 3 + len(parts.netloc)):
+            year = int(match.group(1) or match.group(2))
+            if year > self.max_year:
+                return f"data din anul {year}, dupa {self.max_year}"
+        segments = [segment for segment in parts.path.split("/") if segment]
+        if len(segments) > self.max_segment_repeat:
+            segment, count = Counter(segments).most_common(1)[0]
+            if count > self.max_segment_repeat:
+                return f"segmentul '{segment}' repetat de {count} ori in path"
+        return None
+
+    def _cut(self, template: str, state: _Template, reason: str) -> None:
+        state.reason = reason
+        logger.warning(
+            "Capcana pentru crawler: sablonul %s oprit (%s); %d URL-uri admise pana acum",
+            template, reason, state.urls,
+        )
@@ -0,0 +1,8 @@
+# tests/conftest.py
+# -*- coding: utf-8 -*-
+"""Testele importa modulele din radacina proiectului (config, core, utils)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
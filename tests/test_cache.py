@@ -0,0 +1,126 @@
+# tests/test_cache.py
+# -*- coding: utf-8 -*-
+"""Prospetimea raspunsurilor si ResponseCache (Vary, revalidare, redirect-uri)."""
+
+import email.utils
+import sqlite3
+import time
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from core.cache import ResponseCache, freshness_lifetime
+
+
+def headers(**values):
+    return CaseInsensitiveDict({name.replace("_", "-"): value for name, value in values.items()})
+
+
+def http_date(offset=0.0):
+    return email.utils.formatdate(time.time() + offset, usegmt=True)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"))
+    yield cache
+    cache.close()
+
+
+def test_max_age_minus_age():
+    assert freshness_lifetime(headers(cache_control="public, max-age=600", age="100")) == 500
+
+
+def test_max_age_wins_over_expires():
+    lifetime = freshness_lifetime(headers(cache_control="max-age=60", expires=http_date(3600)))
+    assert lifetime == 60
+
+
+def test_expires_relative_to_date():
+    lifetime = freshness_lifetime(headers(date=http_date(), expires=http_date(300)))
+    assert lifetime == pytest.approx(300, abs=2)
+
+
+def test_invalid_expires_is_stale():
+    assert freshness_lifetime(headers(expires="0", etag='"v1"')) == 0.0
+
+
+def test_heuristic_is_capped():
+    lifetime = freshness_lifetime(headers(date=http_date(), last_modified=http_date(-100 * 86400)))
+    assert lifetime == 24 * 3600.0
+    lifetime = freshness_lifetime(headers(date=http_date(), last_modified=http_date(-1000)))
+    assert lifetime == pytest.approx(100, abs=1)
+
+
+def test_no_store_and_unusable_entries():
+    assert freshness_lifetime(headers(cache_control="no-store, max-age=600")) is None
+    # fara prospetime si fara validatori intrarea nu ar putea fi folosita
+    assert freshness_lifetime(headers(cache_control="no-cache")) is None
+    assert freshness_lifetime(headers(cache_control="no-cache", etag='"v1"')) == 0.0
+
+
+@pytest.mark.parametrize("vary", ["Cookie", "accept-encoding, User-Agent", "*"])
+def test_vary_is_refused(vary):
+    assert freshness_lifetime(headers(cache_control="max-age=600", vary=vary)) is None
+
+
+def test_vary_accept_encoding_is_kept():
+    assert freshness_lifetime(headers(cache_control="max-age=600", vary="Accept-Encoding")) == 600
+
+
+def test_store_and_lookup(cache):
+    assert cache.lookup("http://example.com/a") is None
+    assert cache.store("http://example.com/a", headers(cache_control="max-age=600"), b"body")
+    cached = cache.lookup("http://example.com/a")
+    assert cached.fresh and cached.body == b"body"
+    assert cached.final_url == "http://example.com/a"
+    assert cache.stats()["hits"] == 1
+
+
+def test_vary_response_is_not_stored(cache):
+    assert not cache.store("http://example.com/a", headers(cache_control="max-age=600", vary="Cookie"), b"x")
+    assert cache.lookup("http://example.com/a") is None
+
+
+def test_redirect_target_is_kept(cache):
+    cache.store("http://example.com/dir", headers(cache_control="max-age=600"), b"x",
+                "http://example.com/dir/")
+    assert cache.lookup("http://example.com/dir").final_url == "http://example.com/dir/"
+
+
+def test_stale_entry_is_revalidated(cache):
+    cache.store("http://example.com/a", headers(cache_control="no-cache", etag='"v1"'), b"x")
+    cached = cache.lookup("http://example.com/a")
+    assert not cached.fresh
+    assert cached.conditional_headers() == {"If-None-Match": '"v1"'}
+    cache.revalidated("http://example.com/a", headers(cache_control="max-age=600"))
+    assert cache.lookup("http://example.com/a").fresh
+
+
+def test_shared_objects_and_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), max_bytes=250)
+    fresh = headers(cache_control="max-age=600")
+    cache.store("http://a.example/x", fresh, b"1" * 100)
+    cache.store("http://b.example/x", fresh, b"1" * 100)  # acelasi obiect
+    assert cache.total_bytes == 100
+    cache.store("http://c.example/x", fresh, b"2" * 100)
+    cache.store("http://d.example/x", fresh, b"3" * 100)
+    assert cache.total_bytes <= 250
+    assert cache.lookup("http://d.example/x") is not None
+    cache.close()
+
+
+def test_index_without_final_url_is_migrated(tmp_path):
+    folder = tmp_path / "cache"
+    folder.mkdir()
+    conn = sqlite3.connect(str(folder / "index.sqlite"))
+    conn.execute(
+        "CREATE TABLE entries (url TEXT PRIMARY KEY, hash TEXT NOT NULL, headers TEXT NOT NULL,"
+        " expires REAL NOT NULL, last_access REAL NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+    cache = ResponseCache(str(folder))
+    cache.store("http://example.com/", headers(cache_control="max-age=600"), b"x")
+    assert cache.lookup("http://example.com/").final_url == "http://example.com/"
+    cache.close()
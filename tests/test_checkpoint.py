@@ -0,0 +1,70 @@
+# tests/test_checkpoint.py
+# -*- coding: utf-8 -*-
+"""CrawlCheckpoint: starile URL-urilor si bufferele scrise din mai multe thread-uri."""
+
+import sqlite3
+import threading
+
+from core.checkpoint import CrawlCheckpoint, DONE, QUEUED, WRITTEN, find_resumable_job
+
+
+def rows(checkpoint, sql):
+    conn = sqlite3.connect(checkpoint.path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def test_status_updates_keep_depth(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path), "http://example.com/")
+    checkpoint.url_queued("http://example.com/a", 2)
+    checkpoint.url_queued("http://example.com/b", 1)
+    checkpoint.flush()
+    checkpoint.url_done("http://example.com/a", 2)
+    checkpoint.page_written("http://example.com/b")
+    checkpoint.resources_found(["http://example.com/s.css"])
+    checkpoint.resource_done("http://example.com/s.css")
+    checkpoint.close()
+    assert sorted(rows(checkpoint, "SELECT url, depth, status FROM urls")) == [
+        ("http://example.com/a", 2, DONE),
+        ("http://example.com/b", 1, WRITTEN),
+    ]
+    assert rows(checkpoint, "SELECT url, done FROM resources") == [("http://example.com/s.css", 1)]
+
+
+def test_resumable_job_is_found(tmp_path):
+    out = tmp_path / "site"
+    (tmp_path / "site").mkdir()
+    (tmp_path / "site_1").mkdir()
+    CrawlCheckpoint(str(tmp_path / "site_1"), "http://example.com/").close()
+    assert find_resumable_job(str(out), "http://example.com/") == str(tmp_path / "site_1")
+    assert find_resumable_job(str(out), "http://other.example/") is None
+
+
+def test_concurrent_appends_are_not_lost(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path), "http://example.com/", interval=0)
+    threads, per_thread = 8, 500
+    stop = threading.Event()
+
+    def flusher():
+        while not stop.is_set():
+            checkpoint.flush()
+
+    def worker(n):
+        for i in range(per_thread):
+            checkpoint.url_queued(f"http://example.com/{n}/{i}", 1)
+            checkpoint.resource_done(f"http://example.com/{n}/{i}.png")
+
+    flushing = threading.Thread(target=flusher)
+    flushing.start()
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    stop.set()
+    flushing.join()
+    checkpoint.close()
+    assert rows(checkpoint, f"SELECT COUNT(*) FROM urls WHERE status = '{QUEUED}'") == [(threads * per_thread,)]
+    assert rows(checkpoint, "SELECT COUNT(*) FROM resources WHERE done = 1") == [(threads * per_thread,)]
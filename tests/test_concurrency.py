@@ -0,0 +1,127 @@
+# tests/test_concurrency.py
+# -*- coding: utf-8 -*-
+"""AIMDController: crestere aditiva, scadere multiplicativa, Retry-After."""
+
+import threading
+
+import pytest
+
+from core import concurrency
+from core.concurrency import AIMDController, parse_retry_after
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(concurrency.time, "monotonic", clock)
+    return clock
+
+
+def fill(controller, host):
+    """Ia toate sloturile libere ale hostului; intoarce cate au fost luate."""
+    taken = 0
+    while controller.try_acquire(host):
+        taken += 1
+    return taken
+
+
+def ok(controller, host, clock, latency=0.1):
+    started = clock.now
+    clock.now += latency
+    controller.observe(host, started, 200)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after(" 7 ") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in trecut
+    assert parse_retry_after("soon") is None
+
+
+def test_slots_follow_the_limit(clock):
+    controller = AIMDController(initial=3, min_limit=1, max_limit=10)
+    assert fill(controller, "h") == 3
+    controller.release("h")
+    assert controller.try_acquire("h")
+    assert controller.acquire("h", timeout=0) is False
+    assert controller.stats()["h"]["in_flight"] == 3
+
+
+def test_additive_increase_only_when_the_limit_is_used(clock):
+    controller = AIMDController(initial=2, max_limit=4)
+    for _ in range(20):
+        ok(controller, "idle", clock)  # niciun request in zbor
+    assert controller.limit("idle") == 2
+    fill(controller, "busy")
+    for _ in range(2):
+        ok(controller, "busy", clock)  # +1/limita pe raspuns: 2.5, 2.9
+    assert controller.limit("busy") == 2
+    ok(controller, "busy", clock)
+    assert controller.limit("busy") == 3
+    fill(controller, "busy")
+    for _ in range(50):
+        ok(controller, "busy", clock)
+    assert controller.limit("busy") == 4  # max_limit
+
+
+def test_overload_halves_once_per_window(clock):
+    controller = AIMDController(initial=8, min_limit=1, max_limit=16, decrease=0.5)
+    started = clock.now
+    clock.now += 1
+    controller.observe("h", started, 503)
+    assert controller.limit("h") == 4
+    controller.observe("h", started, 429)  # pornit inainte de scadere
+    assert controller.limit("h") == 4
+    started = clock.now
+    clock.now += 1
+    controller.observe("h", started, error=True)
+    assert controller.limit("h") == 2
+    for _ in range(5):
+        started = clock.now
+        clock.now += 1
+        controller.observe("h", started, 503)
+    assert controller.limit("h") == 1  # min_limit
+    reasons = [reason for _t, _limit, reason in controller.history("h")]
+    assert reasons == ["start", "HTTP 503", "eroare", "HTTP 503"]
+
+
+def test_retry_after_pauses_the_host(clock):
+    controller = AIMDController(initial=4)
+    started = clock.now
+    controller.observe("h", started, 200, retry_after="30")
+    assert controller.limit("h") == 2
+    assert controller.pause_remaining("h") == 30.0
+    assert not controller.try_acquire("h")
+    clock.now += 30
+    assert controller.try_acquire("h")
+
+
+def test_rising_latency_decreases_the_limit(clock):
+    controller = AIMDController(initial=8, latency_tolerance=2.0)
+    for _ in range(10):
+        ok(controller, "h", clock, latency=0.1)
+    assert controller.limit("h") == 8
+    for _ in range(10):
+        ok(controller, "h", clock, latency=1.0)
+    assert controller.limit("h") < 8
+    assert "latenta" in [reason for _t, _limit, reason in controller.history("h")]
+
+
+def test_acquire_waits_for_a_release():
+    controller = AIMDController(initial=1)
+    assert controller.acquire("h")
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(controller.acquire("h", timeout=5)))
+    waiter.start()
+    controller.release("h")
+    waiter.join(5)
+    assert got == [True]
@@ -0,0 +1,126 @@
+# tests/test_crawler.py
+# -*- coding: utf-8 -*-
+"""DomainCrawler contra unui server HTTP local (motoarele sync si async)."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.crawler import DomainCrawler
+
+SITE = {
+    "/": '<a href="/dir">d</a> <a href="/p1.html">1</a> <a href="/p2.html">2</a> <img src="/i.png">',
+    "/dir/": '<a href="x.html">x</a>',
+    "/dir/x.html": "<p>x</p>",
+    "/p1.html": '<a href="/p3.html">3</a> <img src="/j.png">',
+    "/p2.html": "<p>2</p>",
+    "/p3.html": "<p>3</p>",
+}
+EXPECTED = {"/", "/dir/", "/dir/x.html", "/p1.html", "/p2.html", "/p3.html"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/dir":
+            self.send_response(301)
+            self.send_header("Location", "/dir/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = SITE.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        body = f"<html><body>{body}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Cache-Control", "max-age=600")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def crawl(base, **options):
+    crawler = DomainCrawler(base + "/", 3, 50, True, False, [], respect_robots=False, seed=False, **options)
+    try:
+        pages, resources = crawler.crawl()[:2]
+    finally:
+        crawler.close()
+    return crawler, pages, resources
+
+
+def paths(base, urls):
+    return {url[len(base):] for url in urls}
+
+
+@pytest.mark.parametrize("engine", ["sync", "threads", "async"])
+def test_engines_find_the_same_pages(server, engine):
+    if engine == "async":
+        pytest.importorskip("aiohttp")
+    _crawler, pages, resources = crawl(server, engine=engine)
+    assert paths(server, pages) == EXPECTED
+    assert paths(server, resources) == {"/i.png", "/j.png"}
+
+
+def test_async_sinks_run_off_the_event_loop(server):
+    pytest.importorskip("aiohttp")
+    sunk, threads = [], set()
+
+    def page_sink(url, html):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05)  # scriere lenta sau coada plina
+        sunk.append(url)
+
+    crawler, pages, _resources = crawl(server, engine="async", page_sink=page_sink,
+                                       resource_sink=lambda urls, page: None)
+    assert pages == {}
+    assert paths(server, sunk) == EXPECTED
+    assert paths(server, crawler.page_index) == EXPECTED
+    assert threads and threading.main_thread().name not in threads
+
+
+def test_cached_redirect_keeps_its_target(server, tmp_path):
+    from core.cache import ResponseCache
+
+    cache = ResponseCache(str(tmp_path / "cache"))
+    try:
+        for _ in range(2):  # a doua oara paginile vin din cache
+            _crawler, pages, _resources = crawl(server, cache=cache)
+            assert paths(server, pages) == EXPECTED
+        assert cache.stats()["hits"] >= len(EXPECTED)
+    finally:
+        cache.close()
+
+
+def test_async_engine_with_a_full_pipeline(server):
+    pytest.importorskip("aiohttp")
+    from core.pipeline import StagedPipeline
+
+    written, downloaded = [], []
+
+    def write_page(url, html):
+        time.sleep(0.05)
+        written.append(url)
+
+    pipeline = StagedPipeline(write_page, lambda url, page: downloaded.append(url),
+                              process_workers=1, download_workers=1, queue_size=1)
+    pipeline.start()
+    crawl(server, engine="async", page_sink=pipeline.page_sink, resource_sink=pipeline.resource_sink)
+    pipeline.finish()
+    assert paths(server, written) == EXPECTED
+    assert paths(server, downloaded) == {"/i.png", "/j.png"}
@@ -0,0 +1,80 @@
+# tests/test_css_urls.py
+# -*- coding: utf-8 -*-
+"""Scanner-ul CSS dintr-o singura trecere: url(), @import, image-set()."""
+
+import re
+from urllib.parse import urljoin
+
+import pytest
+
+from core.extractor import extract_css_urls, iter_css_urls, rewrite_css_urls
+
+BASE = "http://example.com/css/site.css"
+
+
+def baseline_css_urls(css_content, base_url):
+    """Extragerea initiala (DomainCrawler._extract_css_urls, trei regex-uri)."""
+    urls = set()
+    patterns = [
+        r'url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)',
+        r'@import\s+["\']([^"\']+)["\']',
+        r'@import\s+url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)',
+    ]
+    for pattern in patterns:
+        for match in re.finditer(pattern, css_content, re.IGNORECASE):
+            url = match.group(1).strip()
+            if url and not url.startswith(("data:", "javascript:", "#")):
+                urls.add(urljoin(base_url, url))
+    return urls
+
+
+CSS = [
+    "a { background: url(img/a.png) }",
+    "a { background: url('img/b.png') }",
+    'a { background: url( "../img/c.png" ) }',
+    "a { background: URL(d.png) no-repeat }",
+    '@import "reset.css";',
+    "@import 'print.css' print;",
+    "@import url(theme.css);",
+    '@import url("fonts.css") screen;',
+    "@font-face { src: url(f.woff2) format('woff2'), url(f.woff) format('woff') }",
+    "a { background: url(data:image/png;base64,AAAA) }",
+    "a { background: url(#grad) }",
+    "a{b:url(/abs.png)}c{d:url(//cdn.example.com/x.png)}",
+    "a { content: 'curl(nope)' }",
+    "@import;",
+    "",
+    "no urls here",
+]
+
+
+@pytest.mark.parametrize("css", CSS)
+def test_same_urls_as_the_original_regexes(css):
+    assert extract_css_urls(css, BASE) == baseline_css_urls(css, BASE)
+
+
+def test_image_set():
+    css = ('a { background: image-set("a.avif" type("image/avif") 1x, url(b.png) 2x); '
+           "b: -webkit-image-set('c.png' 1x) }")
+    assert [ref.url for ref in iter_css_urls(css)] == ["a.avif", "b.png", "c.png"]
+
+
+def test_spans_and_quoting():
+    css = 'a{b:url( "x.png" )} @import "y.css"; c{d:url(z.png)}'
+    refs = list(iter_css_urls(css))
+    assert [(css[ref.start:ref.end], ref.quoted) for ref in refs] == [
+        ("x.png", True), ("y.css", True), ("z.png", False),
+    ]
+
+
+def test_rewrite_keeps_the_rest_of_the_text():
+    css = "a { b: url(x.png) } @import 'y.css'; /* url */ c { d: url(\"z.png\") }"
+    rewritten = rewrite_css_urls(css, lambda url: "local/" + url)
+    assert rewritten == "a { b: url(\"local/x.png\") } @import 'local/y.css'; /* url */ c { d: url(\"local/z.png\") }"
+    assert rewrite_css_urls("a { color: red }", lambda url: 1 / 0) == "a { color: red }"
+
+
+def test_rewrite_and_scan_agree():
+    css = " ".join(CSS)
+    rewritten = rewrite_css_urls(css, lambda url: "r/" + url)
+    assert [ref.url for ref in iter_css_urls(rewritten)] == ["r/" + ref.url.strip() for ref in iter_css_urls(css)]
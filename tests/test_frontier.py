@@ -0,0 +1,163 @@
+# tests/test_frontier.py
+# -*- coding: utf-8 -*-
+"""Frontierele: deduplicare la inserare, ordinea BFS si ordinea dupa scor."""
+
+import sqlite3
+
+import pytest
+
+from core.frontier import (
+    BloomFilter,
+    FingerprintSet,
+    Frontier,
+    PriorityFrontier,
+    SQLiteFrontier,
+    UrlScorer,
+    url_fingerprint,
+)
+from utils.urlcanon import canonicalize_url
+
+
+def drain(frontier):
+    items = []
+    while frontier:
+        items.append(frontier.pop())
+    return items
+
+
+def test_fingerprint_is_stable_signed_64_bit():
+    fp = url_fingerprint("http://example.com/")
+    assert fp == url_fingerprint("http://example.com/")
+    assert -2 ** 63 <= fp < 2 ** 63
+    assert fp != url_fingerprint("http://example.com")
+
+
+def test_fingerprint_set_across_compactions():
+    fps = FingerprintSet()
+    urls = [f"http://example.com/{i}" for i in range(20000)]
+    assert all(fps.add(url) for url in urls)
+    assert not fps.add(urls[0]) and not fps.add(urls[-1])
+    assert len(fps) == len(urls)
+    assert all(url in fps for url in urls[::97])
+    assert "http://example.com/new" not in fps
+    assert url_fingerprint(urls[5]) in fps  # accepta si amprente
+
+
+def test_bloom_filter_grows_and_keeps_its_members():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f"http://example.com/{i}" for i in range(5000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"http://other.example/{i}" in bloom for i in range(5000))
+    assert false_positives < 50
+
+
+@pytest.mark.parametrize("dedup", ["exact", "bloom"])
+def test_frontier_is_fifo_and_deduplicates(dedup):
+    frontier = Frontier(dedup)
+    assert frontier.push("http://example.com/a", 1)
+    assert frontier.push("http://example.com/b", 1)
+    assert not frontier.push("http://example.com/a", 2)
+    assert frontier.push("http://example.com/c", 2)
+    assert frontier.duplicates == 1
+    assert drain(frontier) == [("http://example.com/a", 1), ("http://example.com/b", 1), ("http://example.com/c", 2)]
+    # un URL scos din coada ramane vazut
+    assert not frontier.push("http://example.com/b", 3)
+    with pytest.raises(IndexError):
+        frontier.pop()
+
+
+def test_key_collapses_variants_but_keeps_the_original_url():
+    frontier = Frontier(key=canonicalize_url)
+    assert frontier.push("http://Example.com/a?utm_source=x", 1)
+    assert not frontier.push("http://example.com/a", 1)
+    assert frontier.seen("http://EXAMPLE.com/a#top")
+    assert frontier.pop() == ("http://Example.com/a?utm_source=x", 1)
+
+
+def test_unpop_and_mark_seen():
+    frontier = Frontier()
+    for name in "abc":
+        frontier.push(f"http://example.com/{name}", 0)
+    first, second = frontier.pop(), frontier.pop()
+    frontier.unpop([first, second])
+    frontier.mark_seen("http://example.com/d")
+    assert not frontier.push("http://example.com/d", 0)
+    assert [url[-1] for url, _depth in drain(frontier)] == ["a", "b", "c"]
+
+
+def test_sqlite_frontier_matches_the_memory_one():
+    conn = sqlite3.connect(":memory:")
+    frontier = SQLiteFrontier(conn, batch_size=3, key=canonicalize_url)
+    pushed = [frontier.push(f"http://example.com/{i % 7}", i) for i in range(10)]
+    assert pushed == [True] * 7 + [False] * 3
+    assert len(frontier) == 7
+    assert [url for url, _depth in drain(frontier)] == [f"http://example.com/{i}" for i in range(7)]
+    assert frontier.seen("http://EXAMPLE.com/3")
+
+
+def test_priority_prefers_shallow_pages():
+    frontier = PriorityFrontier()
+    frontier.push("http://example.com/deep", 3)
+    frontier.push("http://example.com/top", 1)
+    frontier.push("http://example.com/mid", 2)
+    assert [url.rsplit("/", 1)[1] for url, _depth in drain(frontier)] == ["top", "mid", "deep"]
+
+
+def test_priority_counts_inlinks_and_lowers_depth():
+    frontier = PriorityFrontier()
+    frontier.push("http://example.com/a", 2)
+    frontier.push("http://example.com/b", 2)
+    for _ in range(3):
+        assert not frontier.push("http://example.com/b", 2)
+    assert frontier.rescored == 3
+    assert frontier.pop() == ("http://example.com/b", 2)
+    frontier.push("http://example.com/c", 5)
+    frontier.push("http://example.com/c", 1)  # drum mai scurt
+    assert frontier.pop() == ("http://example.com/c", 1)
+
+
+def test_priority_ties_keep_discovery_order():
+    frontier = PriorityFrontier()
+    urls = [f"http://example.com/{name}" for name in "qwerty"]
+    for url in urls:
+        frontier.push(url, 1)
+    assert [url for url, _depth in drain(frontier)] == urls
+
+
+def test_path_weights_and_query_penalty():
+    scorer = UrlScorer(path_weights=[("*/page/*", -2.0), ("/docs", 3.0), ("*[", 1.0)])
+    assert scorer.static_score("http://example.com/a") == 0
+    assert scorer.static_score("http://example.com/a/b/c") == -0.5
+    assert scorer.static_score("http://example.com/a?x=1") == -1.0
+    assert scorer.static_score("http://example.com/blog/page/2") == -2.5
+    assert scorer.static_score("http://example.com/x/docs") == 3.0 - 0.25
+    frontier = PriorityFrontier(scorer=scorer)
+    frontier.push("http://example.com/blog/page/2", 1)
+    frontier.push("http://example.com/docs", 1)
+    frontier.push("http://example.com/blog", 1)
+    assert [url.split("/", 3)[3] for url, _depth in drain(frontier)] == ["docs", "blog", "blog/page/2"]
+
+
+def test_pop_ranked_skips_and_keeps_held_urls():
+    frontier = PriorityFrontier()
+    frontier.push("http://busy.example/a", 0)
+    frontier.push("http://free.example/b", 1)
+    _score, url, depth = frontier.pop_ranked(skip=lambda url: "busy" in url)
+    assert (url, depth) == ("http://free.example/b", 1)
+    assert frontier.pop_ranked(skip=lambda url: "busy" in url) is None
+    assert frontier.pop() == ("http://busy.example/a", 0)
+
+
+def test_priority_heap_compaction_keeps_order():
+    frontier = PriorityFrontier()
+    for i in range(50):
+        frontier.push(f"http://example.com/{i}", 3)
+    for _ in range(200):  # intrarile depasite depasesc pragul de reconstruire
+        for i in range(0, 50, 7):
+            frontier.push(f"http://example.com/{i}", 3)
+    assert len(frontier) == 50
+    order = [url for url, _depth in drain(frontier)]
+    assert order[:8] == [f"http://example.com/{i}" for i in range(0, 50, 7)]
+    assert len(set(order)) == 50
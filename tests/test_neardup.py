@@ -0,0 +1,99 @@
+# tests/test_neardup.py
+# -*- coding: utf-8 -*-
+"""SimHash pe textul vizibil si cautarea in SimHashIndex."""
+
+import random
+
+import pytest
+
+from core.neardup import SimHashIndex, distance, page_words, simhash
+
+
+def words(n, seed):
+    rng = random.Random(seed)
+    return [f"w{rng.randrange(10 ** 6)}" for _ in range(n)]
+
+
+def flip(fingerprint, low_bits=(), high_bits=()):
+    for bit in low_bits:
+        fingerprint ^= 1 << bit
+    for bit in high_bits:
+        fingerprint ^= 1 << (64 + bit)
+    return fingerprint
+
+
+def test_page_words_skip_markup_and_hidden_text():
+    html = ("<html><head><style>p{color:red}</style><script>var x = 1;</script></head>"
+            "<body><!-- ascuns --><p>Salut <b>Lume</b></p><noscript>nu</noscript></body></html>")
+    assert page_words(html) == ["salut", "lume"]
+
+
+def test_simhash_needs_enough_distinct_words():
+    assert simhash(["a", "b", "a"], min_words=3) is None
+    assert simhash(["a", "b", "c"], min_words=3) is not None
+
+
+def test_simhash_ignores_order_and_repetition():
+    text = words(200, 1)
+    shuffled = text[:]
+    random.Random(2).shuffle(shuffled)
+    assert simhash(text) == simhash(shuffled) == simhash(text + text[:50])
+    assert 0 <= simhash(text) < 1 << 128
+
+
+def test_small_edits_stay_close_and_other_pages_do_not():
+    text = words(1000, 3)
+    edited = text[:-1] + ["changed"]  # o data sau un contor schimbat
+    assert distance(simhash(text), simhash(edited)) <= 3
+    assert distance(simhash(text), simhash(words(1000, 4))) > 10
+
+
+def test_distance_is_the_worse_half():
+    a = simhash(words(100, 5))
+    assert distance(a, a) == 0
+    assert distance(a, flip(a, low_bits=[1, 2])) == 2
+    assert distance(a, flip(a, low_bits=[1], high_bits=[3, 4, 5])) == 3
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 6])
+def test_index_finds_every_fingerprint_within_k(k):
+    rng = random.Random(k)
+    index = SimHashIndex(distance=k)
+    stored = [rng.getrandbits(128) for _ in range(300)]
+    for i, fingerprint in enumerate(stored):
+        index.add(fingerprint, f"page{i}")
+    assert len(index) == 300
+    for i in range(0, 300, 7):
+        bits = rng.sample(range(64), k)
+        probe = flip(stored[i], low_bits=bits, high_bits=rng.sample(range(64), k))
+        assert index.find(probe) == f"page{i}"
+        too_far = flip(stored[i], low_bits=rng.sample(range(64), k + 1))
+        assert index.find(too_far) is None
+
+
+def test_index_matches_a_brute_force_scan():
+    rng = random.Random(11)
+    index = SimHashIndex(distance=3)
+    base = rng.getrandbits(128)
+    stored = []
+    for i in range(500):
+        fingerprint = flip(base, low_bits=rng.sample(range(64), rng.randrange(8)),
+                           high_bits=rng.sample(range(64), rng.randrange(8)))
+        stored.append(fingerprint)
+        index.add(fingerprint, i)
+    for _ in range(300):
+        probe = flip(base, low_bits=rng.sample(range(64), rng.randrange(8)),
+                     high_bits=rng.sample(range(64), rng.randrange(8)))
+        found = index.find(probe)
+        near = [i for i, fingerprint in enumerate(stored) if distance(fingerprint, probe) <= 3]
+        assert (found is None) == (not near)
+        if found is not None:
+            assert found in near
+
+
+def test_match_or_add():
+    index = SimHashIndex(distance=2)
+    original = simhash(words(100, 9))
+    assert index.match_or_add(original, "a") is None
+    assert index.match_or_add(flip(original, low_bits=[0]), "b") == "a"
+    assert len(index) == 1
@@ -0,0 +1,146 @@
+# tests/test_resilience.py
+# -*- coding: utf-8 -*-
+"""RetryPolicy (backoff, Retry-After) si tranzitiile CircuitBreaker."""
+
+import random
+
+import pytest
+import requests
+
+from core import resilience
+from core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    retry_delay,
+    transient_error,
+)
+
+
+class Clock:
+    """time.monotonic controlat din test."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+def test_delay_is_full_jitter_with_exponential_cap():
+    random.seed(7)
+    policy = RetryPolicy(retries=10, backoff=0.5, max_delay=30.0)
+    for attempt in range(8):
+        caps = [policy.delay(attempt) for _ in range(200)]
+        assert all(0.0 <= wait <= min(30.0, 0.5 * 2 ** attempt) for wait in caps)
+        assert max(caps) > 0.5 * min(30.0, 0.5 * 2 ** attempt)  # chiar aleator pana la plafon
+
+
+def test_retries_are_limited():
+    policy = RetryPolicy(retries=2, backoff=0.01)
+    assert policy.delay(0) is not None
+    assert policy.delay(1) is not None
+    assert policy.delay(2) is None
+    assert (policy.retried, policy.gave_up) == (2, 1)
+
+
+def test_retry_after_is_a_lower_bound():
+    policy = RetryPolicy(retries=3, backoff=0.01, max_delay=30.0)
+    assert policy.delay(0, "5") == 5.0
+    # un Retry-After mai lung decat max_delay opreste retry-urile
+    assert policy.delay(0, "120") is None
+
+
+def test_transient_errors():
+    assert transient_error(requests.exceptions.ConnectionError())
+    assert transient_error(requests.exceptions.ReadTimeout())
+    assert not transient_error(requests.exceptions.SSLError())
+    assert not transient_error(requests.exceptions.InvalidURL())
+    assert not transient_error(CircuitOpenError())
+    assert not transient_error(ValueError())
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, cooldown=10.0, max_cooldown=40.0)
+    for _ in range(2):
+        breaker.record("h", ok=False)
+        breaker.check("h")
+    breaker.record("h", ok=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.check("h")
+    assert breaker.open_remaining("h") == 10.0
+    breaker.check("other")  # alte hosturi nu sunt afectate
+    assert breaker.stats()["h"] == {"open": True, "failures": 3, "trips": 1, "rejected": 1}
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(threshold=3, cooldown=10.0)
+    for _ in range(5):
+        breaker.record("h", ok=False)
+        breaker.record("h", ok=False)
+        breaker.record("h", ok=True)
+    breaker.check("h")
+    assert breaker.stats() == {}
+
+
+def test_half_open_probe_closes_on_success(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=10.0)
+    breaker.record("h", ok=False)
+    clock.now += 10.0
+    breaker.check("h")  # proba trece
+    with pytest.raises(CircuitOpenError):
+        breaker.check("h")  # un singur request de proba
+    breaker.record("h", ok=True)
+    breaker.check("h")
+    assert breaker.open_remaining("h") == 0.0
+
+
+def test_failed_probes_double_the_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=10.0, max_cooldown=25.0)
+    breaker.record("h", ok=False)
+    for expected in (20.0, 25.0, 25.0):
+        clock.now += breaker.open_remaining("h")
+        breaker.check("h")
+        breaker.record("h", ok=False)
+        assert breaker.open_remaining("h") == expected
+
+
+def test_late_failures_do_not_extend_an_open_circuit(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=10.0)
+    breaker.record("h", ok=False)
+    clock.now += 4.0
+    breaker.record("h", ok=False)  # request plecat inainte de deschidere
+    assert breaker.open_remaining("h") == 6.0
+
+
+def test_lost_probe_does_not_block_the_host(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=10.0)
+    breaker.record("h", ok=False)
+    clock.now += 10.0
+    breaker.check("h")  # proba anulata, fara record()
+    clock.now += 10.0
+    breaker.check("h")
+
+
+def test_retry_delay_combines_policy_and_breaker(clock):
+    policy = RetryPolicy(retries=5, backoff=0.01)
+    breaker = CircuitBreaker(threshold=2, cooldown=10.0)
+    assert retry_delay(policy, breaker, "h", 0, status=503) is not None
+    assert retry_delay(policy, breaker, "h", 0, status=404) is None
+    assert retry_delay(None, breaker, "h", 0, status=503) is None
+    # al doilea esec consecutiv deschide circuitul: nu se mai asteapta
+    assert retry_delay(policy, breaker, "h", 1, status=503) is None
+    assert breaker.open_remaining("h") == 10.0
+    assert retry_delay(policy, None, "h", 0, error=requests.exceptions.SSLError()) is None
+    assert retry_delay(policy, None, "h", 0, error=requests.exceptions.ConnectTimeout()) is not None
+    # 429 se repeta, dar nu e o cadere a hostului
+    other = CircuitBreaker(threshold=1)
+    assert retry_delay(policy, other, "g", 0, status=429) is not None
+    other.check("g")
@@ -0,0 +1,67 @@
+# tests/test_snapshot.py
+# -*- coding: utf-8 -*-
+"""ValidatorStore: cereri conditionale si continut neschimbat intre doua rulari."""
+
+import os
+
+from core.snapshot import ValidatorStore, find_snapshot
+from utils.pathmap import PathMapper
+
+JOB = "http://example.com/"
+
+
+def write(path, data=b"x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_resource_validators_survive_a_new_run(tmp_path):
+    local = str(tmp_path / "img" / "a.png")
+    write(local, b"png")
+    store = ValidatorStore(str(tmp_path), JOB)
+    assert store.conditional_headers("http://example.com/a.png") == {}  # prima rulare
+    store.record("http://example.com/a.png", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                 b"png", path=local)
+    store.close()
+
+    store = ValidatorStore(str(tmp_path), JOB)
+    assert store.conditional_headers("http://example.com/a.png") == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert store.unchanged("http://example.com/a.png", b"png")
+    assert not store.unchanged("http://example.com/a.png", b"png2")
+    assert store.conditional_headers("http://example.com/b.png") == {}
+    os.remove(local)  # fara copie locala nu se mai trimit cereri conditionale
+    assert store.conditional_headers("http://example.com/a.png") == {}
+    assert not store.unchanged("http://example.com/a.png", b"png")
+    store.close()
+
+
+def test_page_is_current_only_with_saved_refs(tmp_path):
+    pathmap = PathMapper(str(tmp_path))
+    page = "http://example.com/docs/"
+    write(pathmap.path_for_page(page))
+    store = ValidatorStore(str(tmp_path), JOB, pathmap=pathmap)
+    store.record(page, {"ETag": '"p1"'}, b"<html></html>")
+    store.record("http://example.com/lost", {"ETag": '"p2"'}, b"<html></html>")  # fara record_refs
+    store.record_refs(page, ["http://example.com/a"], ["http://example.com/s.css"])
+    store.close()
+
+    store = ValidatorStore(str(tmp_path), JOB, pathmap=pathmap)
+    assert store.conditional_headers(page) == {"If-None-Match": '"p1"'}
+    assert store.refs(page) == (["http://example.com/a"], ["http://example.com/s.css"])
+    assert store.conditional_headers("http://example.com/lost") == {}
+    assert store.refs("http://example.com/lost") == ([], [])
+    store.close()
+
+
+def test_latest_snapshot_of_the_same_job(tmp_path):
+    out = str(tmp_path / "site")
+    for folder in ("site", "site_1", "site_2"):
+        os.makedirs(tmp_path / folder)
+    ValidatorStore(out, JOB).close()
+    ValidatorStore(out + "_1", "http://other.example/").close()
+    ValidatorStore(out + "_2", JOB).close()
+    assert find_snapshot(out, JOB) == out + "_2"
+    assert find_snapshot(out, "http://third.example/") is None
@@ -0,0 +1,98 @@
+# tests/test_transport.py
+# -*- coding: utf-8 -*-
+"""PooledSession cu resolver: conexiunile urllib3 iau adresele din DNSCache."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from urllib3.exceptions import NameResolutionError
+
+from core.dnscache import DNSCache
+from core.transport import PooledSession
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, ca serverele reale
+
+    def do_GET(self):
+        body = self.headers.get("Host", "").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def port():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FakeResolver:
+    """Intoarce adresele date, in ordine, pentru orice host."""
+
+    def __init__(self, *addresses):
+        self.addresses = addresses
+        self.looked_up = []
+        self.forgotten = []
+
+    def lookup(self, host):
+        self.looked_up.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0)) for address in self.addresses]
+
+    def forget(self, host):
+        self.forgotten.append(host)
+
+
+def test_requests_go_through_the_dns_cache(port):
+    resolver = DNSCache()
+    with PooledSession(resolver=resolver, retries=0) as session:
+        for _ in range(2):
+            response = session.get(f"http://localhost:{port}/", timeout=5)
+            assert response.text == f"localhost:{port}"  # Host ramane numele
+    assert resolver.cached("localhost")
+    assert resolver.stats()["lookups"] == 1
+
+
+def test_next_address_when_the_first_refuses(port):
+    # 127.0.0.2 e tot loopback, dar serverul asculta doar pe 127.0.0.1
+    resolver = FakeResolver("127.0.0.2", "127.0.0.1")
+    with PooledSession(resolver=resolver, retries=0) as session:
+        response = session.get(f"http://site.test:{port}/", timeout=5)
+    assert response.text == f"site.test:{port}"
+    assert resolver.looked_up == ["site.test"]
+    assert resolver.forgotten == []
+
+
+def test_no_addresses_is_a_resolution_error(port):
+    resolver = FakeResolver()
+    with PooledSession(resolver=resolver, retries=0) as session:
+        with pytest.raises(requests.exceptions.ConnectionError) as info:
+            session.get(f"http://site.test:{port}/", timeout=5)
+    assert isinstance(info.value.args[0].reason, NameResolutionError)
+    assert resolver.forgotten == ["site.test"]
+
+
+def test_prewarmed_connection_is_reused(port):
+    resolver = FakeResolver("127.0.0.1")
+    url = f"http://site.test:{port}/"
+    with PooledSession(resolver=resolver, retries=0) as session:
+        session._open_connection(url)
+        assert session.prewarmed == 1
+        stats = session.pool_stats()[f"http://site.test:{port}"]
+        assert (stats["connections_opened"], stats["idle_connections"]) == (1, 1)
+        session.get(url, timeout=5)
+        session.get(url, timeout=5)
+        stats = session.pool_stats()[f"http://site.test:{port}"]
+        assert (stats["connections_opened"], stats["requests"]) == (1, 2)
+    assert resolver.looked_up == ["site.test"]
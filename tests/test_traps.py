@@ -0,0 +1,93 @@
+# tests/test_traps.py
+# -*- coding: utf-8 -*-
+"""TrapDetector: sabloanele URL-urilor si motivele de oprire."""
+
+import time
+
+import pytest
+
+from core.traps import TrapDetector, url_template
+
+HOST = "http://example.com"
+
+
+@pytest.mark.parametrize("url, template", [
+    ("http://example.com/calendar/2031/01/15?view=day", "example.com/calendar/{n}/{n}/{n}?view"),
+    ("http://example.com/s/3fa9c0d18e/product/p17", "example.com/s/{id}/product/p{n}"),
+    ("http://example.com/about", "example.com/about"),
+    ("http://example.com/list?sort=a&page=2&sort=b", "example.com/list?page&sort"),
+    ("http://example.com/post-12-title-with-dashes", "example.com/post-{n}-title-with-dashes"),
+    ("http://example.com/u/abcdefgh12345678xyz", "example.com/u/{id}"),
+])
+def test_templates(url, template):
+    assert url_template(url) == template
+
+
+def test_template_limit():
+    traps = TrapDetector(template_limit=5)
+    assert all(traps.admit(f"{HOST}/item/{i}") for i in range(5))
+    assert not traps.admit(f"{HOST}/item/5")
+    assert not traps.admit(f"{HOST}/item/6")
+    assert traps.admit(f"{HOST}/other")
+    assert traps.cut_off(f"{HOST}/item/1")
+    assert traps.stats()["example.com/item/{n}"]["blocked"] == 2
+
+
+def test_self_generating_chain_is_cut():
+    traps = TrapDetector(max_generations=10, template_limit=1000)
+    parent = f"{HOST}/cal?month=0"
+    for month in range(1, 11):
+        url = f"{HOST}/cal?month={month}"
+        assert traps.admit(url, parent)
+        parent = url
+    assert not traps.admit(f"{HOST}/cal?month=11", parent)
+
+
+def test_growth_per_page_is_cut():
+    traps = TrapDetector(max_growth=2.0, min_pages=3, template_limit=1000, max_generations=1000)
+    admitted = 0
+    for page in range(3):
+        parent = f"{HOST}/search?q={page}"
+        traps.admit(parent)
+        traps.page_done(parent)
+        for link in range(4):
+            admitted += traps.admit(f"{HOST}/search?q={page}-{link}", parent)
+    assert admitted < 12
+    assert "URL-uri noi pe pagina" in traps.stats()["example.com/search?q"]["reason"]
+
+
+def test_catalog_growth_from_other_templates_is_allowed():
+    traps = TrapDetector(max_growth=2.0, min_pages=3, template_limit=1000)
+    for category in range(5):
+        parent = f"{HOST}/category/{category}"
+        traps.page_done(parent)
+        for product in range(20):
+            assert traps.admit(f"{HOST}/product/{category * 100 + product}", parent)
+
+
+@pytest.mark.parametrize("url, reason", [
+    (f"{HOST}/a/b/a/b/a/b", "repetat"),
+    (HOST + "/q?" + "&".join(f"k{i}=1" for i in range(13)), "parametri"),
+    (f"{HOST}/" + "x" * 1100, "mai lung"),
+    (f"{HOST}/events/{time.localtime().tm_year + 5}/03", "data din anul"),
+    (f"{HOST}/events?year={time.localtime().tm_year + 5}", "data din anul"),
+])
+def test_static_reasons(url, reason):
+    traps = TrapDetector()
+    assert not traps.admit(url)
+    (stats,) = traps.stats().values()
+    assert reason in stats["reason"]
+
+
+def test_dates_in_range_are_fine():
+    traps = TrapDetector()
+    assert traps.admit(f"{HOST}/blog/{time.localtime().tm_year}/05/post")
+    assert traps.admit(f"{HOST}/events?year=1999")
+
+
+def test_permutation_of_repeated_keys_is_rejected():
+    traps = TrapDetector()
+    assert traps.admit(f"{HOST}/f?c=1&c=2")
+    assert not traps.admit(f"{HOST}/f?c=2&c=1")
+    assert traps.admit(f"{HOST}/f?c=1&c=3")
+    assert not traps.cut_off(f"{HOST}/f?c=9")  # doar URL-ul, nu sablonul
@@ -0,0 +1,77 @@
+# tests/test_urlcanon.py
+# -*- coding: utf-8 -*-
+"""Forma canonica a URL-urilor (cheia de deduplicare a paginilor)."""
+
+import pytest
+
+from utils.urlcanon import canonicalize_url, strip_tracking_params
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Example.COM/a", "http://example.com/a"),
+    ("http://example.com.:80/a", "http://example.com/a"),
+    ("https://example.com:443/", "https://example.com/"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("http://example.com", "http://example.com/"),
+    ("http://example.com/a#section", "http://example.com/a"),
+    ("http://example.com/a/./b/../c", "http://example.com/a/c"),
+    ("http://example.com/../a", "http://example.com/a"),
+    ("http://example.com/a/b/..", "http://example.com/a/"),
+    ("http://example.com/%7euser/%2f", "http://example.com/~user/%2F"),
+    ("http://example.com/a b/ă", "http://example.com/a%20b/%C4%83"),
+    ("http://user:pw@Example.com/", "http://user:pw@example.com/"),
+    ("http://[::1]:80/a", "http://[::1]/a"),
+    ("  http://example.com/a  ", "http://example.com/a"),
+])
+def test_normalization(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_query_is_sorted_and_tracking_is_stripped():
+    url = "http://example.com/p?b=2&utm_source=x&a=1&fbclid=y&UTM_Medium=z&a=0"
+    assert canonicalize_url(url) == "http://example.com/p?a=1&a=0&b=2"
+    assert canonicalize_url(url, strip_tracking=False, sort_query=False) == url
+    assert canonicalize_url("http://example.com/p?utm_source=x") == "http://example.com/p"
+
+
+def test_content_parameters_are_kept():
+    assert canonicalize_url("http://example.com/?ref=v2&source=docs") == "http://example.com/?ref=v2&source=docs"
+
+
+def test_empty_values_and_flags_survive():
+    assert canonicalize_url("http://example.com/?b&a=&&c=1") == "http://example.com/?a=&b&c=1"
+
+
+@pytest.mark.parametrize("policy, url, expected", [
+    ("keep", "http://example.com/a/", "http://example.com/a/"),
+    ("keep", "http://example.com/a", "http://example.com/a"),
+    ("strip", "http://example.com/a/", "http://example.com/a"),
+    ("strip", "http://example.com/", "http://example.com/"),
+    ("add", "http://example.com/a", "http://example.com/a/"),
+    ("add", "http://example.com/a.html", "http://example.com/a.html"),
+])
+def test_trailing_slash_policies(policy, url, expected):
+    assert canonicalize_url(url, trailing_slash=policy) == expected
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        canonicalize_url("http://example.com/", trailing_slash="never")
+
+
+@pytest.mark.parametrize("url", ["mailto:a@example.com", "ftp://Example.com/A", "data:,x", "/relative"])
+def test_other_schemes_are_untouched(url):
+    assert canonicalize_url(url) == url
+
+
+def test_idempotent():
+    for url in ("HTTP://Example.com:80/a/../%7eb/?z=1&utm_term=q&a=%41#x",
+                "https://example.com/ș/?q=a b"):
+        once = canonicalize_url(url)
+        assert canonicalize_url(once) == once
+
+
+def test_strip_tracking_params_keeps_the_rest():
+    url = "http://Example.com/a?z=1&utm_campaign=x&gclid=y&a=2#top"
+    assert strip_tracking_params(url) == "http://Example.com/a?z=1&a=2#top"
+    assert strip_tracking_params("http://example.com/a") == "http://example.com/a"
@@ -0,0 +1,86 @@
+# tests/test_urlmatch.py
+# -*- coding: utf-8 -*-
+"""ExcludeMatcher comparat cu filtrul initial (re.match pe fiecare pattern)."""
+
+import random
+import re
+import warnings
+
+import pytest
+
+from utils.urlmatch import ExcludeMatcher, trie_regex
+
+
+def baseline_excluded(patterns, path):
+    """Semantica din crawler-ul initial; pattern-urile invalide sunt ignorate."""
+    for pattern in patterns:
+        if "*" in pattern:
+            try:
+                if re.match(pattern.replace("*", ".*"), path):
+                    return True
+            except re.error:
+                continue
+        elif pattern in path:
+            return True
+    return False
+
+
+PATHS = [
+    "/", "/page", "/blog/?page=2", "/a?b", "/+x", "/tag-1/x", "/tag-12/y",
+    "/admin/users", "/x/admin", "/a.b", "/ab", "/aab", "/{1}", "/calendar/2024/01",
+]
+
+
+@pytest.mark.parametrize("patterns", [
+    ["*?page=*"],
+    ["*?"],
+    ["*?a"],
+    ["*+x"],
+    ["*?page=*", "/admin*", "*.b"],
+    ["/tag-1*", "/tag-12*", "admin"],
+    ["*calendar/*", "*/x*"],
+    ["/a|/x*"],
+    ["*(a)\\1*", "*(?P<n>b)*", "*(?P<n>a)*"],
+    ["*(?i)ADMIN*"],
+    ["*"],
+    ["/a\\.*"],
+])
+def test_matches_baseline(patterns):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        matcher = ExcludeMatcher(patterns)
+        for path in PATHS:
+            assert matcher.matches_pattern(path) == baseline_excluded(patterns, path), path
+
+
+def test_invalid_patterns_are_skipped():
+    matcher = ExcludeMatcher(["*[", "(*", "/ok*"])
+    assert matcher.matches_pattern("/ok/1")
+    assert not matcher.matches_pattern("/[")
+
+
+def test_random_pattern_sets():
+    rng = random.Random(20240501)
+    alphabet = "ab/*?+.{}[]()|\\^$-1="
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for _ in range(3000):
+            patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+                        for _ in range(rng.randint(1, 4))]
+            matcher = ExcludeMatcher(patterns)
+            for _ in range(4):
+                path = "/" + "".join(rng.choice("ab/?.=-1{}") for _ in range(rng.randint(0, 8)))
+                assert matcher.matches_pattern(path) == baseline_excluded(patterns, path), (patterns, path)
+
+
+def test_extensions():
+    matcher = ExcludeMatcher(extensions=[".pdf", ".tar.gz"])
+    assert matcher.excluded("/doc/Report.PDF")
+    assert matcher.excluded("/x.tar.gz")
+    assert not matcher.excluded("/x.gz")
+    assert not matcher.excluded("/pdf")
+
+
+def test_trie_regex():
+    regex = re.compile(trie_regex(["abc", "abd", "x"]))
+    assert [bool(regex.fullmatch(w)) for w in ("abc", "abd", "x", "ab")] == [True, True, True, False]
@@ -26,9 +26,18 @@ from config import (
     DEFAULT_MAX_DEPTH,
     DEFAULT_MAX_PAGES,
 )
+from core.cache import ResponseCache
+from core.checkpoint import CrawlCheckpoint, find_resumable_job
+from core.concurrency import AIMDController
 from core.crawler import DomainCrawler
+from core.dnscache import DNSCache
 from core.downloader import ResourceDownloader
+from core.neardup import write_alias_pages
+from core.pipeline import StagedPipeline
 from core.processor import ContentProcessor
+from core.resilience import CircuitBreaker, RetryPolicy
+from core.transport import PooledSession
+from core.snapshot import ValidatorStore, find_snapshot
 from ui.components import (
     create_header_section,
     create_input_section,
@@ -40,7 +49,7 @@ from ui.components import (
 )
 from ui.dialogs import show_about_dialog
 from utils.constants import COLORS, TEXTS
-from utils.helpers import format_time, get_unique_folder_name, is_valid_url
+from utils.helpers import format_size, format_time, get_unique_folder_name, is_valid_url
 from utils.launcher import write_root_index_auto
 from utils.pathmap import PathMapper
 
@@ -353,137 +362,291 @@ class WebClonerApp:
         resource_types,
     ):
         start_time = time.time()
-        unique_out = get_unique_folder_name(output_folder)
+        # un job intrerupt pentru acelasi URL este reluat in folderul lui
+        resume_out = find_resumable_job(output_folder, url) if config.CHECKPOINT_ENABLED else None
+        # re-snapshot: ultimul snapshot al URL-ului este actualizat pe loc
+        snapshot_out = find_snapshot(output_folder, url) if config.RESNAPSHOT else None
+        unique_out = resume_out or snapshot_out or get_unique_folder_name(output_folder)
         os.makedirs(unique_out, exist_ok=True)
-
-        # ---------- Crawl
-        self.root.after(
-            0, lambda: self.update_progress(10, TEXTS["status_crawling"], current_url=url)
-        )
-        crawler = DomainCrawler(
-            url,
-            max_depth,
-            max_pages,
-            same_domain_only,
-            include_subdomains,
-            exclude_patterns,
+        checkpoint = CrawlCheckpoint(unique_out, url) if config.CHECKPOINT_ENABLED else None
+
+        # limite adaptive pe host, comune crawler-ului si downloader-ului
+        controller = AIMDController() if config.ADAPTIVE_CONCURRENCY else None
+        # retry-uri cu backoff si circuit breaker pe host, tot comune
+        retry = RetryPolicy() if config.RESILIENCE_ENABLED else None
+        breaker = CircuitBreaker() if config.RESILIENCE_ENABLED else None
+        # cache DNS comun: sesiunea requests si conexiunile aiohttp ale crawler-ului
+        resolver = DNSCache() if config.DNS_CACHE_ENABLED else None
+        # o singura sesiune (pool keep-alive) pentru crawler si downloader;
+        # cu limite adaptive pool-ul permite limita maxima, controller-ul decide.
+        # Retry-urile sunt facute de RetryPolicy, deci fiecare incercare ajunge
+        # la controller si la breaker. Cu HTTP2_ENABLED, hosturile cu HTTP/2
+        # primesc toate request-urile pe o singura conexiune
+        transport = PooledSession(
+            concurrency=config.DEFAULT_CONCURRENCY,
+            per_host_limit=controller.max_limit if controller is not None else config.DEFAULT_PER_HOST_LIMIT,
+            retries=0,
+            resolver=resolver,
+            http2=config.HTTP2_ENABLED,
+            http2_cleartext=config.HTTP2_CLEARTEXT,
         )
-
-        def crawl_cb(v, m, u):
-            self.root.after(0, lambda: self.update_progress(v, m, u))
-            self.root.after(
-                0,
-                lambda: self.update_stats(
-                    pages_found=crawler.pages_found,
-                    pages_processed=crawler.pages_processed,
-                    resources_downloaded=0,
-                    total_resources=len(crawler.resources),
-                    errors=len(crawler.errors),
-                    start_time=start_time,
-                ),
-            )
-
-        crawl_result = crawler.crawl(crawl_cb)
-
-        # accepta 2 sau 3 valori – compatibil
-        if len(crawl_result) == 3:
-            pages, resources, res_src = crawl_result
-        elif len(crawl_result) == 2:
-            pages, resources = crawl_result
-            # toate resursele le mapam la pagina de start (fallback simplu);
-            # poti construi alta mapare daca ai nevoie.
-            res_src = {r: url for r in resources}
-        else:
-            raise RuntimeError(
-                f"DomainCrawler.crawl() a returnat {len(crawl_result)} valori – nu 2 sau 3."
+        crawler = None
+        pipeline = None
+        validators = None
+        cache = None
+        # in modurile streaming si staged paginile se scriu in timpul crawl-ului
+        streaming = config.PIPELINE_MODE in ("streaming", "staged")
+        try:
+            # ---------- PathMapper si ContentProcessor
+            pathmap = PathMapper(unique_out)
+            processor = ContentProcessor(unique_out, base_url=base_url, pathmap=pathmap)  # <‑‑ FIX
+
+            from urllib.parse import urlparse
+            processor.site_folder = urlparse(base_url).netloc or "site"
+            if config.RESNAPSHOT:
+                validators = ValidatorStore(unique_out, url, pathmap=pathmap)
+            if config.HTTP_CACHE_ENABLED:
+                cache = ResponseCache()
+
+            def write_page(page_url, html):
+                html_out = processor.process_html(html, page_url)
+                local_path = pathmap.path_for_page(page_url)
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                with open(local_path, "w", encoding="utf-8", errors="ignore") as f:
+                    f.write(html_out)
+                if checkpoint is not None:
+                    checkpoint.page_written(page_url)
+
+            downloader = ResourceDownloader(
+                unique_out,
+                pathmap=pathmap,
+                resource_types=resource_types,
+                session=transport,
+                checkpoint=checkpoint,
+                validators=validators,
+                cache=cache,
+                controller=controller,
+                retry=retry,
+                breaker=breaker,
             )
 
+            # ---------- Staged: rescrierea si download-ul ruleaza in paralel cu crawl-ul
+            page_sink = write_page if streaming else None
+            resource_sink = None
+            if config.PIPELINE_MODE == "staged":
+                pipeline = StagedPipeline(write_page, downloader.download_one)
+                pipeline.start()
+                page_sink, resource_sink = pipeline.page_sink, pipeline.resource_sink
 
-        # ---------- PathMapper si ContentProcessor
-        pathmap = PathMapper(unique_out)
-        processor = ContentProcessor(unique_out, base_url=base_url, pathmap=pathmap)  # <‑‑ FIX
-
-        from urllib.parse import urlparse
-        processor.site_folder = urlparse(base_url).netloc or "site"
-
-        self.root.after(0, lambda: self.update_progress(30, TEXTS["status_processing"]))
-
-        total_pages = len(pages) or 1
-        for idx, (page_url, html) in enumerate(pages.items(), start=1):
-            if config.CANCELLED:
-                break
-            html_out = processor.process_html(html, page_url)
-            local_path = pathmap.path_for_page(page_url)
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            with open(local_path, "w", encoding="utf-8", errors="ignore") as f:
-                f.write(html_out)
-            prog_val = 30 + int((idx / total_pages) * 30)
+            # ---------- Crawl
             self.root.after(
-                0,
-                lambda p=prog_val: self.update_progress(
-                    p, TEXTS["status_processing"], current_url=page_url
-                ),
+                0, lambda: self.update_progress(10, TEXTS["status_crawling"], current_url=url)
             )
-
-        if config.CANCELLED:
-            shutil.rmtree(unique_out, ignore_errors=True)
-            self.root.after(0, lambda: self.complete_cloning(False, None, None))
-            return
-
-        # ---------- Download resurse
-        self.root.after(0, lambda: self.update_progress(60, TEXTS["status_downloading"]))
-        downloader = ResourceDownloader(unique_out, pathmap=pathmap, resource_types=resource_types)
-
-        def dl_cb(percent, msg):
-            bar_val = 60 + int((percent / 100.0) * 30)
-            self.root.after(0, lambda: self.update_progress(bar_val, msg))
-            self.root.after(
-                0,
-                lambda: self.update_stats(
-                    pages_found=crawler.pages_found,
-                    pages_processed=crawler.pages_processed,
-                    resources_downloaded=downloader.downloaded_count,
-                    total_resources=len(resources),
-                    errors=len(crawler.errors) + downloader.failed_count,
-                    start_time=start_time,
-                ),
+            crawler = DomainCrawler(
+                url,
+                max_depth,
+                max_pages,
+                same_domain_only,
+                include_subdomains,
+                exclude_patterns,
+                engine=config.CRAWL_ENGINE,
+                concurrency=config.DEFAULT_CONCURRENCY,
+                per_host_limit=config.DEFAULT_PER_HOST_LIMIT,
+                extractor=config.EXTRACTOR_BACKEND,
+                session=transport,
+                dedup=config.FRONTIER_DEDUP,
+                storage=config.CRAWL_STORAGE,
+                checkpoint=checkpoint,
+                page_sink=page_sink,
+                resource_sink=resource_sink,
+                validators=validators,
+                cache=cache,
+                controller=controller,
+                retry=retry,
+                breaker=breaker,
             )
+            if pipeline is not None and crawler.resources:
+                # resurse gasite inainte de o intrerupere (checkpoint)
+                pipeline.resource_sink(list(crawler.resources))
+
+            def crawl_cb(v, m, u):
+                self.root.after(0, lambda: self.update_progress(v, m, u))
+                self.root.after(
+                    0,
+                    lambda: self.update_stats(
+                        pages_found=crawler.pages_found,
+                        pages_processed=crawler.pages_processed,
+                        resources_downloaded=downloader.downloaded_count,
+                        total_resources=len(crawler.resources),
+                        errors=len(crawler.errors),
+                        start_time=start_time,
+                    ),
+                )
+
+            crawl_result = crawler.crawl(crawl_cb)
+            if pipeline is not None:
+                pipeline.finish()
+                pipeline.log_stats()
+
+            # accepta 2 sau 3 valori – compatibil
+            if len(crawl_result) == 3:
+                pages, resources, res_src = crawl_result
+            elif len(crawl_result) == 2:
+                pages, resources = crawl_result
+                # toate resursele le mapam la pagina de start (fallback simplu);
+                # poti construi alta mapare daca ai nevoie.
+                res_src = {r: url for r in resources}
+            else:
+                raise RuntimeError(
+                    f"DomainCrawler.crawl() a returnat {len(crawl_result)} valori – nu 2 sau 3."
+                )
 
-        downloader.download_all(resources, res_src, progress_callback=dl_cb)
-
-        if config.CANCELLED:
-            shutil.rmtree(unique_out, ignore_errors=True)
-            self.root.after(0, lambda: self.complete_cloning(False, None, None))
-            return
+            if streaming:
+                # paginile sunt deja pe disc; in memorie au ramas doar metadatele
+                pages = crawler.page_index
+            else:
+                # ---------- Procesare pagini
+                self.root.after(0, lambda: self.update_progress(30, TEXTS["status_processing"]))
+
+                total_pages = len(pages) or 1
+                for idx, (page_url, html) in enumerate(pages.items(), start=1):
+                    if config.CANCELLED:
+                        break
+                    if checkpoint is not None and checkpoint.is_written(page_url):
+                        continue
+                    write_page(page_url, html)
+                    if checkpoint is not None:
+                        checkpoint.tick()
+                    prog_val = 30 + int((idx / total_pages) * 30)
+                    self.root.after(
+                        0,
+                        lambda p=prog_val: self.update_progress(
+                            p, TEXTS["status_processing"], current_url=page_url
+                        ),
+                    )
+
+            if crawler.aliases and not config.CANCELLED:
+                # paginile aproape identice si adresele redirectionate nu au
+                # fost scrise: link-urile spre ele duc la pagina pastrata
+                # printr-o pagina de redirectionare
+                stubs = write_alias_pages(crawler.aliases, pathmap)
+                logger.info(
+                    "Pagini aproape identice: %d, redirectionate: %d "
+                    "(%d pagini de redirectionare scrise)",
+                    crawler.near_duplicates, len(crawler.aliases) - crawler.near_duplicates, stubs,
+                )
 
-        # ---------- Index root
-        start_page = url if url in pages else next(iter(pages), None)
-        if start_page:
-            try:
-                write_root_index_auto(unique_out, start_page, pathmap=pathmap)
-            except Exception as e:
-                logger.warning("Nu am putut crea index root: %s", e)
-
-        # ---------- Arhivare ZIP (optional)
-        zip_path = None
-        if self.zip_var.get():
-            self.root.after(0, lambda: self.update_progress(95, TEXTS["status_compressing"]))
-            try:
-                zip_path = downloader.create_archive(unique_out)
-            except Exception as e:
-                logger.error("Eroare creare arhiva: %s", e, exc_info=True)
+            if config.CANCELLED:
+                # cu checkpoint, folderul ramane pentru reluare; un snapshot
+                # anterior nu este sters niciodata
+                if checkpoint is None and snapshot_out is None:
+                    shutil.rmtree(unique_out, ignore_errors=True)
+                self.root.after(0, lambda: self.complete_cloning(False, None, None))
+                return
+
+            # ---------- Download resurse
+            self.root.after(0, lambda: self.update_progress(60, TEXTS["status_downloading"]))
+
+            def dl_cb(percent, msg):
+                bar_val = 60 + int((percent / 100.0) * 30)
+                self.root.after(0, lambda: self.update_progress(bar_val, msg))
+                self.root.after(
+                    0,
+                    lambda: self.update_stats(
+                        pages_found=crawler.pages_found,
+                        pages_processed=crawler.pages_processed,
+                        resources_downloaded=downloader.downloaded_count,
+                        total_resources=len(resources),
+                        errors=len(crawler.errors) + downloader.failed_count,
+                        start_time=start_time,
+                    ),
+                )
+
+            if pipeline is None:
+                downloader.download_all(resources, res_src, progress_callback=dl_cb)
 
-            if not self.folder_var.get():
-                folder_ref = None
-                shutil.rmtree(unique_out, ignore_errors=True)
+            if config.CANCELLED:
+                # cu checkpoint, folderul ramane pentru reluare; un snapshot
+                # anterior nu este sters niciodata
+                if checkpoint is None and snapshot_out is None:
+                    shutil.rmtree(unique_out, ignore_errors=True)
+                self.root.after(0, lambda: self.complete_cloning(False, None, None))
+                return
+
+            if validators is not None:
+                logger.info(
+                    "Re-snapshot: %d pagini si %d resurse nemodificate, pastrate local",
+                    crawler.pages_unchanged, downloader.not_modified_count,
+                )
+
+            if crawler.non_html_skipped or crawler.pages_too_large:
+                logger.info(
+                    "Crawl: %d raspunsuri non-HTML si %d pagini prea mari abandonate "
+                    "(%s descarcati inutil, %s evitati)",
+                    crawler.non_html_skipped, crawler.pages_too_large,
+                    format_size(crawler.bytes_wasted), format_size(crawler.bytes_avoided),
+                )
+
+            # ---------- Index root
+            start_page = url if url in pages else next(iter(pages), None)
+            if start_page:
+                try:
+                    write_root_index_auto(unique_out, start_page, pathmap=pathmap)
+                except Exception as e:
+                    logger.warning("Nu am putut crea index root: %s", e)
+
+            # jobul e complet: checkpoint-ul nu mai trebuie (si nu intra in arhiva)
+            if checkpoint is not None:
+                checkpoint.discard()
+
+            # ---------- Arhivare ZIP (optional)
+            zip_path = None
+            if self.zip_var.get():
+                self.root.after(0, lambda: self.update_progress(95, TEXTS["status_compressing"]))
+                try:
+                    zip_path = downloader.create_archive(unique_out)
+                except Exception as e:
+                    logger.error("Eroare creare arhiva: %s", e, exc_info=True)
+
+                if not self.folder_var.get():
+                    folder_ref = None
+                    shutil.rmtree(unique_out, ignore_errors=True)
+                else:
+                    folder_ref = unique_out
             else:
                 folder_ref = unique_out
-        else:
-            folder_ref = unique_out
 
-        # ---------- Success
-        self.root.after(0, lambda: self.update_progress(100, TEXTS["status_completed"]))
-        self.root.after(0, lambda: self.complete_cloning(True, zip_path, folder_ref))
+            # ---------- Success
+            self.root.after(0, lambda: self.update_progress(100, TEXTS["status_completed"]))
+            self.root.after(0, lambda: self.complete_cloning(True, zip_path, folder_ref))
+        finally:
+            if pipeline is not None:
+                pipeline.finish()
+            if checkpoint is not None:
+                checkpoint.close()
+            if validators is not None:
+                validators.close()
+            if cache is not None:
+                st = cache.stats()
+                logger.info(
+                    "Cache HTTP: %d servite local, %d revalidate (304), %d ratari, "
+                    "%d stocate, %d evacuate, %.1f MB pe disc",
+                    st["hits"], st["revalidations"], st["misses"], st["stored"],
+                    st["evicted"], st["total_bytes"] / (1024 * 1024),
+                )
+                cache.close()
+            if crawler is not None:
+                crawler.close()
+            transport.log_pool_stats()
+            if controller is not None:
+                controller.log_stats()
+            if retry is not None and (retry.retried or retry.gave_up):
+                logger.info("Retry-uri: %d reincercari, %d request-uri abandonate", retry.retried, retry.gave_up)
+            if breaker is not None:
+                breaker.log_stats()
+            if resolver is not None:
+                resolver.log_stats()
+            transport.close()
 
     # -------------------- finalize / error / states ------------------- #
     def complete_cloning(self, ok: bool, zip_path: str | None, folder_path: str | None):
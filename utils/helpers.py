@@ -147,32 +147,11 @@ def guess_output_dir(base_output: str | None, start_url: str) -> str:
 def clean_url_params(url: str) -> str:
     """
     Elimină parametrii de tracking (utm_*, fbclid, gclid etc.).
+    Lista comună se află în utils/urlcanon.py (TRACKING_PARAMS).
     """
-    tracking = {
-        "utm_source",
-        "utm_medium",
-        "utm_campaign",
-        "utm_term",
-        "utm_content",
-        "fbclid",
-        "gclid",
-        "msclkid",
-        "ref",
-        "source",
-    }
-    p = urlparse(url)
-    if not p.query:
-        return url
-    kept = []
-    for param in p.query.split("&"):
-        if "=" in param:
-            key, _ = param.split("=", 1)
-            if key.lower() not in tracking:
-                kept.append(param)
-        else:
-            kept.append(param)
-    new_q = "&".join(kept)
-    return p._replace(query=new_q).geturl()
+    from utils.urlcanon import strip_tracking_params
+
+    return strip_tracking_params(url)
 
 
 def merge_urls(base_url: str, relative_url: str) -> str:
@@ -21,6 +21,8 @@ import hashlib
 from urllib.parse import urlparse, unquote, urlsplit, urlunsplit
 from typing import Optional
 
+from utils.urlcanon import canonicalize_url
+
 # caractere invalide Windows
 _INVALID_CHARS = '<>:"|?*'
 _MAX_SEG_LEN = 80
@@ -118,7 +120,7 @@ class PathMapper:
         Returneaza calea locala (absoluta) pentru pagina data.
         Folosim <basedir>/<domeniu>/<path...>/index.html
         """
-        parsed = urlparse(_strip_query_fragment(page_url))
+        parsed = urlparse(_strip_query_fragment(canonicalize_url(page_url)))
         host = _clean_segment(parsed.netloc) if parsed.netloc else "root"
 
         # extrage segmente din path
@@ -0,0 +1,151 @@
+"""
+Canonicalizarea URL-urilor, comuna pentru crawler, procesor si PathMapper.
+
+Doua URL-uri care duc la aceeasi pagina trebuie sa aiba aceeasi forma:
+
+    http://Example.com/a/?utm_source=x#f
+    http://example.com:80/a/                  ->  http://example.com/a
+    http://example.com/a
+
+Pasi aplicati (doar pentru http/https):
+    * schema si host cu litere mici, fara punct final in host
+    * portul implicit (80 / 443) eliminat
+    * segmentele . si .. rezolvate, path gol -> /
+    * %XX normalizat: caracterele nerezervate decodate, restul cu hex mare,
+      caracterele nepermise (spatii, unicode) codate
+    * parametrii de tracking eliminati, parametrii ramasi sortati dupa cheie
+    * fragmentul (#...) eliminat
+    * politica pentru slash-ul final: "keep", "strip" sau "add"
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from urllib.parse import quote, urlsplit, urlunsplit
+
+from config import CANON_TRAILING_SLASH
+
+TRAILING_SLASH_POLICIES = ("keep", "strip", "add")
+
+# parametri de tracking (in plus fata de orice utm_*); doar nume fara alt
+# sens: ?ref=v2 sau ?source=docs aleg adesea continutul paginii
+TRACKING_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "fbclid", "gclid", "msclkid", "yclid", "dclid", "igshid",
+    "mc_cid", "mc_eid", "_ga",
+})
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_UNRESERVED = frozenset(string.ascii_letters + string.digits + "-._~")
+_PCT_RE = re.compile(r"%([0-9A-Fa-f]{2})")
+
+# caractere lasate necodate in path, respectiv intr-o cheie/valoare de query
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+_QUERY_SAFE = "/:@!$'()*+,;?-._~%"
+
+
+def canonicalize_url(
+    url: str,
+    trailing_slash: str = CANON_TRAILING_SLASH,
+    strip_tracking: bool = True,
+    sort_query: bool = True,
+) -> str:
+    """Intoarce forma canonica a unui URL http/https (altfel URL-ul neschimbat)."""
+    if trailing_slash not in TRAILING_SLASH_POLICIES:
+        raise ValueError(f"Politica necunoscuta pentru slash-ul final: {trailing_slash}")
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        return url
+
+    netloc = _canonical_netloc(scheme, parts.netloc)
+    path = _remove_dot_segments(_normalize_pct(parts.path, _PATH_SAFE) or "/")
+    path = _apply_trailing_slash(path, trailing_slash)
+    query = _canonical_query(parts.query, strip_tracking, sort_query)
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def strip_tracking_params(url: str) -> str:
+    """Elimina doar parametrii de tracking, restul URL-ului ramane neatins."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    kept = [p for p in parts.query.split("&") if not _is_tracking(p.split("=", 1)[0])]
+    return parts._replace(query="&".join(kept)).geturl()
+
+
+# ---------------------------------------------------------------------------
+# Componente
+# ---------------------------------------------------------------------------
+
+
+def _is_tracking(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith("utm_")
+
+
+def _canonical_netloc(scheme: str, netloc: str) -> str:
+    userinfo, at, hostport = netloc.rpartition("@")
+    if hostport.startswith("["):  # IPv6
+        end = hostport.find("]")
+        host, rest = hostport[: end + 1], hostport[end + 1:]
+        port = rest[1:] if rest.startswith(":") else ""
+    elif ":" in hostport:
+        host, port = hostport.rsplit(":", 1)
+    else:
+        host, port = hostport, ""
+    host = host.lower().rstrip(".")
+    if port == _DEFAULT_PORTS[scheme]:
+        port = ""
+    hostport = f"{host}:{port}" if port else host
+    return f"{userinfo}{at}{hostport}"
+
+
+def _normalize_pct(text: str, safe: str) -> str:
+    def _repl(m):
+        ch = chr(int(m.group(1), 16))
+        return ch if ch in _UNRESERVED else "%" + m.group(1).upper()
+
+    return quote(_PCT_RE.sub(_repl, text), safe=safe)
+
+
+def _remove_dot_segments(path: str) -> str:
+    out = []
+    for seg in path.split("/"):
+        if seg == "..":
+            if len(out) > 1:
+                out.pop()
+        elif seg != ".":
+            out.append(seg)
+    result = "/".join(out)
+    if path.endswith(("/.", "/..")):
+        result += "/"
+    return result or "/"
+
+
+def _apply_trailing_slash(path: str, policy: str) -> str:
+    if policy == "strip" and path != "/" and path.endswith("/"):
+        return path.rstrip("/") or "/"
+    if policy == "add" and not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        return path + "/"
+    return path
+
+
+def _canonical_query(query: str, strip_tracking: bool, sort_query: bool) -> str:
+    if not query:
+        return ""
+    pairs = []
+    for part in query.split("&"):
+        if not part:
+            continue
+        key, eq, value = part.partition("=")
+        if strip_tracking and _is_tracking(key):
+            continue
+        pairs.append((_normalize_pct(key, _QUERY_SAFE), eq, _normalize_pct(value, _QUERY_SAFE)))
+    if sort_query:
+        pairs.sort(key=lambda p: p[0])  # sortare stabila: cheile repetate isi pastreaza ordinea
+    return "&".join(f"{k}{eq}{v}" for k, eq, v in pairs)
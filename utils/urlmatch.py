@@ -0,0 +1,188 @@
+"""
+Filtrul de excludere al crawler-ului, compilat o singura data pe job.
+
+Semantica este cea a listei de excludere din interfata:
+
+    * un pattern cu '*' este o expresie regulata in care '*' devine '.*',
+      potrivita de la inceputul path-ului (re.match);
+    * un pattern fara '*' exclude orice path care il contine;
+    * extensiile din EXCLUDED_EXTENSIONS se compara cu finalul path-ului,
+      fara diferenta intre litere mari si mici.
+
+In loc de o expresie noua pentru fiecare pattern si fiecare URL, toate
+pattern-urile ajung in doua expresii compilate o singura data, fiecare
+construita dintr-un trie al prefixelor literale (prefixele comune sunt
+verificate o singura data):
+
+    * cele ancorate la inceputul path-ului (re.match);
+    * cele care pot aparea oriunde (re.search): pattern-urile literale si
+      cele care incep cu '*' ('.*X' la re.match == X la re.search).
+
+Un '.*' final nu schimba rezultatul lui re.match si este eliminat. Un
+pattern al carui rest (dupa '.*' initial) nu este o expresie valida de sine
+statatoare ('*?x', '*+x') ramane ancorat, nerescris. Pattern-urile cu grupuri
+speciale sau referinte inapoi ('(?P<n>...)', '(?i)', '\\1') nu pot fi
+combinate cu altele si sunt potrivite separat.
+Extensia este cautata intr-un set dupa ultimul '.', deci costul nu creste
+cu lungimea listei.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+_META = frozenset(".^$*+?{}[]\\|()")
+_QUANTIFIERS = frozenset("*+?{")
+# grupuri speciale (nume, flag-uri, lookaround) si referinte inapoi: numerotarea
+# si numele grupurilor nu supravietuiesc intr-o expresie combinata
+_UNCOMBINABLE = re.compile(r"\(\?|\\\d")
+
+
+def trie_regex(words: Iterable[str]) -> str:
+    """
+    Regex care gaseste oricare dintre `words` (literal), cu ramurile
+    factorizate dupa prefixul comun: ["abc", "abd", "x"] -> (?:ab[cd]|x).
+    Un cuvant care e prefixul altuia il face pe cel lung inutil la cautare.
+    """
+    return _trie_regex((word, "") for word in words)
+
+
+def _split_literal(regex: str):
+    """(prefix literal, restul regex-ului): '/tag-1/.*x' -> ('/tag-1/', '.*x')."""
+    i = 0
+    while i < len(regex) and regex[i] not in _META:
+        i += 1
+    if i < len(regex) and regex[i] in _QUANTIFIERS and i:
+        i -= 1  # 'ab?' : cuantificatorul se aplica ultimului caracter
+    return regex[:i], regex[i:]
+
+
+def _trie_regex(items) -> str:
+    """trie_regex pentru perechi (prefix literal, rest regex deja valid)."""
+    trie: dict = {}
+    for prefix, tail in items:
+        node = trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault("", set()).add(tail)
+    if not trie:
+        return ""
+
+    def build(node: dict) -> str:
+        tails = node.get("", ())
+        if "" in tails:
+            return ""  # un pattern se termina aici: restul ramurii nu mai conteaza
+        singles, branches = [], []
+        for ch in sorted(k for k in node if k):
+            rest = build(node[ch])
+            if rest:
+                branches.append(re.escape(ch) + rest)
+            else:
+                singles.append(re.escape(ch))
+        if singles:
+            branches.append(singles[0] if len(singles) == 1 else "[" + "".join(singles) + "]")
+        branches.extend(f"(?:{tail})" for tail in sorted(tails))
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+def _standalone(regex: str) -> bool:
+    """Restul unui pattern poate sta singur (nu incepe cu un cuantificator)."""
+    if regex[:1] in _QUANTIFIERS:
+        return False
+    try:
+        re.compile(regex)
+    except re.error:
+        return False
+    return True
+
+
+def _compile_trie(items, separate: list, search: bool):
+    """
+    Expresia combinata pentru perechile (prefix, rest) sau None. Daca totusi
+    nu se compileaza, fiecare pattern ajunge in `separate`, cu aceeasi semantica.
+    """
+    if not items:
+        return None
+    try:
+        return re.compile(_trie_regex(items))
+    except re.error as e:
+        logger.debug("Pattern-uri de excludere necombinabile (%s), potrivite separat", e)
+    lead = ".*" if search else ""  # re.search(X) == re.match(.*X)
+    separate.extend(re.compile(lead + re.escape(prefix) + tail) for prefix, tail in items)
+    return None
+
+
+class ExcludeMatcher:
+    """
+    Args:
+        patterns: pattern-urile de excludere (cu sau fara '*')
+        extensions: extensii excluse ('.pdf', '.zip', ...)
+    """
+
+    def __init__(self, patterns: Iterable[str] = (), extensions: Iterable[str] = ()):
+        anchored, floating, separate = [], [], []
+        for pattern in patterns:
+            if "*" not in pattern:
+                floating.append((pattern, ""))
+                continue
+            regex = pattern.replace("*", ".*")
+            try:
+                re.compile(regex)
+            except re.error as e:
+                logger.warning("Pattern de excludere invalid ignorat %r: %s", pattern, e)
+                continue
+            if _UNCOMBINABLE.search(regex):
+                separate.append(re.compile(regex))
+                continue
+            if "|" in regex:
+                anchored.append(("", regex))  # alternanta: fara rescriere
+                continue
+            while regex.endswith(".*") and not regex.endswith("\\.*"):
+                regex = regex[:-2]
+            if regex.startswith(".*") and _standalone(regex[2:]):
+                floating.append(_split_literal(regex[2:]))
+            elif regex.startswith(".*"):
+                anchored.append(("", regex))  # '.*?x', '.*+x': fara rescriere
+            else:
+                anchored.append(_split_literal(regex))
+
+        self._anchored = _compile_trie(anchored, separate, search=False)
+        self._floating = _compile_trie(floating, separate, search=True)
+        self._separate = separate  # (regex compilat, potrivit cu re.match)
+
+        self._extensions = frozenset(ext.lower() for ext in extensions)
+        # cate puncte are cea mai lunga extensie ('.tar.gz' -> 2)
+        self._ext_dots = max((ext.count(".") for ext in self._extensions), default=0)
+
+    # ------------------------------------------------------------------ #
+    def matches_pattern(self, path: str) -> bool:
+        if self._anchored is not None and self._anchored.match(path):
+            return True
+        if self._floating is not None and self._floating.search(path):
+            return True
+        return any(regex.match(path) for regex in self._separate)
+
+    def has_excluded_extension(self, path: str) -> bool:
+        if not self._extensions:
+            return False
+        path = path.lower()
+        end = len(path)
+        for _ in range(self._ext_dots):
+            dot = path.rfind(".", 0, end)
+            if dot < 0:
+                return False
+            if path[dot:] in self._extensions:
+                return True
+            end = dot
+        return False
+
+    def excluded(self, path: str) -> bool:
+        """True daca path-ul unui URL nu trebuie scanat."""
+        return self.matches_pattern(path) or self.has_excluded_extension(path)